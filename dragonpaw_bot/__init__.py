@@ -0,0 +1,4 @@
+import time
+
+#: When the package was first imported; startup time is measured from here.
+STARTED_AT = time.monotonic()
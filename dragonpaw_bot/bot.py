@@ -2,6 +2,7 @@
 import asyncio
 import contextlib
 import datetime
+import time
 from os import environ
 from pathlib import Path
 from typing import Any
@@ -14,14 +15,16 @@ import uvloop
 import yaml
 
 import dragonpaw_bot.plugins as _plugins
-from dragonpaw_bot import buttons, structs
+from dragonpaw_bot import STARTED_AT, buttons, debug, metrics, profiling, structs
 from dragonpaw_bot.context import (
     GuildContext,
     NotAuthorized,
     actor_name,
     guild_owner_only,
+    invalidate_perms,
 )
 from dragonpaw_bot.logging import configure_logging
+from dragonpaw_bot.loop_monitor import monitor as loop_monitor
 from dragonpaw_bot.plugins.activity import INTERACTION_HANDLERS as activity_handlers
 from dragonpaw_bot.plugins.birthdays import INTERACTION_HANDLERS as birthday_handlers
 from dragonpaw_bot.plugins.birthdays import MODAL_HANDLERS as birthday_modal_handlers
@@ -41,7 +44,13 @@ from dragonpaw_bot.plugins.tickets import config as tickets_config
 from dragonpaw_bot.plugins.validation import INTERACTION_HANDLERS as validation_handlers
 from dragonpaw_bot.plugins.validation import MODAL_HANDLERS as validation_modal_handlers
 from dragonpaw_bot.plugins.validation import config as validation_config
-from dragonpaw_bot.utils import InteractionHandler, ModalHandler
+from dragonpaw_bot.rest_scheduler import Priority, scheduler
+from dragonpaw_bot.utils import (
+    InteractionHandler,
+    ModalHandler,
+    invalidate_emojis,
+    update_guild_emojis,
+)
 
 configure_logging()
 logger = structlog.get_logger(__name__)
@@ -113,6 +122,12 @@ INTENTS = (
     | hikari.Intents.DM_MESSAGES
 )
 
+#: Serve Prometheus metrics on localhost at this port; unset keeps it off.
+METRICS_PORT = int(environ["METRICS_PORT"]) if environ.get("METRICS_PORT") else None
+#: Time from process start to the first gateway connection we're aiming for;
+#: slower starts are logged as warnings. See scripts/import_profile.py.
+STARTUP_TARGET_SECONDS = 5.0
+
 if "TEST_GUILDS" in environ:
     TEST_GUILDS = [int(x) for x in environ["TEST_GUILDS"].split(",")]
 else:
@@ -175,11 +190,32 @@ async def auto_defer(pl: lightbulb.ExecutionPipeline, ctx: lightbulb.Context) ->
         await ctx.defer(ephemeral=True)
 
 
+# Open command invocations, keyed by interaction id, holding the scheduler's
+# interactive mark so background REST work yields until the command finishes.
+_interactive_commands: dict[hikari.Snowflake, contextlib.ExitStack] = {}
+
+
+@lightbulb.hook(lightbulb.ExecutionSteps.PRE_INVOKE, skip_when_failed=True)
+def hold_interactive(_: lightbulb.ExecutionPipeline, ctx: lightbulb.Context) -> None:
+    """Mark a command as in flight so cron REST calls step aside for it."""
+    stack = contextlib.ExitStack()
+    stack.enter_context(scheduler.busy(Priority.INTERACTIVE))
+    _interactive_commands[ctx.interaction.id] = stack
+
+
+@lightbulb.hook(lightbulb.ExecutionSteps.POST_INVOKE)
+def release_interactive(_: lightbulb.ExecutionPipeline, ctx: lightbulb.Context) -> None:
+    """Runs even when the command failed, so the interactive mark never leaks."""
+    stack = _interactive_commands.pop(ctx.interaction.id, None)
+    if stack is not None:
+        stack.close()
+
+
 bot = DragonpawBot()
 client = lightbulb.client_from_app(
     bot,
     default_enabled_guilds=TEST_GUILDS,
-    hooks=[auto_defer],
+    hooks=[auto_defer, hold_interactive, release_interactive],
 )
 
 
@@ -269,10 +305,27 @@ def state_load_yaml(guild_id: hikari.Snowflake) -> structs.GuildState | None:
 # ---------------------------------------------------------------------------- #
 
 
+def _record_startup() -> None:
+    """Log how long the first gateway connect took; reconnects are ignored."""
+    if metrics.startup_seconds.value():
+        return
+    seconds = time.monotonic() - STARTED_AT
+    metrics.startup_seconds.set(seconds)
+    if seconds > STARTUP_TARGET_SECONDS:
+        logger.warning(
+            "Slow startup",
+            seconds=round(seconds, 2),
+            target=STARTUP_TARGET_SECONDS,
+        )
+    else:
+        logger.info("Startup time", seconds=round(seconds, 2))
+
+
 @bot.listen(hikari.ShardReadyEvent)
 async def on_ready(event: hikari.ShardReadyEvent) -> None:
     """Post-initialization for the bot."""
     logger.info("Connected to Discord", user=str(event.my_user), build=BUILD_TAG)
+    _record_startup()
     logger.info(
         "OAuth URL",
         url=OAUTH_URL.format(CLIENT_ID=CLIENT_ID, OAUTH_PERMISSIONS=OAUTH_PERMISSIONS),
@@ -316,6 +369,9 @@ _BLOCKED_GUILDS = {915486296883990528}
 
 @bot.listen(hikari.GuildAvailableEvent)
 async def on_guild_available(event: hikari.GuildAvailableEvent):
+    # Events may have been missed while the guild was unavailable.
+    invalidate_perms(event.guild_id)
+    invalidate_emojis(event.guild_id)
     if int(event.guild_id) in _BLOCKED_GUILDS:
         logger.warning(
             "In blocked guild, leaving",
@@ -333,6 +389,32 @@ async def on_guild_available(event: hikari.GuildAvailableEvent):
         logger.info("No state found, nothing to do", guild=name)
 
 
+@bot.listen(hikari.RoleCreateEvent, hikari.RoleUpdateEvent, hikari.RoleDeleteEvent)
+async def on_role_change(
+    event: hikari.RoleCreateEvent | hikari.RoleUpdateEvent | hikari.RoleDeleteEvent,
+) -> None:
+    invalidate_perms(event.guild_id)
+
+
+@bot.listen(hikari.GuildChannelUpdateEvent, hikari.GuildChannelDeleteEvent)
+async def on_channel_change(
+    event: hikari.GuildChannelUpdateEvent | hikari.GuildChannelDeleteEvent,
+) -> None:
+    invalidate_perms(event.guild_id, event.channel_id)
+
+
+@bot.listen(hikari.EmojisUpdateEvent)
+async def on_emojis_update(event: hikari.EmojisUpdateEvent) -> None:
+    update_guild_emojis(event.guild_id, event.emojis)
+
+
+@bot.listen(hikari.MemberUpdateEvent)
+async def on_member_update(event: hikari.MemberUpdateEvent) -> None:
+    # Only the bot's own roles feed its cached permissions.
+    if event.user_id == bot.user_id:
+        invalidate_perms(event.guild_id)
+
+
 @bot.listen(hikari.GuildJoinEvent)
 async def on_guild_join(event: hikari.GuildJoinEvent):
     guild = await bot.rest.fetch_guild(guild=event.guild_id)
@@ -377,6 +459,7 @@ _tickets_sub = _config_group.subgroup("tickets", "Help ticket settings")
 _validation_sub = _config_group.subgroup("validation", "Member validation settings")
 _journal_sub = _config_group.subgroup("journal", "Member journal settings")
 _buttons_sub = _config_group.subgroup("buttons", "Feature button channel settings")
+_debug_sub = _config_group.subgroup("debug", "Bot diagnostics (bot owners only)")
 
 
 class SetLogChannel(
@@ -473,7 +556,7 @@ class SetGeneralChannel(
             await gc.log(f"⚙️ **{actor}** cleared the general chat channel 🐉")
 
 
-from dragonpaw_bot.plugins.activity import config as activity_config  # noqa: E402
+from dragonpaw_bot.plugins.activity import config as activity_config
 
 _activity_sub = _config_group.subgroup("activity", "Activity tracker settings")
 
@@ -490,6 +573,7 @@ validation_config.register(_validation_sub)
 journal_config.register(_journal_sub)
 activity_config.register(_activity_sub)
 buttons.register(_buttons_sub)
+debug.register(_debug_sub)
 loader.command(_config_group)
 
 
@@ -546,7 +630,11 @@ async def on_component_interaction(event: hikari.InteractionCreateEvent) -> None
         if cid.startswith(prefix):
             structlog.contextvars.bind_contextvars(plugin=plugin_name)
             try:
-                await handler(interaction)  # type: ignore[arg-type]
+                with (
+                    scheduler.busy(Priority.INTERACTIVE),
+                    metrics.interaction_seconds.time(plugin=plugin_name, kind=kind),
+                ):
+                    await handler(interaction)  # type: ignore[arg-type]
             except Exception:
                 logger.exception("Error handling interaction")
                 await _respond_interaction_error(interaction)
@@ -562,6 +650,14 @@ async def on_starting(_: hikari.StartingEvent) -> None:
     await client.load_extensions_from_package(_plugins, recursive=True)
     await client.start()
 
+    # Everything is subscribed and the REST session exists by now.
+    metrics.instrument_listeners(bot.event_manager)
+    metrics.instrument_rest(bot.rest)
+    loop_monitor.start()
+    profiling.install_signal_handler(asyncio.get_running_loop())
+    if METRICS_PORT is not None:
+        await metrics.start_server(METRICS_PORT)
+
     # Log all registered cron tasks
     for task in sorted(client._tasks, key=lambda t: getattr(t._func, "__name__", "")):
         closure = getattr(task._trigger, "__closure__", None)
@@ -575,3 +671,9 @@ async def on_starting(_: hikari.StartingEvent) -> None:
             task=getattr(task._func, "__name__", repr(task)),
             schedule=schedule,
         )
+
+
+@bot.listen(hikari.StoppingEvent)
+async def on_stopping(_: hikari.StoppingEvent) -> None:
+    await loop_monitor.stop()
+    await metrics.stop_server()
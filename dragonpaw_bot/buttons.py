@@ -22,6 +22,7 @@ from dragonpaw_bot.context import (
     CHANNEL_CLEANUP_PERMS,
     ChannelContext,
     GuildContext,
+    OutgoingMessage,
     actor_name,
     guild_owner_only,
 )
@@ -77,7 +78,10 @@ def _channel_context(gc: GuildContext, channel_id: hikari.Snowflake) -> ChannelC
 
 
 async def post_buttons(gc: GuildContext) -> list[str]:
-    """Wipe the guild's button channel and repost every available card.
+    """Bring the guild's button channel up to date with every available card.
+
+    Only cards that changed since the last post are edited; see
+    ``ChannelContext.publish``.
 
     Returns human-readable warnings for the admin; empty means all went well.
     """
@@ -107,22 +111,16 @@ async def post_buttons(gc: GuildContext) -> list[str]:
         entries=[e.key for e in entries],
     )
 
+    if entries:
+        messages = [
+            OutgoingMessage(embed=_build_embed(entry), component=_build_row(entry))
+            for entry in entries
+        ]
+    else:
+        messages = [OutgoingMessage(content=_EMPTY_NOTE)]
+
     try:
-        await cc.delete_my_messages()
-
-        if not entries:
-            await gc.bot.rest.create_message(channel=channel_id, content=_EMPTY_NOTE)
-            return [
-                "None of my button-having features are configured yet, so there's "
-                "nothing to post."
-            ]
-
-        for entry in entries:
-            await gc.bot.rest.create_message(
-                channel=channel_id,
-                embed=_build_embed(entry),
-                component=_build_row(entry),
-            )
+        state.button_messages = await cc.publish(messages, state.button_messages)
     except hikari.HTTPError as exc:
         gc.logger.exception("Failed to post button channel", channel=cc.channel_name)
         await gc.log(
@@ -130,7 +128,13 @@ async def post_buttons(gc: GuildContext) -> list[str]:
             "and tripped over something — check the bot logs! 🐉"
         )
         return [f"I hit an error posting to <#{channel_id}>: {exc}"]
+    gc.bot.state_update(state)
 
+    if not entries:
+        return [
+            "None of my button-having features are configured yet, so there's "
+            "nothing to post."
+        ]
     return []
 
 
@@ -174,7 +178,9 @@ class ButtonsChannel(
 
         if self.channel is None:
             old_channel_id = state.button_channel_id
+            oldest_id = min((p.message_id for p in state.button_messages), default=None)
             state.button_channel_id = None
+            state.button_messages = []
             gc.bot.state_update(state)
             gc.logger.info("Cleared button channel")
             await ctx.respond(
@@ -183,13 +189,15 @@ class ButtonsChannel(
             if old_channel_id:
                 cc = _channel_context(gc, old_channel_id)
                 with contextlib.suppress(hikari.HTTPError):
-                    await cc.delete_my_messages()
+                    await cc.delete_my_messages(oldest_id)
             await gc.log(
                 f"🧹 **{actor}** put away my button channel — I've tidied up after "
                 "myself! 🐾"
             )
             return
 
+        if state.button_channel_id != self.channel.id:
+            state.button_messages = []
         state.button_channel_id = self.channel.id
         gc.bot.state_update(state)
         gc.logger.info("Set button channel", channel=self.channel.name)
@@ -1,5 +1,4 @@
 import hikari
-import palettable
 
 SOLARIZED_BASE03 = hikari.Color.from_hex_code("#002b36")
 SOLARIZED_BASE02 = hikari.Color.from_hex_code("#073642")
@@ -26,5 +25,9 @@ def rainbow(n: int) -> list[tuple[int, int, int]]:
     # end = 2 / 3
     # as_float = [colorsys.hls_to_rgb(end * i / (n - 1), 0.5, 1) for i in range(n)]
     # return [(int(x[0] * 255), int(x[1] * 255), int(x[2] * 255)) for x in as_float]
+    # Imported here: palettable loads every colormap it ships, which startup
+    # doesn't need.
+    import palettable  # noqa: PLC0415
+
     # palettable maps start at 2 colors — slice down for a single-item request
     return palettable.mycarta.get_map(COLORS.format(max(n, 2))).colors[:n]
@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import dataclasses
+import hashlib
+import json
+import time
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import hikari
 import lightbulb
 import structlog
 
 from dragonpaw_bot import journal
+from dragonpaw_bot.duration import format_duration
+from dragonpaw_bot.rest_scheduler import scheduler
+from dragonpaw_bot.structs import PostedMessage, PurgeMarks
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Sequence
+
     from dragonpaw_bot.bot import DragonpawBot
     from dragonpaw_bot.structs import GuildState
 
@@ -324,6 +334,46 @@ class GuildContext:
         return False
 
 
+# ---------------------------------------------------------------------------- #
+#                             Published messages                               #
+# ---------------------------------------------------------------------------- #
+
+#: How far back publish() looks to check its messages are still in place.
+_PUBLISH_CHECK_LIMIT = 100
+
+
+def _embed_payload(embed: hikari.Embed) -> dict[str, Any]:
+    """The parts of an embed the bot sets, in a stable, hashable shape."""
+    return {
+        "title": embed.title,
+        "description": embed.description,
+        "url": embed.url,
+        "color": int(embed.color) if embed.color is not None else None,
+        "footer": embed.footer.text if embed.footer else None,
+        "image": embed.image.url if embed.image else None,
+        "thumbnail": embed.thumbnail.url if embed.thumbnail else None,
+        "fields": [(f.name, f.value, f.is_inline) for f in embed.fields],
+    }
+
+
+@dataclasses.dataclass(frozen=True)
+class OutgoingMessage:
+    """A message the bot keeps posted in a channel it manages."""
+
+    content: str | None = None
+    embed: hikari.Embed | None = None
+    component: hikari.api.ComponentBuilder | None = None
+
+    def digest(self) -> str:
+        payload = {
+            "content": self.content,
+            "embed": _embed_payload(self.embed) if self.embed else None,
+            "component": self.component.build()[0] if self.component else None,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+
 # ---------------------------------------------------------------------------- #
 #                               ChannelContext                                  #
 # ---------------------------------------------------------------------------- #
@@ -369,111 +419,122 @@ class ChannelContext(GuildContext):
             f"please grant me **Manage Messages** there and I'll get back to tidying! 🐉"
         )
 
+    async def _expired_messages(
+        self, start: datetime | hikari.Snowflake, marks: PurgeMarks
+    ) -> AsyncIterator[hikari.Message]:
+        """Messages older than start, skipping history a previous run cleared."""
+        floor = marks.last_scanned_id
+        async for msg in self.bot.rest.fetch_messages(
+            channel=self.channel_id, before=start
+        ):
+            if floor is not None and msg.id <= floor:
+                break
+            yield msg
+
+        if marks.oldest_surviving_id is not None:
+            async for msg in self.bot.rest.fetch_messages(
+                channel=self.channel_id,
+                before=hikari.Snowflake(marks.oldest_surviving_id + 1),
+            ):
+                yield msg
+
     async def purge_old_messages(
-        self, expiry_minutes: int, single_delete_limit: int = 1000
+        self,
+        expiry_minutes: int,
+        single_delete_limit: int | None = None,
+        marks: PurgeMarks | None = None,
+        checkpoint: Callable[[], None] | None = None,
     ) -> int:
         """Delete messages older than expiry_minutes from this channel.
 
-        Bulk-deletes where possible (< 14 days), single-deletes for older messages
-        (capped at single_delete_limit per call — remainder picked up next run).
-        Hikari handles rate limiting automatically. Returns count of deleted messages.
+        Streams as it pages: bulk-deletes where possible (< 14 days) every
+        BULK_DELETE_BATCH ids, and queues older messages on the channel's
+        persisted backlog, which drains at single_delete_limit deletes per call
+        (SINGLE_DELETES_PER_RUN unless given), so a huge backlog is worked off
+        steadily over many runs without its history being fetched again.
+        Hikari handles rate limiting automatically. Returns count of messages
+        deleted (bulk ones as sent).
+
+        `marks` is the channel's persisted scan position and backlog, advanced
+        in place as deletes land; `checkpoint` is called every so often to
+        persist them, so an interrupted run resumes where it stopped.
 
         Note: fetch_messages silently yields nothing when the bot lacks READ_MESSAGE_HISTORY
         or VIEW_CHANNEL — it does NOT raise ForbiddenError. Callers must check permissions
         proactively (e.g. via check_perms) rather than relying on exception handling here.
         """
-        now = datetime.now(UTC)
-        cutoff = now - timedelta(minutes=expiry_minutes)
-        bulk_cutoff = now - timedelta(days=14)
-        to_bulk: list[hikari.Snowflake] = []
-        to_single: list[tuple[hikari.Snowflake, datetime]] = []
+        run = _PurgeRun(
+            cc=self,
+            marks=marks if marks is not None else PurgeMarks(),
+            expiry_minutes=expiry_minutes,
+            single_delete_limit=(
+                SINGLE_DELETES_PER_RUN
+                if single_delete_limit is None
+                else single_delete_limit
+            ),
+            checkpoint=checkpoint,
+        )
+        return await run.run()
 
+    async def _bulk_delete(
+        self, message_ids: list[hikari.Snowflake], *, report: bool = True
+    ) -> bool:
+        """Bulk-delete up to 100 messages. Returns False if Discord refused.
+
+        `report=False` skips asking the guild for Manage Messages, for callers
+        that can fall back to deleting one at a time.
+        """
         try:
-            async for msg in self.bot.rest.fetch_messages(
-                channel=self.channel_id, before=cutoff
-            ):
-                if msg.is_pinned:
-                    continue
-                if msg.created_at > bulk_cutoff:
-                    to_bulk.append(msg.id)
-                else:
-                    to_single.append((msg.id, msg.created_at))
+            async with scheduler.slot(f"delete_messages:{self.channel_id}"):
+                await self.bot.rest.delete_messages(self.channel_id, message_ids)
         except (hikari.ForbiddenError, hikari.NotFoundError) as exc:
             self.logger.warning(
-                "Cannot fetch messages for cleanup",
+                "Bulk delete failed",
                 channel=self.channel_name,
                 error=str(exc),
             )
-            await self.log(
-                f"⚠️ I can't read messages in **#{self.channel_name}** for cleanup. "
-                f"Please grant me **Read Message History** and **View Channel** permissions in that channel."
-            )
-            return 0
-
-        for i in range(0, len(to_bulk), 100):
-            try:
-                await self.bot.rest.delete_messages(
-                    self.channel_id, to_bulk[i : i + 100]
-                )
-            except (hikari.ForbiddenError, hikari.NotFoundError) as exc:
-                self.logger.warning(
-                    "Bulk delete failed",
-                    channel=self.channel_name,
-                    error=str(exc),
-                )
+            if report:
                 await self._log_missing_manage_messages()
-                break
-
-        to_single = to_single[:single_delete_limit]
+            return False
+        return True
 
-        for idx, (msg_id, _) in enumerate(to_single):
-            if idx > 0 and idx % 10 == 0:
-                self.logger.debug(
-                    "Single-deleting old messages, progress",
-                    channel=self.channel_name,
-                    deleted_so_far=idx,
-                    total=len(to_single),
-                )
-            try:
+    async def _single_delete(self, message_id: hikari.Snowflake) -> bool:
+        """Delete one message (for > 14 days old). Returns False if Discord refused."""
+        try:
+            async with scheduler.slot(f"delete_message:{self.channel_id}"):
                 await self.bot.rest.delete_message(
-                    channel=self.channel_id, message=msg_id
-                )
-            except hikari.NotFoundError:
-                pass  # Already gone
-            except hikari.ForbiddenError as exc:
-                self.logger.warning(
-                    "Single delete failed, stopping",
-                    channel=self.channel_name,
-                    error=str(exc),
+                    channel=self.channel_id, message=message_id
                 )
-                await self._log_missing_manage_messages()
-                break
-
-        if to_single:
-            oldest_age_days = (now - to_single[-1][1]).days
-            self.logger.debug(
-                "Single-delete complete",
+        except hikari.NotFoundError:
+            pass  # Already gone
+        except hikari.ForbiddenError as exc:
+            self.logger.warning(
+                "Single delete failed, stopping",
                 channel=self.channel_name,
-                count=len(to_single),
-                oldest_days=oldest_age_days,
+                error=str(exc),
             )
+            await self._log_missing_manage_messages()
+            return False
+        return True
 
-        return len(to_bulk) + len(to_single)
-
-    async def purge_old_threads(self, expiry_minutes: int) -> int:
+    async def purge_old_threads(
+        self, expiry_minutes: int, threads: GuildThreads | None = None
+    ) -> int:
         """Delete threads in this channel whose last activity is older than expiry_minutes.
 
         Checks both active threads (filtered to this channel) and archived public threads.
         Last activity is taken from last_message_id.created_at, falling back to thread
         creation time when no messages exist. Returns count of deleted threads.
+
+        Pass the guild's `threads` listing when cleaning several channels in one
+        run so the guild-wide active-thread fetch is shared between them.
         """
-        now = datetime.now(UTC)
-        cutoff = now - timedelta(minutes=expiry_minutes)
-        threads: list[hikari.GuildThreadChannel] = []
+        if threads is None:
+            threads = GuildThreads(self.bot, self.guild_id)
+        cutoff = datetime.now(UTC) - timedelta(minutes=expiry_minutes)
 
         try:
-            active = await self.bot.rest.fetch_active_threads(self.guild_id)
-            threads.extend(t for t in active if t.parent_id == self.channel_id)
+            active = await threads.active(self.channel_id)
         except (hikari.ForbiddenError, hikari.NotFoundError) as exc:
             self.logger.warning(
                 "Cannot fetch active threads for cleanup",
@@ -481,34 +542,35 @@ class ChannelContext(GuildContext):
                 error=str(exc),
             )
             return 0
+        stale = [
+            (thread.id, thread.name)
+            for thread in active
+            if _last_activity(thread) < cutoff
+        ]
 
         try:
-            threads.extend(
-                [
-                    thread
-                    async for thread in self.bot.rest.fetch_public_archived_threads(
-                        self.channel_id
-                    )
-                ]
-            )
+            archived = await threads.archived(self.channel_id)
         except (hikari.ForbiddenError, hikari.NotFoundError) as exc:
             self.logger.warning(
                 "Cannot fetch archived threads for cleanup",
                 channel=self.channel_name,
                 error=str(exc),
             )
+        else:
+            active_ids = {thread.id for thread in active}
+            for thread_id in active_ids & archived.keys():
+                del archived[thread_id]  # Unarchived since we last saw it
+            stale.extend(
+                (thread_id, name)
+                for thread_id, (name, last_activity) in archived.items()
+                if last_activity < cutoff
+            )
 
         deleted = 0
-        for thread in threads:
-            last_activity = (
-                thread.last_message_id.created_at
-                if thread.last_message_id is not None
-                else thread.created_at
-            )
-            if last_activity >= cutoff:
-                continue
+        for thread_id, name in stale:
             try:
-                await self.bot.rest.delete_channel(thread.id)
+                async with scheduler.slot(f"delete_thread:{self.guild_id}"):
+                    await self.bot.rest.delete_channel(thread_id)
                 deleted += 1
             except hikari.NotFoundError:
                 deleted += 1  # Already gone — count it as done
@@ -516,7 +578,7 @@ class ChannelContext(GuildContext):
                 self.logger.warning(
                     "Cannot delete thread, stopping",
                     channel=self.channel_name,
-                    thread=thread.name,
+                    thread=name,
                     error=str(exc),
                 )
                 await self.log(
@@ -524,6 +586,7 @@ class ChannelContext(GuildContext):
                     f"Please grant me **Manage Threads** permission in that channel."
                 )
                 break
+            threads.forget_archived(self.channel_id, thread_id)
 
         if deleted:
             self.logger.info(
@@ -532,18 +595,146 @@ class ChannelContext(GuildContext):
 
         return deleted
 
-    async def delete_my_messages(self) -> None:
-        """Delete all bot messages from this channel."""
+    async def delete_my_messages(self, oldest_id: int | None = None) -> int:
+        """Delete all bot messages from this channel. Returns how many went.
+
+        Messages under 14 days old go in bulk deletes of up to
+        BULK_DELETE_BATCH; older ones one at a time. `oldest_id` is the oldest
+        message the bot is known to have posted here: paging stops below it
+        instead of walking the rest of the channel's history.
+
+        Bulk deletes need Manage Messages, but the bot can always delete its
+        own messages singly; if a bulk delete is refused, the rest go one at
+        a time.
+        """
         self.logger.debug(
             "Checking for old messages in channel", channel_id=self.channel_id
         )
         assert self.bot.user_id
+        started = time.monotonic()
+        bulk_cutoff = datetime.now(UTC) - timedelta(days=14)
+        batch: list[hikari.Snowflake] = []
+        singles: list[hikari.Snowflake] = []
+        deleted = 0
+        can_bulk = True
+
+        async def flush() -> None:
+            nonlocal batch, deleted, can_bulk
+            if await self._bulk_delete(batch, report=False):
+                deleted += len(batch)
+            else:
+                can_bulk = False
+                singles.extend(batch)
+            batch = []
+
         async for message in self.bot.rest.fetch_messages(channel=self.channel_id):
+            if oldest_id is not None and message.id < oldest_id:
+                break
+            if message.author.id != self.bot.user_id:
+                continue
+            if can_bulk and message.created_at > bulk_cutoff:
+                batch.append(message.id)
+                if len(batch) == BULK_DELETE_BATCH:
+                    await flush()
+            else:
+                singles.append(message.id)
+
+        if batch:
+            await flush()
+        for message_id in singles:
+            if not await self._single_delete(message_id):
+                break
+            deleted += 1
+
+        self.logger.info(
+            "Deleted my messages",
+            channel=self.channel_name,
+            count=deleted,
+            seconds=round(time.monotonic() - started, 1),
+        )
+        return deleted
+
+    async def _posted_in_place(self, posted: Sequence[PostedMessage]) -> bool:
+        """Whether the bot's recent messages here are exactly `posted`."""
+        assert self.bot.user_id
+        mine: set[int] = set()
+        async for message in self.bot.rest.fetch_messages(self.channel_id).limit(
+            _PUBLISH_CHECK_LIMIT
+        ):
             if message.author.id == self.bot.user_id:
-                self.logger.debug("Deleting my message", message_id=message.id)
-                await message.delete()
+                mine.add(int(message.id))
+        return mine == {p.message_id for p in posted}
 
-    async def run_cleanup_isolated(self, expiry_minutes: int) -> None:
+    async def publish(
+        self,
+        messages: Sequence[OutgoingMessage],
+        posted: Sequence[PostedMessage],
+    ) -> list[PostedMessage]:
+        """Make this channel show `messages`, touching only what changed.
+
+        `posted` is what the last publish returned. Messages whose digest is
+        unchanged are left alone, changed ones are edited in place, and only a
+        change in count creates or deletes any. If the channel no longer holds
+        what was posted (or nothing was recorded), it is wiped and reposted.
+        Returns the records to keep for next time.
+        """
+        oldest_id = min((p.message_id for p in posted), default=None)
+        if posted and not await self._posted_in_place(posted):
+            self.logger.info(
+                "Published messages out of place, reposting",
+                channel=self.channel_name,
+            )
+            posted = []
+        if not posted:
+            # Nothing of ours predates what the last publish put up.
+            await self.delete_my_messages(oldest_id)
+
+        result: list[PostedMessage] = []
+        writes = 0
+        for index, message in enumerate(messages):
+            digest = message.digest()
+            if index < len(posted):
+                message_id = posted[index].message_id
+                if posted[index].digest != digest:
+                    await self.bot.rest.edit_message(
+                        self.channel_id,
+                        message_id,
+                        content=message.content,
+                        embed=message.embed,
+                        component=message.component,
+                    )
+                    writes += 1
+            else:
+                sent = await self.bot.rest.create_message(
+                    self.channel_id,
+                    content=message.content or hikari.UNDEFINED,
+                    embed=message.embed or hikari.UNDEFINED,
+                    component=message.component or hikari.UNDEFINED,
+                )
+                message_id = int(sent.id)
+                writes += 1
+            result.append(PostedMessage(message_id=message_id, digest=digest))
+
+        for extra in posted[len(messages) :]:
+            with contextlib.suppress(hikari.NotFoundError):
+                await self.bot.rest.delete_message(self.channel_id, extra.message_id)
+            writes += 1
+
+        self.logger.info(
+            "Published channel messages",
+            channel=self.channel_name,
+            messages=len(messages),
+            writes=writes,
+        )
+        return result
+
+    async def run_cleanup_isolated(
+        self,
+        expiry_minutes: int,
+        marks: PurgeMarks | None = None,
+        checkpoint: Callable[[], None] | None = None,
+        threads: GuildThreads | None = None,
+    ) -> None:
         """run_cleanup, but swallowing (and logging) anything it raises.
 
         `run_cleanup` already catches purge errors internally; this wrapper exists
@@ -551,19 +742,27 @@ class ChannelContext(GuildContext):
         channel has been deleted) doesn't vanish into asyncio.gather's result list.
         """
         try:
-            await self.run_cleanup(expiry_minutes)
+            await self.run_cleanup(expiry_minutes, marks, checkpoint, threads)
         except Exception:
             self.logger.exception(
                 "Unhandled cleanup error",
                 channel=self.channel_name,
             )
 
-    async def run_cleanup(self, expiry_minutes: int) -> None:
+    async def run_cleanup(
+        self,
+        expiry_minutes: int,
+        marks: PurgeMarks | None = None,
+        checkpoint: Callable[[], None] | None = None,
+        threads: GuildThreads | None = None,
+    ) -> None:
         """Check permissions then purge old messages and threads, logging any issues to the guild log channel.
 
         Combines the proactive permission check with purge_old_messages and
         purge_old_threads with error handling. Use this from cron tasks instead
-        of calling purge methods directly.
+        of calling purge methods directly. `marks` is the channel's persisted
+        scan position, advanced in place and saved through `checkpoint`;
+        `threads` is the guild's thread listing shared across the run.
         """
         missing = await self.check_perms(CHANNEL_CLEANUP_PERMS)
         if missing:
@@ -578,7 +777,9 @@ class ChannelContext(GuildContext):
             )
             return
         try:
-            deleted = await self.purge_old_messages(expiry_minutes)
+            deleted = await self.purge_old_messages(
+                expiry_minutes, marks=marks, checkpoint=checkpoint
+            )
             if deleted:
                 self.logger.info(
                     "Purged old messages",
@@ -594,7 +795,7 @@ class ChannelContext(GuildContext):
                 f"🐛 I hit an unexpected error cleaning **#{self.channel_name}** — check the bot logs."
             )
         try:
-            await self.purge_old_threads(expiry_minutes)
+            await self.purge_old_threads(expiry_minutes, threads)
         except Exception:
             self.logger.exception(
                 "Thread cleanup cron error",
@@ -613,6 +814,384 @@ class ChannelContext(GuildContext):
         )
 
 
+#: Discord's cap on ids per bulk-delete call.
+BULK_DELETE_BATCH = 100
+#: Old messages single-deleted per channel per cleanup run: the backlog's drain rate.
+SINGLE_DELETES_PER_RUN = 1000
+#: Old ids a channel may have queued for single deletion; paging pauses when full
+#: and picks up from PurgeMarks.oldest_surviving_id once the backlog drains. The
+#: backlog is saved in the guild's state file, so this stays about one run's worth.
+MAX_BACKLOG = 1000
+#: Deletes between checkpoint saves of a channel's purge marks.
+CHECKPOINT_EVERY = 100
+#: Least time between checkpoint saves of one guild's state during a cleanup run.
+CHECKPOINT_MIN_SECONDS = 30.0
+#: Both cleanup crons run hourly, which is what backlog ETAs are quoted against.
+CLEANUP_RUN_MINUTES = 60
+
+
+def throttled_checkpoint(
+    save: Callable[[], None],
+    min_seconds: float = CHECKPOINT_MIN_SECONDS,
+    clock: Callable[[], float] = time.monotonic,
+) -> Callable[[], None]:
+    """Wrap a guild's checkpoint save so it runs at most once per `min_seconds`.
+
+    The guild's state file holds every channel's marks and is written on the
+    loop; with channels cleaned concurrently, each would otherwise rewrite it
+    every CHECKPOINT_EVERY deletes. The save after the run catches anything a
+    skipped checkpoint missed.
+    """
+    last = clock()
+
+    def checkpoint() -> None:
+        nonlocal last
+        now = clock()
+        if now - last >= min_seconds:
+            last = now
+            save()
+
+    return checkpoint
+
+
+class _PurgeRun:
+    """One streaming pass of ChannelContext.purge_old_messages.
+
+    The pager bulk-deletes recent messages as it goes and appends older ones to
+    the channel's persisted backlog; a worker single-deletes from the head of
+    that backlog, up to the per-run limit, while paging carries on. The worker
+    advances an index rather than popping, and the done ids are cut from the
+    list in one go before each checkpoint and at the end. Queued ids
+    count as handled for the cursor, so history is never fetched twice.
+    In fetch order every bulk-eligible message comes before every single, so
+    the pending bulk batch is flushed before the first single is queued and
+    the cursor only ever moves downwards.
+    """
+
+    def __init__(
+        self,
+        *,
+        cc: ChannelContext,
+        marks: PurgeMarks,
+        expiry_minutes: int,
+        single_delete_limit: int,
+        checkpoint: Callable[[], None] | None,
+    ) -> None:
+        self.cc = cc
+        self.marks = marks
+        self.single_delete_limit = single_delete_limit
+        self.checkpoint = checkpoint
+        now = datetime.now(UTC)
+        self.cutoff = now - timedelta(minutes=expiry_minutes)
+        self.bulk_cutoff = now - timedelta(days=14)
+        # An interrupted run is finished first, against its original cutoff.
+        self.run_cutoff_id = marks.run_cutoff_id or int(
+            hikari.Snowflake.from_datetime(self.cutoff)
+        )
+        # A restart can re-page the tail of a window; don't queue its ids twice.
+        self.queued = set(marks.backlog)
+        self.backlog_grew = asyncio.Event()
+        self.paging_done = False
+        self.refused = False
+        self.since_checkpoint = 0
+        # Backlog ids at the head the worker has already deleted.
+        self.drained = 0
+
+    async def run(self) -> int:
+        had_backlog = bool(self.marks.backlog)
+        worker = asyncio.create_task(self._drain_backlog())
+        try:
+            bulk, paged = await self._page()
+        finally:
+            self.paging_done = True
+            self.backlog_grew.set()
+            singles = await worker
+
+        if paged:
+            self.marks.last_scanned_id = self.run_cutoff_id
+            self.marks.run_cutoff_id = None
+            self.marks.cursor_id = None
+        # Only backlogs that outlast a run are worth a guild log line; a few
+        # old messages cleared in the same hour they were queued are routine.
+        pending = self.marks.backlog or self.marks.oldest_surviving_id is not None
+        if pending and singles:
+            await self._report_backlog()
+        elif had_backlog and not pending:
+            await self.cc.log(
+                f"✨ *happy crunch* Finished nomming the old backlog in "
+                f"**#{self.cc.channel_name}** — all caught up! 🐉"
+            )
+        return bulk + singles
+
+    async def _page(self) -> tuple[int, bool]:
+        """Walk expired history. Returns (bulk-deleted, whether the walk finished)."""
+        cc = self.cc
+        marks = self.marks
+        start = (
+            hikari.Snowflake(marks.cursor_id)
+            if marks.cursor_id is not None
+            else self.cutoff
+        )
+        batch: list[hikari.Snowflake] = []
+        dispatched = 0
+        try:
+            async for msg in cc._expired_messages(start, marks):
+                if self.refused:
+                    return dispatched, False
+                if msg.is_pinned:
+                    continue
+                if msg.created_at > self.bulk_cutoff:
+                    batch.append(msg.id)
+                    dispatched += 1
+                    if len(batch) == BULK_DELETE_BATCH:
+                        await self._flush(batch)
+                        batch = []
+                    continue
+                if batch:
+                    await self._flush(batch)
+                    batch = []
+                if len(marks.backlog) - self.drained >= MAX_BACKLOG:
+                    # Resume below here once the worker has made room.
+                    marks.oldest_surviving_id = int(msg.id)
+                    return dispatched, not self.refused
+                if msg.id not in self.queued:
+                    self.queued.add(msg.id)
+                    marks.backlog.append(int(msg.id))
+                    self.backlog_grew.set()
+                self._advance(msg.id, 0)
+        except (hikari.ForbiddenError, hikari.NotFoundError) as exc:
+            cc.logger.warning(
+                "Cannot fetch messages for cleanup",
+                channel=cc.channel_name,
+                error=str(exc),
+            )
+            await cc.log(
+                f"⚠️ I can't read messages in **#{cc.channel_name}** for cleanup. "
+                f"Please grant me **Read Message History** and **View Channel** permissions in that channel."
+            )
+            return dispatched, False
+        if batch and not self.refused:
+            await self._flush(batch)
+        if self.refused:
+            return dispatched, False
+        marks.oldest_surviving_id = None
+        return dispatched, True
+
+    async def _flush(self, batch: list[hikari.Snowflake]) -> None:
+        if await self.cc._bulk_delete(batch):
+            self._advance(batch[-1], len(batch))
+        else:
+            self.refused = True
+
+    async def _drain_backlog(self) -> int:
+        """Worker: single-delete from the backlog head until the run's limit.
+
+        Waits for the pager while the backlog is empty, and stops on the first
+        refusal, leaving the rest of the backlog for a later run.
+        """
+        backlog = self.marks.backlog
+        deleted = 0
+        while deleted < self.single_delete_limit and not self.refused:
+            if self.drained == len(backlog):
+                if self.paging_done:
+                    break
+                self.backlog_grew.clear()
+                await self.backlog_grew.wait()
+                continue
+            msg_id = hikari.Snowflake(backlog[self.drained])
+            if not await self.cc._single_delete(msg_id):
+                self.refused = True
+                break
+            self.drained += 1
+            self.queued.discard(msg_id)
+            deleted += 1
+            self._advance(None, 1)
+            if deleted % 100 == 0:
+                self.cc.logger.debug(
+                    "Single-deleting old messages, progress",
+                    channel=self.cc.channel_name,
+                    deleted_so_far=deleted,
+                )
+        self._trim_backlog()
+        if deleted:
+            self.cc.logger.debug(
+                "Single-delete complete",
+                channel=self.cc.channel_name,
+                count=deleted,
+                backlog=len(backlog),
+            )
+        return deleted
+
+    def _advance(self, message_id: hikari.Snowflake | None, count: int) -> None:
+        """Record that everything down to message_id has been deleted or queued."""
+        marks = self.marks
+        if message_id is not None:
+            if marks.last_scanned_id is None or message_id > marks.last_scanned_id:
+                marks.run_cutoff_id = self.run_cutoff_id
+                marks.cursor_id = int(message_id)
+            else:
+                # Below the cleared range: paging an old run's unqueued leftovers.
+                marks.oldest_surviving_id = int(message_id) - 1
+        self.since_checkpoint += count
+        if self.checkpoint is not None and self.since_checkpoint >= CHECKPOINT_EVERY:
+            self.since_checkpoint = 0
+            self._trim_backlog()
+            self.checkpoint()
+
+    def _trim_backlog(self) -> None:
+        """Drop the ids the worker has deleted from the head of the backlog."""
+        if self.drained:
+            del self.marks.backlog[: self.drained]
+            self.drained = 0
+
+    async def _report_backlog(self) -> None:
+        cc = self.cc
+        remaining = len(self.marks.backlog)
+        runs = -(-max(remaining, 1) // self.single_delete_limit)
+        more = (
+            " (plus older history I haven't reached yet)"
+            if self.marks.oldest_surviving_id is not None
+            else ""
+        )
+        await cc.log(
+            f"🐢 *patient chomping* **#{cc.channel_name}** still has **{remaining}** "
+            f"message(s) older than 14 days queued{more}. Discord makes me nom those "
+            f"one at a time — about **{format_duration(runs * CLEANUP_RUN_MINUTES)}** "
+            f"to go at {self.single_delete_limit} an hour."
+        )
+
+
+# ---------------------------------------------------------------------------- #
+#                              Thread listings                                 #
+# ---------------------------------------------------------------------------- #
+
+#: Archived threads paged per channel per pass; the rest wait for a later run.
+ARCHIVED_THREAD_SCAN_LIMIT = 200
+
+
+def _last_activity(thread: hikari.GuildThreadChannel) -> datetime:
+    if thread.last_message_id is not None:
+        return thread.last_message_id.created_at
+    return thread.created_at
+
+
+@dataclasses.dataclass
+class _ArchivedThreadCache:
+    """What earlier cleanup runs learned about one channel's archived threads.
+
+    An archived thread can't gain messages without being unarchived, so its
+    last activity is fixed: a run only pages threads archived after
+    `covered_after`, plus one capped pass through the oldest of `gaps` left
+    behind when a scan hit ARCHIVED_THREAD_SCAN_LIMIT.
+    """
+
+    #: Thread id → (name, last activity).
+    threads: dict[hikari.Snowflake, tuple[str, datetime]] = dataclasses.field(
+        default_factory=dict
+    )
+    covered_after: datetime | None = None
+    #: (before, after) archive-time ranges still to page, oldest first.
+    gaps: list[tuple[datetime, datetime | None]] = dataclasses.field(
+        default_factory=list
+    )
+
+
+#: Channel id → archived-thread cache, kept for the life of the process.
+_archived_threads: dict[hikari.Snowflake, _ArchivedThreadCache] = {}
+
+
+class GuildThreads:
+    """Thread listings for one guild's cleanup run, shared by its channels.
+
+    `fetch_active_threads` is guild-wide, so the first channel to ask fetches
+    it and the rest await the same task. Archived threads are per channel and
+    come from the process-wide cache, topped up with only what's new.
+    """
+
+    def __init__(self, bot: DragonpawBot, guild_id: hikari.Snowflake) -> None:
+        self.bot = bot
+        self.guild_id = guild_id
+        self._active: (
+            asyncio.Task[dict[hikari.Snowflake, list[hikari.GuildThreadChannel]]] | None
+        ) = None
+
+    async def active(
+        self, channel_id: hikari.Snowflake
+    ) -> list[hikari.GuildThreadChannel]:
+        """Active threads whose parent is channel_id."""
+        if self._active is None:
+            self._active = asyncio.ensure_future(self._fetch_active())
+        return (await self._active).get(channel_id, [])
+
+    async def _fetch_active(
+        self,
+    ) -> dict[hikari.Snowflake, list[hikari.GuildThreadChannel]]:
+        by_parent: dict[hikari.Snowflake, list[hikari.GuildThreadChannel]] = {}
+        for thread in await self.bot.rest.fetch_active_threads(self.guild_id):
+            by_parent.setdefault(thread.parent_id, []).append(thread)
+        return by_parent
+
+    async def archived(
+        self, channel_id: hikari.Snowflake
+    ) -> dict[hikari.Snowflake, tuple[str, datetime]]:
+        """Known archived threads in channel_id, after paging any new ones.
+
+        Returns the cache's own mapping; callers may drop entries from it.
+        """
+        cache = _archived_threads.setdefault(channel_id, _ArchivedThreadCache())
+        newest, capped_at = await self._scan(
+            channel_id, cache, before=None, after=cache.covered_after
+        )
+        if capped_at is not None:
+            cache.gaps.append((capped_at, cache.covered_after))
+        if newest is not None:
+            cache.covered_after = newest
+        if cache.gaps:
+            before, after = cache.gaps.pop(0)
+            _, capped_at = await self._scan(
+                channel_id, cache, before=before, after=after
+            )
+            if capped_at is not None:
+                cache.gaps.insert(0, (capped_at, after))
+        return cache.threads
+
+    async def _scan(
+        self,
+        channel_id: hikari.Snowflake,
+        cache: _ArchivedThreadCache,
+        *,
+        before: datetime | None,
+        after: datetime | None,
+    ) -> tuple[datetime | None, datetime | None]:
+        """Page archived threads newest-first between before and after.
+
+        Returns (newest archive time seen, where the scan was capped or None).
+        """
+        newest: datetime | None = None
+        seen = 0
+        async for thread in self.bot.rest.fetch_public_archived_threads(
+            channel_id, before=before if before is not None else hikari.UNDEFINED
+        ):
+            archived_at = thread.metadata.archive_timestamp
+            if after is not None and archived_at <= after:
+                break
+            if newest is None:
+                newest = archived_at
+            cache.threads[thread.id] = (thread.name or "", _last_activity(thread))
+            seen += 1
+            if seen == ARCHIVED_THREAD_SCAN_LIMIT:
+                return newest, archived_at
+        return newest, None
+
+    def forget_archived(
+        self, channel_id: hikari.Snowflake, thread_id: hikari.Snowflake
+    ) -> None:
+        """Drop a deleted thread from the archived cache."""
+        cache = _archived_threads.get(channel_id)
+        if cache is not None:
+            cache.threads.pop(thread_id, None)
+
+
 # ---------------------------------------------------------------------------- #
 #                           Permission helpers                                 #
 # ---------------------------------------------------------------------------- #
@@ -680,25 +1259,74 @@ CHANNEL_CLEANUP_PERMS: dict[hikari.Permissions, str] = {
 }
 
 
-async def check_guild_perms(
-    bot: DragonpawBot,
-    guild_id: hikari.Snowflake,
-    required: dict[hikari.Permissions, str],
-) -> list[str]:
-    """Return missing permission names for the bot at the guild level (no channel context)."""
+@dataclasses.dataclass(frozen=True)
+class _BotGuildPerms:
+    """The bot's role-derived permissions in a guild, before channel overwrites."""
+
+    member_id: hikari.Snowflake
+    role_ids: frozenset[hikari.Snowflake]
+    permissions: hikari.Permissions
+    top_position: int
+
+
+# Computed from the hikari cache and dropped by the role / channel / member
+# update listeners in bot.py, so the hot checks below are dict lookups.
+_guild_perms: dict[hikari.Snowflake, _BotGuildPerms] = {}
+_channel_perms: dict[tuple[hikari.Snowflake, hikari.Snowflake], hikari.Permissions] = {}
+
+
+def invalidate_perms(
+    guild_id: hikari.Snowflake, channel_id: hikari.Snowflake | None = None
+) -> None:
+    """Forget cached bot permissions for a channel, or for a whole guild."""
+    if channel_id is not None:
+        _channel_perms.pop((guild_id, channel_id), None)
+        return
+    _guild_perms.pop(guild_id, None)
+    for key in [key for key in _channel_perms if key[0] == guild_id]:
+        del _channel_perms[key]
+
+
+async def _bot_guild_perms(
+    bot: DragonpawBot, guild_id: hikari.Snowflake
+) -> _BotGuildPerms:
+    cached = _guild_perms.get(guild_id)
+    if cached is not None:
+        return cached
+
     assert bot.user_id
     me = bot.cache.get_member(guild_id, bot.user_id) or await bot.rest.fetch_member(
         guild_id, bot.user_id
     )
-    role_map = dict(bot.cache.get_roles_view_for_guild(guild_id))
+    role_map = bot.cache.get_roles_view_for_guild(guild_id)
 
+    # Start with @everyone permissions, then add the member's roles
     everyone_role = role_map.get(guild_id)
     perms = everyone_role.permissions if everyone_role else hikari.Permissions.NONE
+    top = 0
     for role_id in me.role_ids:
         role = role_map.get(role_id)
         if role:
             perms |= role.permissions
+            top = max(top, role.position)
+
+    result = _BotGuildPerms(
+        member_id=me.id,
+        role_ids=frozenset(me.role_ids),
+        permissions=perms,
+        top_position=top,
+    )
+    _guild_perms[guild_id] = result
+    return result
+
 
+async def check_guild_perms(
+    bot: DragonpawBot,
+    guild_id: hikari.Snowflake,
+    required: dict[hikari.Permissions, str],
+) -> list[str]:
+    """Return missing permission names for the bot at the guild level (no channel context)."""
+    perms = (await _bot_guild_perms(bot, guild_id)).permissions
     if perms & hikari.Permissions.ADMINISTRATOR:
         return []
 
@@ -712,104 +1340,87 @@ async def check_channel_perms(
     required: dict[hikari.Permissions, str] | None = None,
 ) -> list[str]:
     """Return a list of missing permission names for the bot in the given channel."""
-    logger.debug(
-        "Checking bot permissions in channel",
-        channel_id=channel_id,
-        guild_id=guild_id,
-    )
-    assert bot.user_id
-    me = bot.cache.get_member(guild_id, bot.user_id) or await bot.rest.fetch_member(
-        guild_id, bot.user_id
-    )
-    role_map = dict(bot.cache.get_roles_view_for_guild(guild_id))
-
-    # Start with @everyone permissions
-    everyone_role = role_map.get(guild_id)
-    perms = everyone_role.permissions if everyone_role else hikari.Permissions.NONE
-
-    # Add permissions from member's roles
-    for role_id in me.role_ids:
-        role = role_map.get(role_id)
-        if role:
-            perms |= role.permissions
-
-    # Administrator bypasses everything
-    if perms & hikari.Permissions.ADMINISTRATOR:
-        return []
-
-    # Apply channel permission overwrites
-    try:
-        channel = await bot.rest.fetch_channel(channel_id)
-    except hikari.ForbiddenError:
-        logger.warning(
-            "Cannot fetch channel — bot lacks View Channel permission",
+    check = required or CHANNEL_POST_PERMS
+    perms = _channel_perms.get((guild_id, channel_id))
+    if perms is None:
+        logger.debug(
+            "Computing bot permissions in channel",
             channel_id=channel_id,
             guild_id=guild_id,
         )
-        return ["View Channel (cannot access channel)"]
-    except hikari.NotFoundError:
-        logger.warning(
-            "Channel no longer exists", channel_id=channel_id, guild_id=guild_id
-        )
-        return ["Channel not found (may have been deleted)"]
-    if isinstance(channel, hikari.PermissibleGuildChannel):
-        overwrites = channel.permission_overwrites
-        # @everyone overwrite
-        if guild_id in overwrites:
-            ow = overwrites[guild_id]
-            perms &= ~ow.deny
-            perms |= ow.allow
-        # Role overwrites
-        allow = hikari.Permissions.NONE
-        deny = hikari.Permissions.NONE
-        for role_id in me.role_ids:
-            if role_id in overwrites:
-                ow = overwrites[role_id]
-                allow |= ow.allow
-                deny |= ow.deny
-        perms &= ~deny
-        perms |= allow
-        # Member-specific overwrite
-        if me.id in overwrites:
-            ow = overwrites[me.id]
-            perms &= ~ow.deny
-            perms |= ow.allow
+        base = await _bot_guild_perms(bot, guild_id)
+        # Administrator bypasses everything
+        if base.permissions & hikari.Permissions.ADMINISTRATOR:
+            return []
 
-    check = required or CHANNEL_POST_PERMS
-    missing = []
-    for perm, label in check.items():
-        if not (perms & perm):
-            missing.append(label)
-    return missing
+        channel = bot.cache.get_guild_channel(channel_id)
+        if not isinstance(channel, hikari.PermissibleGuildChannel):
+            try:
+                channel = await bot.rest.fetch_channel(channel_id)
+            except hikari.ForbiddenError:
+                logger.warning(
+                    "Cannot fetch channel — bot lacks View Channel permission",
+                    channel_id=channel_id,
+                    guild_id=guild_id,
+                )
+                return ["View Channel (cannot access channel)"]
+            except hikari.NotFoundError:
+                logger.warning(
+                    "Channel no longer exists", channel_id=channel_id, guild_id=guild_id
+                )
+                return ["Channel not found (may have been deleted)"]
+        perms = _apply_overwrites(base, guild_id, channel)
+        _channel_perms[guild_id, channel_id] = perms
+
+    return [label for perm, label in check.items() if not (perms & perm)]
+
+
+def _apply_overwrites(
+    base: _BotGuildPerms, guild_id: hikari.Snowflake, channel: hikari.PartialChannel
+) -> hikari.Permissions:
+    """Fold a channel's permission overwrites onto the bot's guild permissions."""
+    perms = base.permissions
+    if not isinstance(channel, hikari.PermissibleGuildChannel):
+        return perms
+    overwrites = channel.permission_overwrites
+    # @everyone overwrite
+    if guild_id in overwrites:
+        ow = overwrites[guild_id]
+        perms &= ~ow.deny
+        perms |= ow.allow
+    # Role overwrites
+    allow = hikari.Permissions.NONE
+    deny = hikari.Permissions.NONE
+    for role_id in base.role_ids:
+        if role_id in overwrites:
+            ow = overwrites[role_id]
+            allow |= ow.allow
+            deny |= ow.deny
+    perms &= ~deny
+    perms |= allow
+    # Member-specific overwrite
+    if base.member_id in overwrites:
+        ow = overwrites[base.member_id]
+        perms &= ~ow.deny
+        perms |= ow.allow
+    return perms
 
 
 async def check_role_manageable(
     bot: DragonpawBot, guild_id: hikari.Snowflake, role: hikari.Role
 ) -> str | None:
     """Return a reason string if the bot cannot manage the given role, or None if OK."""
-    assert bot.user_id
-    me = bot.cache.get_member(guild_id, bot.user_id) or await bot.rest.fetch_member(
-        guild_id, bot.user_id
-    )
-    role_map = dict(bot.cache.get_roles_view_for_guild(guild_id))
+    base = await _bot_guild_perms(bot, guild_id)
 
     # Check Manage Roles permission
-    perms = hikari.Permissions.NONE
-    for rid in me.role_ids:
-        r = role_map.get(rid)
-        if r:
-            perms |= r.permissions
     if not (
-        perms & (hikari.Permissions.ADMINISTRATOR | hikari.Permissions.MANAGE_ROLES)
+        base.permissions
+        & (hikari.Permissions.ADMINISTRATOR | hikari.Permissions.MANAGE_ROLES)
     ):
         return "I don't have **Manage Roles** permission."
 
     # Check role hierarchy
-    my_top = max(
-        (role_map[rid].position for rid in me.role_ids if rid in role_map),
-        default=0,
-    )
-    if role.position >= my_top:
+    if role.position >= base.top_position:
         return (
             f"My highest role is below **{role.name}** in the role hierarchy — "
             f"please move my role above it in Server Settings → Roles."
@@ -857,3 +1468,29 @@ def guild_owner_only(_: lightbulb.ExecutionPipeline, ctx: lightbulb.Context) ->
     """Hook: restricts a command to members with MANAGE_GUILD (or ADMINISTRATOR)."""
     if not is_guild_admin(ctx.member):
         raise NotAuthorized
+
+
+# Whoever owns the bot's application: its owner, or every member of its team.
+# Looked up once; ownership changes need a restart.
+_bot_owner_ids: set[int] = set()
+
+
+async def bot_owner_ids(app: hikari.RESTAware) -> set[int]:
+    if not _bot_owner_ids:
+        application = await app.rest.fetch_application()
+        _bot_owner_ids.add(int(application.owner.id))
+        if application.team is not None:
+            _bot_owner_ids.update(int(uid) for uid in application.team.members)
+    return _bot_owner_ids
+
+
+@lightbulb.hook(
+    lightbulb.ExecutionSteps.CHECKS, skip_when_failed=True, name="bot_owner_only"
+)
+async def bot_owner_only(
+    _: lightbulb.ExecutionPipeline, ctx: lightbulb.Context
+) -> None:
+    """Hook: restricts a command to the bot's owners, for process-wide controls
+    that no single guild's admins should hold."""
+    if int(ctx.user.id) not in await bot_owner_ids(ctx.client.app):
+        raise NotAuthorized
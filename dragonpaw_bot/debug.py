@@ -0,0 +1,125 @@
+"""`/config debug`: process-wide diagnostics for the bot's owners.
+
+These act on the whole bot rather than one guild, so they're gated on owning
+the bot application, not on a guild admin permission.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import hikari
+import lightbulb
+import structlog
+
+from dragonpaw_bot import logging as bot_logging
+from dragonpaw_bot import profiling
+from dragonpaw_bot.context import GuildContext, actor_name, bot_owner_only
+from dragonpaw_bot.utils import create_background_task
+
+logger = structlog.get_logger(__name__)
+
+#: Room left for the header line in a log-channel post (Discord caps at 2000).
+_SUMMARY_CHARS = 1800
+
+
+def _clip_summary(summary: str) -> str:
+    """The summary's leading lines that fit in one Discord message."""
+    lines: list[str] = []
+    used = 0
+    for line in summary.splitlines():
+        used += len(line) + 1
+        if used > _SUMMARY_CHARS:
+            lines.append("…")
+            break
+        lines.append(line)
+    return "\n".join(lines)
+
+
+async def _finish_profile(
+    gc: GuildContext, run: profiling.ProfileRun, seconds: int, actor: str
+) -> None:
+    await asyncio.sleep(seconds)
+    result = await profiling.stop(run=run)
+    if result is None:
+        return  # Stopped early by SIGUSR1, which logged it.
+    await gc.log(
+        f"🔬 **{actor}** profiled me for {seconds}s — full results in "
+        f"`{result.stem.name}.*`:\n```\n{_clip_summary(result.summary)}\n```"
+    )
+
+
+class DebugProfile(
+    lightbulb.SlashCommand,
+    name="profile",
+    description="Profile the whole bot's CPU and memory for a while.",
+    hooks=[bot_owner_only],
+):
+    seconds = lightbulb.integer(
+        "seconds",
+        "How long to profile for",
+        default=30,
+        min_value=profiling.MIN_SECONDS,
+        max_value=profiling.MAX_SECONDS,
+    )
+
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context) -> None:
+        if not ctx.guild_id:
+            logger.error("Interaction without a guild")
+            return
+
+        gc = GuildContext.from_ctx(ctx)
+        actor = actor_name(ctx)
+        try:
+            run = profiling.start(f"/config debug profile by {actor}")
+        except profiling.ProfilerBusy as exc:
+            await ctx.respond(f"⚠️ {exc}.", flags=hikari.MessageFlag.EPHEMERAL)
+            return
+
+        # Finish in the background: an open command holds the REST scheduler's
+        # interactive mark, which would stall the cron work being profiled.
+        create_background_task(_finish_profile(gc, run, self.seconds, actor))
+        await ctx.respond(
+            f"🔬 Profiling for {self.seconds}s. The summary goes to the log "
+            f"channel and the full results to `{profiling.PROFILE_DIR}`.",
+            flags=hikari.MessageFlag.EPHEMERAL,
+        )
+
+
+class DebugLogLevel(
+    lightbulb.SlashCommand,
+    name="loglevel",
+    description="Change a logger's level until the next restart.",
+    hooks=[bot_owner_only],
+):
+    level = lightbulb.string(
+        "level",
+        "New level (NOTSET follows the parent logger)",
+        choices=[lightbulb.Choice(name=lvl, value=lvl) for lvl in bot_logging.LEVELS],
+    )
+    logger_name = lightbulb.string(
+        "logger",
+        "Logger name, e.g. dragonpaw_bot.plugins.activity",
+        default=bot_logging.BOT_LOGGER,
+    )
+
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context) -> None:
+        before, after = bot_logging.set_level(self.logger_name, self.level)
+        logger.info(
+            "Changed log level",
+            target=self.logger_name,
+            level=self.level,
+            effective=after,
+            by=actor_name(ctx),
+        )
+        await ctx.respond(
+            f"📝 `{self.logger_name}` now logs at **{after}** (was {before}).",
+            flags=hikari.MessageFlag.EPHEMERAL,
+        )
+
+
+def register(subgroup: lightbulb.SubGroup) -> None:
+    subgroup.register(DebugProfile)
+    subgroup.register(DebugLogLevel)
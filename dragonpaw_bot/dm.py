@@ -0,0 +1,359 @@
+"""Batched DM sending for the crons that message many members at once.
+
+The SubDay and birthday crons used to DM one person at a time with a fixed
+`sleep(1)` after each send, so a big guild's Sunday run took many minutes.
+A `DMBatch` queues sends instead and runs them on a small pool, paced by a
+token bucket shared across every batch in the process: Discord rate-limits
+DMs per bot rather than per guild, and punishes bots that open many new DMs
+in a burst. Transient failures are retried with backoff; closed DMs are not.
+When the batch's block exits it waits for every send and logs a report.
+
+Every DM goes through `send()`, which remembers each user's DM channel id on
+disk so recurring DMs skip the create-DM-channel round-trip.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import datetime
+import enum
+import random
+import time
+from typing import TYPE_CHECKING, Any, Self
+
+import hikari
+import pydantic
+import safer
+import structlog
+import yaml
+
+from dragonpaw_bot.rest_scheduler import scheduler
+from dragonpaw_bot.state_store import DEFAULT_STATE_DIR
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+    from types import TracebackType
+
+logger = structlog.get_logger(__name__)
+
+#: DMs one batch sends at once.
+DM_CONCURRENCY = 4
+#: Sustained DMs per second across all batches.
+DM_RATE = 2.0
+#: DMs that may go out back-to-back before the rate applies.
+DM_BURST = 5
+#: Tries per recipient before a transient failure is given up on.
+MAX_ATTEMPTS = 3
+#: First retry delay; doubles on each further attempt, plus jitter.
+BACKOFF_SECONDS = 2.0
+#: How long a remembered DM channel is trusted. DM channels don't change, so
+#: this mostly ages out people the bot no longer messages.
+DM_CHANNEL_TTL = datetime.timedelta(days=90)
+
+
+# ---------------------------------------------------------------------------- #
+#                               DM channel cache                               #
+# ---------------------------------------------------------------------------- #
+
+
+class _CachedChannel(pydantic.BaseModel):
+    channel_id: int
+    cached_at: datetime.datetime
+
+
+class _ChannelFile(pydantic.BaseModel):
+    channels: dict[int, _CachedChannel] = pydantic.Field(default_factory=dict)
+
+
+class DMChannelCache:
+    """User id → DM channel id, loaded on first use and saved by `flush()`."""
+
+    def __init__(self, name: str = "dm_channels") -> None:
+        self.name = name
+        self.state_dir = DEFAULT_STATE_DIR
+        self._channels: dict[int, _CachedChannel] | None = None
+        self._dirty = False
+
+    def path(self) -> Path:
+        return self.state_dir / f"{self.name}.yaml"
+
+    def _load(self) -> dict[int, _CachedChannel]:
+        if self._channels is None:
+            self._channels = {}
+            path = self.path()
+            if path.exists():
+                try:
+                    with open(path) as f:
+                        data = yaml.safe_load(f)
+                    if data:
+                        self._channels = _ChannelFile.model_validate(data).channels
+                except (OSError, yaml.YAMLError, pydantic.ValidationError):
+                    # Only a cache: start over rather than stop DMs working.
+                    logger.exception("Failed to read DM channel cache", path=str(path))
+        return self._channels
+
+    def get(self, user_id: int) -> int | None:
+        entry = self._load().get(user_id)
+        if entry is None:
+            return None
+        if datetime.datetime.now(datetime.UTC) - entry.cached_at > DM_CHANNEL_TTL:
+            self.forget(user_id)
+            return None
+        return entry.channel_id
+
+    def put(self, user_id: int, channel_id: int) -> None:
+        self._load()[user_id] = _CachedChannel(
+            channel_id=channel_id, cached_at=datetime.datetime.now(datetime.UTC)
+        )
+        self._dirty = True
+
+    def forget(self, user_id: int) -> None:
+        if self._load().pop(user_id, None) is not None:
+            self._dirty = True
+
+    def clear(self) -> None:
+        """Drop the in-memory copy; the next use reloads from disk."""
+        self._channels = None
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Write the cache out if anything changed since the last flush."""
+        if not self._dirty or self._channels is None:
+            return
+        path = self.path()
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            with safer.open(path, "w") as f:
+                yaml.dump(
+                    _ChannelFile(channels=self._channels).model_dump(mode="json"),
+                    f,
+                    default_flow_style=False,
+                )
+        except Exception:
+            logger.exception("FAILED to save DM channel cache", path=str(path))
+            raise
+        self._dirty = False
+
+
+channels = DMChannelCache()
+
+
+async def _send(
+    app: hikari.RESTAware,
+    user: hikari.SnowflakeishOr[hikari.PartialUser],
+    kwargs: dict[str, Any],
+) -> hikari.Message:
+    user_id = int(user)
+    channel_id = channels.get(user_id)
+    if channel_id is not None:
+        try:
+            return await app.rest.create_message(channel_id, **kwargs)
+        except hikari.NotFoundError:
+            # The channel's gone; fall through and look it up afresh.
+            channels.forget(user_id)
+        except hikari.ForbiddenError:
+            # DMs closed: forget them so a later change of heart starts clean.
+            channels.forget(user_id)
+            raise
+    channel = await app.rest.create_dm_channel(user_id)
+    message = await app.rest.create_message(channel.id, **kwargs)
+    channels.put(user_id, int(channel.id))
+    return message
+
+
+async def send(
+    app: hikari.RESTAware,
+    user: hikari.SnowflakeishOr[hikari.PartialUser],
+    **kwargs: Any,
+) -> hikari.Message:
+    """DM `user` right away; `kwargs` go to `create_message()`."""
+    try:
+        return await _send(app, user, kwargs)
+    finally:
+        channels.flush()
+
+
+# ---------------------------------------------------------------------------- #
+#                                 Batched DMs                                  #
+# ---------------------------------------------------------------------------- #
+
+
+class DMOutcome(enum.StrEnum):
+    SENT = "sent"
+    FORBIDDEN = "forbidden"
+    FAILED = "failed"
+
+
+@dataclasses.dataclass
+class DMReport:
+    """What a batch got through, filled in as its sends finish."""
+
+    label: str
+    sent: int = 0
+    forbidden: int = 0
+    failed: int = 0
+    retries: int = 0
+    seconds: float = 0.0
+
+    @property
+    def undelivered(self) -> int:
+        return self.forbidden + self.failed
+
+    def record(self, outcome: DMOutcome) -> None:
+        match outcome:
+            case DMOutcome.SENT:
+                self.sent += 1
+            case DMOutcome.FORBIDDEN:
+                self.forbidden += 1
+            case DMOutcome.FAILED:
+                self.failed += 1
+
+
+class TokenBucket:
+    """Paces callers to `rate` per second after an initial `burst`.
+
+    Each `take()` reserves a token even if the bucket is empty and sleeps off
+    its own deficit, so waiters leave in arrival order without a lock.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+
+    async def take(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+#: Shared by every batch: the limits being respected are per bot.
+pacer = TokenBucket(DM_RATE, DM_BURST)
+
+
+def _retry_delay(attempt: int, exc: Exception) -> float:
+    delay = BACKOFF_SECONDS * 2 ** (attempt - 1)
+    if isinstance(exc, hikari.RateLimitTooLongError):
+        delay = max(delay, exc.retry_after)
+    return delay + random.uniform(0, BACKOFF_SECONDS)
+
+
+class DMBatch:
+    """Queue DMs with `send()`; leaving the `async with` block waits for them.
+
+    `on_sent` callbacks run as each DM lands, for callers that only follow up
+    on successful deliveries.
+    """
+
+    def __init__(
+        self,
+        app: hikari.RESTAware,
+        label: str,
+        *,
+        concurrency: int = DM_CONCURRENCY,
+        log: structlog.stdlib.BoundLogger | None = None,
+    ) -> None:
+        self.app = app
+        self.report = DMReport(label)
+        self.log = (log or logger).bind(batch=label)
+        self._pool = asyncio.Semaphore(concurrency)
+        self._tasks: list[asyncio.Task[DMOutcome]] = []
+        self._started = time.monotonic()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.wait()
+
+    def send(
+        self,
+        user: hikari.SnowflakeishOr[hikari.PartialUser],
+        *,
+        on_sent: Callable[[], None] | None = None,
+        log: structlog.stdlib.BoundLogger | None = None,
+        **kwargs: Any,
+    ) -> asyncio.Task[DMOutcome]:
+        """Queue a DM to `user`; `kwargs` go to `create_message()`."""
+        user_id = int(user)
+        task = asyncio.create_task(
+            self._deliver(
+                user_id, on_sent, (log or self.log).bind(user_id=user_id), kwargs
+            )
+        )
+        self._tasks.append(task)
+        return task
+
+    async def wait(self) -> DMReport:
+        """Wait for everything queued so far, then log and return the report."""
+        if self._tasks:
+            tasks, self._tasks = self._tasks, []
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                channels.flush()
+            self.report.seconds = round(time.monotonic() - self._started, 1)
+            self.log.info(
+                "DM batch complete",
+                sent=self.report.sent,
+                forbidden=self.report.forbidden,
+                failed=self.report.failed,
+                retries=self.report.retries,
+                seconds=self.report.seconds,
+            )
+        return self.report
+
+    async def _deliver(
+        self,
+        user_id: int,
+        on_sent: Callable[[], None] | None,
+        log: structlog.stdlib.BoundLogger,
+        kwargs: dict[str, Any],
+    ) -> DMOutcome:
+        async with self._pool:
+            outcome = await self._attempt(user_id, log, kwargs)
+        self.report.record(outcome)
+        if outcome is DMOutcome.SENT and on_sent is not None:
+            on_sent()
+        return outcome
+
+    async def _attempt(
+        self,
+        user_id: int,
+        log: structlog.stdlib.BoundLogger,
+        kwargs: dict[str, Any],
+    ) -> DMOutcome:
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            await pacer.take()
+            try:
+                async with scheduler.slot(f"dm:{user_id}"):
+                    await _send(self.app, user_id, kwargs)
+            except hikari.ForbiddenError:
+                log.warning("Cannot DM user (DMs disabled)")
+                return DMOutcome.FORBIDDEN
+            except (hikari.InternalServerError, hikari.RateLimitTooLongError) as exc:
+                if attempt == MAX_ATTEMPTS:
+                    log.warning("Giving up on DM", attempts=attempt, error=str(exc))
+                    return DMOutcome.FAILED
+                delay = _retry_delay(attempt, exc)
+                log.debug("Retrying DM", attempt=attempt, delay=round(delay, 1))
+                self.report.retries += 1
+                await asyncio.sleep(delay)
+            except hikari.HTTPError as exc:
+                log.warning("Failed to DM user", error=str(exc))
+                return DMOutcome.FAILED
+            else:
+                log.debug("Sent DM")
+                return DMOutcome.SENT
+        raise AssertionError("unreachable")
@@ -2,11 +2,29 @@
 
 Call configure_logging() once at startup, before any other imports log.
 All modules then use ``structlog.get_logger()`` directly.
+
+Log calls only run structlog's processor chain (so context variables are
+read on the calling task) and put the record on a queue; stdlib records from
+libraries get their context and timestamp captured the same way. Rendering and the
+write to stdout happen on a listener thread, off the event loop. Set
+``LOG_FORMAT=json`` for one JSON object per line instead of the colored
+console renderer.
+
+The bot's own loggers run at ``LOG_LEVEL`` (INFO unless set); owners can
+change any logger's level at runtime with ``/config debug loglevel``.
+Disabled levels are dropped before any processing, and repeats of a chatty
+debug event are rate-limited by `RateLimiter`.
 """
 
+import atexit
 import io
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import time
+from collections.abc import Callable
 from typing import Any
 
 import structlog
@@ -99,22 +117,208 @@ class GruvboxRenderer:
         return line
 
 
-def configure_logging() -> None:
-    """Configure structlog with colorized dev console output and stdlib bridge."""
+#: Environment variable choosing the renderer: "pretty" (default) or "json".
+LOG_FORMAT_ENV = "LOG_FORMAT"
+#: Environment variable setting the level of the bot's own loggers.
+LOG_LEVEL_ENV = "LOG_LEVEL"
+#: Logger every module of the bot logs under.
+BOT_LOGGER = "dragonpaw_bot"
+#: Levels `/config debug loglevel` accepts; NOTSET defers to the parent logger.
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "NOTSET")
+#: Repeats of one debug event let through per window before the rest are dropped.
+SAMPLE_BURST = 20
+#: Length of a rate-limiting window, in seconds.
+SAMPLE_WINDOW_SECONDS = 10.0
+
+
+# ---------------------------------------------------------------------------- #
+#                                   Sampling                                   #
+# ---------------------------------------------------------------------------- #
+
+
+class _Window:
+    __slots__ = ("seen", "started", "suppressed")
+
+    def __init__(self, started: float) -> None:
+        self.started = started
+        self.seen = 0
+        self.suppressed = 0
+
 
-    shared_processors: list[structlog.types.Processor] = [
-        structlog.contextvars.merge_contextvars,
+class RateLimiter:
+    """structlog processor: at most `burst` of each debug event per window.
+
+    Events are keyed by logger name and message. Past the burst, the rest of
+    the window's repeats are dropped. Once a window has ended, the next debug
+    log call sweeps it away, logging "Similar debug messages suppressed" with
+    the count if any were dropped; an event that recurs before the sweep
+    carries ``suppressed=N`` instead. Warnings and above always pass.
+    """
+
+    def __init__(
+        self,
+        burst: int = SAMPLE_BURST,
+        window_seconds: float = SAMPLE_WINDOW_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.burst = burst
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._windows: dict[tuple[str, str], _Window] = {}
+        self._next_sweep = clock() + window_seconds
+
+    def reset(self) -> None:
+        self._windows.clear()
+
+    def __call__(
+        self, logger: Any, method_name: str, event_dict: dict[str, Any]
+    ) -> dict[str, Any]:
+        if method_name != "debug":
+            return event_dict
+        key = (getattr(logger, "name", ""), str(event_dict.get("event", "")))
+        now = self._clock()
+        if now >= self._next_sweep:
+            self._sweep(now, keep=key)
+        window = self._windows.get(key)
+        if window is None or now - window.started >= self.window_seconds:
+            if window is not None and window.suppressed:
+                event_dict["suppressed"] = window.suppressed
+            window = self._windows[key] = _Window(now)
+        window.seen += 1
+        if window.seen > self.burst:
+            window.suppressed += 1
+            raise structlog.DropEvent
+        return event_dict
+
+    def _sweep(self, now: float, keep: tuple[str, str]) -> None:
+        """Forget ended windows, reporting the ones that dropped anything.
+
+        `keep` is the event being logged: its ended window is left for the
+        caller, which reports it on the event itself.
+        """
+        self._next_sweep = now + self.window_seconds
+        ended = [
+            (key, window)
+            for key, window in self._windows.items()
+            if key != keep and now - window.started >= self.window_seconds
+        ]
+        for key, _ in ended:
+            del self._windows[key]
+        # Logged after the sweep: these go back through this processor.
+        for (name, event), window in ended:
+            if window.suppressed:
+                structlog.get_logger(name).debug(
+                    "Similar debug messages suppressed",
+                    suppressed_event=event,
+                    suppressed=window.suppressed,
+                )
+
+
+rate_limiter = RateLimiter()
+
+
+def set_level(name: str, level: str) -> tuple[str, str]:
+    """Set a logger's level by name; returns its effective level before and after."""
+    level = level.upper()
+    if level not in LEVELS:
+        raise ValueError(f"Unknown log level {level!r}")
+    logger = logging.getLogger(name)
+    before = logging.getLevelName(logger.getEffectiveLevel())
+    logger.setLevel(level)
+    return before, logging.getLevelName(logger.getEffectiveLevel())
+
+
+# ---------------------------------------------------------------------------- #
+#                                 Configuration                                #
+# ---------------------------------------------------------------------------- #
+
+
+#: Processors a stdlib record (hikari, lightbulb, ...) needs run on the thread
+#: that logged it: the bound context and the time belong to the caller.
+_CALLER_PROCESSORS: tuple[structlog.types.Processor, ...] = (
+    structlog.contextvars.merge_contextvars,
+    structlog.processors.TimeStamper(fmt="iso"),
+)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queues records unformatted, leaving the rendering to the listener thread.
+
+    The stock handler formats in ``prepare()``, on the logging thread. Here the
+    record (and structlog's event dict in ``record.msg``) is handed over as is,
+    so anything logged should not be mutated after the call. Stdlib records
+    only get `_CALLER_PROCESSORS` run here, stashed for `_add_caller_fields`.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if not hasattr(record, "_logger"):  # Not from structlog.
+            fields: structlog.types.EventDict = {}
+            for processor in _CALLER_PROCESSORS:
+                fields = processor(None, "", fields)  # type: ignore[assignment]
+            record.caller_fields = fields
+        return record
+
+
+def _add_caller_fields(
+    logger: Any, method_name: str, event_dict: dict[str, Any]
+) -> dict[str, Any]:
+    """Foreign pre-chain step: add what `DeferredQueueHandler` captured."""
+    record = event_dict.get("_record")
+    for key, value in getattr(record, "caller_fields", {}).items():
+        event_dict.setdefault(key, value)
+    return event_dict
+
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def _renderer(log_format: str) -> structlog.types.Processor:
+    if log_format == "json":
+        return structlog.processors.JSONRenderer()
+    return GruvboxRenderer()
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        listener, _listener = _listener, None
+        listener.stop()
+
+
+atexit.register(stop_logging)
+
+
+def configure_logging(
+    log_format: str | None = None, log_level: str | None = None
+) -> None:
+    """Configure structlog with a queued stdlib bridge and the chosen renderer.
+
+    ``log_format`` and ``log_level`` default to the ``LOG_FORMAT`` and
+    ``LOG_LEVEL`` environment variables.
+    """
+    global _listener  # noqa: PLW0603
+    if log_format is None:
+        log_format = os.environ.get(LOG_FORMAT_ENV, "pretty").lower()
+    if log_level is None:
+        log_level = os.environ.get(LOG_LEVEL_ENV, "INFO")
+
+    # Stdlib records get _CALLER_PROCESSORS run in DeferredQueueHandler instead.
+    record_processors: list[structlog.types.Processor] = [
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
     ]
 
     structlog.configure(
         processors=[
-            *shared_processors,
+            # Cheapest first: most debug calls end here.
+            structlog.stdlib.filter_by_level,
+            rate_limiter,
+            *_CALLER_PROCESSORS,
+            *record_processors,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -123,18 +327,25 @@ def configure_logging() -> None:
     )
 
     formatter = structlog.stdlib.ProcessorFormatter(
-        foreign_pre_chain=shared_processors,
+        foreign_pre_chain=[_add_caller_fields, *record_processors],
         processors=[  # type: ignore[arg-type]  # final renderer returns str
             structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-            GruvboxRenderer(),
+            _renderer(log_format),
         ],
     )
 
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
 
+    stop_logging()
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(records, handler)
+    _listener.start()
+
     root = logging.getLogger()
-    root.addHandler(handler)
+    for old in [h for h in root.handlers if isinstance(h, DeferredQueueHandler)]:
+        root.removeHandler(old)
+    root.addHandler(DeferredQueueHandler(records))
     root.setLevel(logging.INFO)
 
-    logging.getLogger("dragonpaw_bot").setLevel(logging.DEBUG)
+    set_level(BOT_LOGGER, log_level)
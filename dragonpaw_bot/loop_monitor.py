@@ -0,0 +1,173 @@
+"""Watchdog for work that blocks the event loop.
+
+Some paths still do synchronous work on the loop (YAML state I/O, Pillow
+charts, emoji tables). A stall long enough starves gateway heartbeats and
+misses Discord's 3-second interaction deadline, with nothing in the logs to
+say why. The monitor has two halves:
+
+- A ticker task sleeps a fixed interval and records how late it woke up.
+  That lag goes into `metrics.loop_lag_seconds`. Rolling percentiles of the
+  recent window are worked out only when the metrics are scraped, into
+  `metrics.loop_lag_quantile`, so the ticker adds almost nothing to the lag
+  it measures.
+- A sampling thread watches the ticker's heartbeat. Once the next tick is
+  `STALL_SECONDS` overdue, it grabs the loop thread's stack and the
+  running task's structlog context and logs them, once per stall, while the
+  culprit is still on the stack.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import sys
+import threading
+import time
+import traceback
+from typing import Any
+
+import structlog
+
+from dragonpaw_bot import metrics
+
+logger = structlog.get_logger(__name__)
+
+#: How often the ticker wakes to measure lag.
+TICK_SECONDS = 0.25
+#: How overdue a tick may be before the stack is captured and logged.
+STALL_SECONDS = 0.5
+#: How often the sampling thread checks the heartbeat.
+POLL_SECONDS = 0.05
+#: Lag samples the rolling percentiles cover (five minutes of ticks).
+WINDOW = 1200
+#: Percentiles exported as gauges.
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+def _task_context(task: asyncio.Task[Any] | None) -> dict[str, Any]:
+    """The structlog contextvars bound in `task`, read from another thread."""
+    if task is None:
+        return {}
+    prefix = structlog.contextvars.STRUCTLOG_KEY_PREFIX
+    # Context.run() can't enter a context the loop thread is inside, but
+    # reading it as a mapping is fine.
+    return {
+        var.name.removeprefix(prefix): value
+        for var, value in task.get_context().items()
+        if var.name.startswith(prefix) and value is not Ellipsis
+    }
+
+
+def _quantile(ordered: list[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class LoopMonitor:
+    """Measures event-loop lag and reports what's running when the loop stalls."""
+
+    def __init__(
+        self,
+        *,
+        tick_seconds: float = TICK_SECONDS,
+        stall_seconds: float = STALL_SECONDS,
+        window: int = WINDOW,
+    ) -> None:
+        self.tick_seconds = tick_seconds
+        self.stall_seconds = stall_seconds
+        self._samples: collections.deque[float] = collections.deque(maxlen=window)
+        self._last_tick = time.monotonic()
+        self._reported_tick: float | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        """Start the ticker and sampling thread; call from the running loop."""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._stopping.clear()
+        self._task = self._loop.create_task(self._tick(), name="loop monitor")
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-monitor", daemon=True
+        )
+        self._thread.start()
+        logger.debug(
+            "Loop monitor started",
+            tick_seconds=self.tick_seconds,
+            stall_seconds=self.stall_seconds,
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        self._stopping.set()
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def record(self, lag: float) -> None:
+        """Add one lag sample."""
+        metrics.loop_lag_seconds.observe(lag)
+        self._samples.append(lag)
+
+    def publish(self) -> None:
+        """Export percentiles of the recent window; run when metrics are rendered."""
+        if not self._samples:
+            return
+        ordered = sorted(self._samples)
+        for q in QUANTILES:
+            metrics.loop_lag_quantile.set(_quantile(ordered, q), quantile=str(q))
+        metrics.loop_lag_quantile.set(ordered[-1], quantile="1")
+
+    async def _tick(self) -> None:
+        while True:
+            due = time.monotonic() + self.tick_seconds
+            await asyncio.sleep(self.tick_seconds)
+            now = time.monotonic()
+            self._last_tick = now
+            self.record(max(0.0, now - due))
+
+    # Everything below runs on the sampling thread.
+
+    def _watch(self) -> None:
+        while not self._stopping.wait(POLL_SECONDS):
+            tick = self._last_tick
+            stalled = time.monotonic() - tick - self.tick_seconds
+            if stalled >= self.stall_seconds and tick != self._reported_tick:
+                self._reported_tick = tick
+                self._report(stalled)
+
+    def _report(self, stalled: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id or 0)
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+        fields = _task_context(task)
+        fields.update(
+            seconds=round(stalled, 2),
+            task=task.get_name() if task else None,
+            stack="".join(traceback.format_stack(frame)) if frame else None,
+        )
+        logger.warning("Event loop blocked", **fields)
+        if self._loop is not None:
+            # Metrics are only touched from the loop thread.
+            self._loop.call_soon_threadsafe(metrics.loop_stalls.inc)
+
+
+monitor = LoopMonitor()
+metrics.registry.add_collector(monitor.publish)
@@ -0,0 +1,517 @@
+"""In-process counters, gauges and histograms, exported as Prometheus text.
+
+The bot's hot paths record into the module-level metrics below; nothing here
+talks to a metrics backend. When `METRICS_PORT` is set, bot.py serves
+`render()` on localhost so a scraper (or a curl during an incident) can read
+it. Everything runs on the event loop, so the stores are plain dicts.
+
+Gateway listeners and REST calls are timed from the outside: hikari has no
+hooks for either, so `instrument_listeners` swaps each subscribed callback
+for a timing wrapper and `instrument_rest` adds an aiohttp trace config to
+the REST client's session.
+"""
+
+from __future__ import annotations
+
+import abc
+import contextlib
+import functools
+import math
+import re
+import time
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+import structlog
+from aiohttp import web
+
+if TYPE_CHECKING:
+    import types
+    from collections.abc import Awaitable, Callable, Coroutine, Iterator, Sequence
+
+    import hikari
+
+logger = structlog.get_logger(__name__)
+
+#: Interface the metrics endpoint listens on. Never exposed beyond the host.
+DEFAULT_HOST = "127.0.0.1"
+#: Latency buckets (seconds) for handlers and REST calls.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+#: Buckets (seconds) for event-loop scheduling lag, which should stay tiny.
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+#: Duration buckets (seconds) for cron tasks, which run far longer.
+TASK_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+type _LabelValues = tuple[str, ...]
+
+
+# ---------------------------------------------------------------------------- #
+#                                    Metrics                                   #
+# ---------------------------------------------------------------------------- #
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class Metric(abc.ABC):
+    """A named family of samples, one per combination of label values."""
+
+    kind = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: dict[str, Any]) -> _LabelValues:
+        if labels.keys() != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} takes labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Drop every sample, e.g. between tests."""
+
+    @abc.abstractmethod
+    def samples(self) -> Iterator[str]:
+        """The exposition lines for this metric's samples."""
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """A total that only goes up."""
+
+    kind = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[_LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only go up")
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def samples(self) -> Iterator[str]:
+        for key, value in sorted(self._values.items()):
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """A value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+
+class _Buckets:
+    __slots__ = ("count", "counts", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram(Metric):
+    """Observations counted into cumulative `le` buckets, plus sum and count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: dict[_LabelValues, _Buckets] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        series = self._values.get(key)
+        if series is None:
+            series = self._values[key] = _Buckets(len(self.buckets))
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series.counts[i] += 1
+        series.count += 1
+        series.sum += value
+
+    @contextlib.contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observe how long the block took, even if it raised."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: Any) -> int:
+        series = self._values.get(self._key(labels))
+        return series.count if series else 0
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def samples(self) -> Iterator[str]:
+        names = (*self.labelnames, "le")
+        for key, series in sorted(self._values.items()):
+            for bound, count in zip(self.buckets, series.counts, strict=True):
+                labels = _format_labels(names, (*key, _format_value(bound)))
+                yield f"{self.name}_bucket{labels} {count}"
+            labels = _format_labels(names, (*key, "+Inf"))
+            yield f"{self.name}_bucket{labels} {series.count}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(series.sum)}"
+            yield f"{self.name}_count{labels} {series.count}"
+
+
+class Registry:
+    """Every metric the process exports, in registration order."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def register[MetricT: Metric](self, metric: MetricT) -> MetricT:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def clear(self) -> None:
+        """Reset every metric's samples; the metrics themselves stay registered."""
+        for metric in self._metrics.values():
+            metric.clear()
+
+    def add_collector(self, collect: Callable[[], None]) -> None:
+        """Run `collect` before each render, to refresh metrics kept on demand."""
+        self._collectors.append(collect)
+
+    def render(self) -> str:
+        """The whole registry in the Prometheus text exposition format."""
+        for collect in self._collectors:
+            collect()
+        return "\n".join(m.render() for m in self._metrics.values()) + "\n"
+
+
+registry = Registry()
+
+listener_seconds = registry.register(
+    Histogram(
+        "dragonpaw_listener_seconds",
+        "Time spent in a gateway event listener.",
+        ("event", "listener"),
+    )
+)
+interaction_seconds = registry.register(
+    Histogram(
+        "dragonpaw_interaction_seconds",
+        "Time spent dispatching a component or modal interaction.",
+        ("plugin", "kind"),
+    )
+)
+rest_requests = registry.register(
+    Counter(
+        "dragonpaw_rest_requests_total",
+        "Discord REST requests made, by route and response status.",
+        ("method", "route", "status"),
+    )
+)
+rest_seconds = registry.register(
+    Histogram(
+        "dragonpaw_rest_seconds",
+        "Discord REST request latency.",
+        ("method", "route"),
+    )
+)
+task_seconds = registry.register(
+    Histogram(
+        "dragonpaw_task_seconds",
+        "Cron task run time.",
+        ("task", "outcome"),
+        buckets=TASK_BUCKETS,
+    )
+)
+state_load_seconds = registry.register(
+    Histogram(
+        "dragonpaw_state_load_seconds",
+        "Time to read a guild's state file from disk.",
+        ("store",),
+    )
+)
+state_save_seconds = registry.register(
+    Histogram(
+        "dragonpaw_state_save_seconds",
+        "Time to write a guild's state file to disk.",
+        ("store",),
+    )
+)
+state_cache = registry.register(
+    Counter(
+        "dragonpaw_state_cache_total",
+        "State loads served from memory (hit) or from disk (miss).",
+        ("store", "result"),
+    )
+)
+state_cached_guilds = registry.register(
+    Gauge(
+        "dragonpaw_state_cached_guilds",
+        "Guild states held in memory per store.",
+        ("store",),
+    )
+)
+startup_seconds = registry.register(
+    Gauge(
+        "dragonpaw_startup_seconds",
+        "Time from process start to the first gateway connection.",
+    )
+)
+loop_lag_seconds = registry.register(
+    Histogram(
+        "dragonpaw_loop_lag_seconds",
+        "How late the event loop ran a timer it was due to run.",
+        buckets=LAG_BUCKETS,
+    )
+)
+loop_lag_quantile = registry.register(
+    Gauge(
+        "dragonpaw_loop_lag_quantile_seconds",
+        "Event-loop lag percentiles over the recent window.",
+        ("quantile",),
+    )
+)
+loop_stalls = registry.register(
+    Counter(
+        "dragonpaw_loop_stalls_total",
+        "Times the event loop was blocked past the stall threshold.",
+    )
+)
+
+
+# ---------------------------------------------------------------------------- #
+#                                Instrumentation                               #
+# ---------------------------------------------------------------------------- #
+
+
+class _TimedListener:
+    """Times one listener; compares equal to it so unsubscribing still works."""
+
+    def __init__(self, event_type: type[Any], callback: Any) -> None:
+        self.callback = callback
+        self.event = event_type.__name__
+        self.__name__ = getattr(callback, "__name__", "<anon>")
+
+    async def __call__(self, event: Any) -> None:
+        with listener_seconds.time(event=self.event, listener=self.__name__):
+            await self.callback(event)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _TimedListener):
+            return self.callback == other.callback
+        return self.callback == other
+
+    def __hash__(self) -> int:
+        return hash(self.callback)
+
+
+def instrument_listeners(event_manager: hikari.api.EventManager) -> int:
+    """Wrap every listener subscribed so far in a timer; returns how many.
+
+    Call once everything is subscribed. Listeners added later go untimed.
+    """
+    wrapped = 0
+    listeners: dict[type[Any], list[Any]] = getattr(event_manager, "_listeners", {})
+    for event_type, callbacks in listeners.items():
+        for i, callback in enumerate(callbacks):
+            if not isinstance(callback, _TimedListener):
+                callbacks[i] = _TimedListener(event_type, callback)
+                wrapped += 1
+    return wrapped
+
+
+def timed_task[**P](
+    func: Callable[P, Awaitable[None]],
+) -> Callable[P, Coroutine[Any, Any, None]]:
+    """Decorator recording each run of a cron task in `task_seconds`.
+
+    Goes under ``@loader.task(...)``; the signature is kept, so lightbulb still
+    injects the task's dependencies.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    async def run(*args: P.args, **kwargs: P.kwargs) -> None:
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            await func(*args, **kwargs)
+            outcome = "ok"
+        finally:
+            task_seconds.observe(
+                time.perf_counter() - started, task=name, outcome=outcome
+            )
+
+    return run
+
+
+_API_PREFIX = re.compile(r"^/api/v\d+")
+#: Path segments after these hold secrets or free text, not ids.
+_TOKEN_PARENTS = {"webhooks", "interactions"}
+
+
+def route_template(path: str) -> str:
+    """Collapse a REST path to its route, so labels don't grow per channel."""
+    out: list[str] = []
+    for part in _API_PREFIX.sub("", path).split("/"):
+        if part.isdigit():
+            out.append("{id}")
+        elif len(out) >= 2 and out[-1] == "{id}" and out[-2] in _TOKEN_PARENTS:  # noqa: PLR2004
+            out.append("{token}")
+        elif out and out[-1] == "reactions" and part != "@me":
+            out.append("{emoji}")
+        else:
+            out.append(part)
+    return "/".join(out)
+
+
+async def _on_request_start(
+    _session: aiohttp.ClientSession,
+    ctx: types.SimpleNamespace,
+    _params: aiohttp.TraceRequestStartParams,
+) -> None:
+    ctx.started = time.perf_counter()
+
+
+def _record_request(
+    ctx: types.SimpleNamespace, method: str, url: Any, status: str
+) -> None:
+    route = route_template(url.path)
+    rest_requests.inc(method=method, route=route, status=status)
+    rest_seconds.observe(time.perf_counter() - ctx.started, method=method, route=route)
+
+
+async def _on_request_end(
+    _session: aiohttp.ClientSession,
+    ctx: types.SimpleNamespace,
+    params: aiohttp.TraceRequestEndParams,
+) -> None:
+    _record_request(ctx, params.method, params.url, str(params.response.status))
+
+
+async def _on_request_exception(
+    _session: aiohttp.ClientSession,
+    ctx: types.SimpleNamespace,
+    params: aiohttp.TraceRequestExceptionParams,
+) -> None:
+    _record_request(ctx, params.method, params.url, "error")
+
+
+def rest_trace_config() -> aiohttp.TraceConfig:
+    trace = aiohttp.TraceConfig()
+    trace.on_request_start.append(_on_request_start)
+    trace.on_request_end.append(_on_request_end)
+    trace.on_request_exception.append(_on_request_exception)
+    trace.freeze()
+    return trace
+
+
+def instrument_rest(rest: hikari.api.RESTClient) -> bool:
+    """Count and time every request the REST client's session makes.
+
+    The session only exists once the client has started, so call this from a
+    StartingEvent listener or later.
+    """
+    session: aiohttp.ClientSession | None = getattr(rest, "_client_session", None)
+    if session is None:
+        logger.warning("REST client has no session yet, REST metrics disabled")
+        return False
+    session.trace_configs.append(rest_trace_config())
+    return True
+
+
+# ---------------------------------------------------------------------------- #
+#                                   Endpoint                                   #
+# ---------------------------------------------------------------------------- #
+
+_runner: web.AppRunner | None = None
+
+
+async def _handle_metrics(_: web.Request) -> web.Response:
+    return web.Response(
+        body=registry.render().encode(), headers={"Content-Type": _CONTENT_TYPE}
+    )
+
+
+async def start_server(port: int, host: str = DEFAULT_HOST) -> None:
+    """Serve the registry at http://host:port/metrics until `stop_server()`."""
+    global _runner  # noqa: PLW0603
+    if _runner is not None:
+        return
+    app = web.Application()
+    app.router.add_get("/metrics", _handle_metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    _runner = runner
+    logger.info("Serving metrics", url=f"http://{host}:{port}/metrics")
+
+
+async def stop_server() -> None:
+    global _runner
+    if _runner is not None:
+        runner, _runner = _runner, None
+        await runner.cleanup()
@@ -12,7 +12,6 @@ import structlog
 from dragonpaw_bot.colors import SOLARIZED_CYAN
 from dragonpaw_bot.context import NotAuthorized, is_guild_admin
 from dragonpaw_bot.plugins.activity import state as activity_state
-from dragonpaw_bot.plugins.activity.chart import render_activity_chart
 from dragonpaw_bot.plugins.activity.models import (
     ACTIVITY_FLOOR,
     ActivityGuildMeta,
@@ -180,6 +179,9 @@ async def build_score_embed(
     role_note = f" (role: **{role_cfg.role_name}**)" if role_cfg else ""
 
     try:
+        # Pillow is loaded the first time a chart is drawn, not at startup.
+        from dragonpaw_bot.plugins.activity.chart import render_activity_chart  # noqa: PLC0415
+
         chart = render_activity_chart(member.display_name, buckets, score, status_emoji)
     except Exception:
         logger.exception("Failed to render activity chart", target=member.display_name)
@@ -9,6 +9,7 @@ import hikari
 import lightbulb
 import structlog
 
+from dragonpaw_bot import metrics
 from dragonpaw_bot.context import GuildContext
 from dragonpaw_bot.plugins.activity import state as activity_state
 from dragonpaw_bot.plugins.activity.models import (
@@ -21,6 +22,7 @@ from dragonpaw_bot.plugins.activity.models import (
     calculate_score,
     has_ignored_role,
 )
+from dragonpaw_bot.rest_scheduler import scheduler
 from dragonpaw_bot.utils import guild_member, guild_members
 
 if TYPE_CHECKING:
@@ -42,6 +44,7 @@ async def on_stopping(_: hikari.StoppingEvent) -> None:
 
 
 @loader.task(lightbulb.crontrigger("20 * * * *"))
+@metrics.timed_task
 async def activity_flush(bot: hikari.GatewayBot) -> None:
     """Hourly task: flush dirty in-memory user state to disk."""
     flushed = activity_state.flush_dirty()
@@ -50,6 +53,7 @@ async def activity_flush(bot: hikari.GatewayBot) -> None:
 
 
 @loader.task(lightbulb.crontrigger("15 4 * * *"))
+@metrics.timed_task
 async def activity_daily_cron(bot: hikari.GatewayBot) -> None:
     """Daily task: prune old buckets, remove departed users, sync lurker role."""
     bot = cast("DragonpawBot", bot)
@@ -266,12 +270,15 @@ async def _set_lurker(
     action = "assign" if add else "remove"
     preposition = "to" if add else "from"
     try:
-        if add:
-            await gc.bot.rest.add_role_to_member(gc.guild_id, member.id, lurker_role_id)
-        else:
-            await gc.bot.rest.remove_role_from_member(
-                gc.guild_id, member.id, lurker_role_id
-            )
+        async with scheduler.slot(f"member_roles:{gc.guild_id}"):
+            if add:
+                await gc.bot.rest.add_role_to_member(
+                    gc.guild_id, member.id, lurker_role_id
+                )
+            else:
+                await gc.bot.rest.remove_role_from_member(
+                    gc.guild_id, member.id, lurker_role_id
+                )
     except hikari.NotFoundError:
         return False  # Member left between fetch and assignment
     except hikari.ForbiddenError:
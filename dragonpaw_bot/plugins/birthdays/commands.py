@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import calendar
 import datetime
-import zoneinfo
 from typing import TYPE_CHECKING
 
 import hikari
@@ -11,7 +10,7 @@ import structlog
 
 from dragonpaw_bot.colors import SOLARIZED_MAGENTA, SOLARIZED_ORANGE
 from dragonpaw_bot.context import GuildContext, actor_name
-from dragonpaw_bot.plugins.birthdays import state
+from dragonpaw_bot.plugins.birthdays import schedule, state, timezones
 from dragonpaw_bot.plugins.birthdays.constants import (
     BIRTHDAY_PREFIX,
     TIMEZONE_REGIONS,
@@ -150,46 +149,6 @@ def is_birthday_on_date(entry: BirthdayEntry, date: datetime.date) -> bool:
     )
 
 
-def _validate_timezone(tz_str: str) -> zoneinfo.ZoneInfo | None:
-    """Validate and return a ZoneInfo, or None if invalid."""
-    try:
-        return zoneinfo.ZoneInfo(tz_str)
-    except (KeyError, zoneinfo.ZoneInfoNotFoundError):
-        return None
-
-
-def _get_user_tz(entry: BirthdayEntry) -> datetime.tzinfo:
-    """Return the user's timezone, falling back to UTC on invalid values."""
-    if not entry.timezone:
-        return datetime.UTC
-    try:
-        return zoneinfo.ZoneInfo(entry.timezone)
-    except (KeyError, zoneinfo.ZoneInfoNotFoundError):
-        logger.warning(
-            "Invalid timezone in state, falling back to UTC",
-            user_id=entry.user_id,
-            timezone=entry.timezone,
-        )
-        return datetime.UTC
-
-
-def user_local_date(entry: BirthdayEntry) -> datetime.date:
-    """Return today's date in the user's configured timezone (default UTC)."""
-    return datetime.datetime.now(_get_user_tz(entry)).date()
-
-
-def user_local_hour(entry: BirthdayEntry) -> int:
-    """Return the current hour in the user's configured timezone (default UTC)."""
-    return datetime.datetime.now(_get_user_tz(entry)).hour
-
-
-def user_local_date_offset(entry: BirthdayEntry, *, days: int) -> datetime.date:
-    """Return today + offset days in the user's configured timezone."""
-    return (
-        datetime.datetime.now(_get_user_tz(entry)) + datetime.timedelta(days=days)
-    ).date()
-
-
 # ---------------------------------------------------------------------------- #
 #                                  Commands                                    #
 # ---------------------------------------------------------------------------- #
@@ -218,7 +177,7 @@ class BirthdayStatus(
             )
             return
 
-        local_today = user_local_date(entry)
+        local_today = timezones.local_date(entry)
         days = _days_until_birthday(entry.month, entry.day, today=local_today)
         day_str = (
             "today! 🎂" if days == 0 else f"in **{days}** day{'s' if days != 1 else ''}"
@@ -536,7 +495,7 @@ async def _handle_set_region(
     )
 
 
-async def _handle_set_timezone(
+async def _handle_set_timezone(  # noqa: PLR0915
     interaction: hikari.ComponentInteraction, field: str
 ) -> None:
     """Step 4: Timezone selected → save birthday entry."""
@@ -557,7 +516,7 @@ async def _handle_set_timezone(
     month = int(parts[0])
     day = int(parts[1])
     tz_id = interaction.values[0] if interaction.values else None
-    if not tz_id or _validate_timezone(tz_id) is None:
+    if not tz_id or timezones.zone(tz_id) is None:
         logger.warning("Invalid timezone selection", timezone=tz_id)
         await interaction.create_initial_response(
             response_type=hikari.ResponseType.MESSAGE_UPDATE,
@@ -627,6 +586,7 @@ async def _handle_set_timezone(
         )
 
     guild_state.birthdays[uid] = entry
+    schedule.entry_changed(int(guild_id), entry)
     guild = bot.cache.get_guild(guild_id)
     guild_name = guild.name if guild else str(guild_id)
     guild_state.guild_name = guild_name
@@ -733,6 +693,7 @@ class BirthdayRemove(
             return
 
         del guild_state.birthdays[uid]
+        schedule.entry_removed(guild_state.guild_id, uid)
         state.save(guild_state)
 
         await ctx.respond(
@@ -781,6 +742,7 @@ class BirthdayRemoveFor(
             return
 
         del guild_state.birthdays[uid]
+        schedule.entry_removed(guild_state.guild_id, uid)
         guild_state.guild_name = gc.name
         state.save(guild_state)
 
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-import asyncio
+import datetime
 from typing import TYPE_CHECKING, cast
 
 import hikari
 import lightbulb
 import structlog
 
-from dragonpaw_bot import utils
+from dragonpaw_bot import dm, metrics, utils
 from dragonpaw_bot.context import GuildContext, check_role_manageable
-from dragonpaw_bot.plugins.birthdays import commands, state
+from dragonpaw_bot.plugins.birthdays import commands, schedule, state
 
 if TYPE_CHECKING:
     from dragonpaw_bot.bot import DragonpawBot
@@ -97,17 +97,18 @@ async def send_week_ahead_dm(
     guild_state: state.BirthdayGuildState,
     uid: int,
     entry: BirthdayEntry,
+    batch: dm.DMBatch,
 ) -> None:
-    """Send a week-ahead DM reminder to a member, removing them if they left."""
+    """Queue a week-ahead DM reminder to a member, removing them if they left."""
     log = gc.logger.bind(user_id=uid)
     member = await utils.guild_member(gc.bot, gc.guild_id, uid)
     if member is None:
         log.warning("Member left guild, removing birthday entry")
         del guild_state.birthdays[uid]
+        schedule.entry_removed(int(gc.guild_id), uid)
         state.save(guild_state)
         return
 
-    member_log = gc.logger.bind(user=member.display_name)
     if entry.wishlist_url:
         wishlist_line = (
             f"Your current wishlist: {entry.wishlist_url}\n"
@@ -115,25 +116,24 @@ async def send_week_ahead_dm(
         )
     else:
         wishlist_line = "You don't have a wishlist set yet — add one with `/birthday wishlist <url>`!"
-    try:
-        dm = await member.user.fetch_dm_channel()
-        await dm.send(
+    batch.send(
+        member.user,
+        content=(
             f"*excited dragon dance* 🐉🎂 Your birthday is in 7 days!! ({commands.MONTH_NAMES[entry.month]} {entry.day})\n\n"
             f"{wishlist_line}\n"
             f"Update your wishlist with `/birthday wishlist <url>` so your friends know what to get you~ 🎁"
-        )
-        member_log.debug("Sent week-ahead birthday DM")
-    except hikari.ForbiddenError:
-        member_log.warning("Cannot DM user for birthday reminder (DMs disabled)")
-    except hikari.HTTPError as exc:
-        member_log.warning("Failed to DM birthday reminder", error=str(exc))
+        ),
+        log=gc.logger.bind(user=member.display_name),
+    )
 
 
-async def process_guild_birthdays(gc: GuildContext) -> None:
+async def process_guild_birthdays(
+    gc: GuildContext, now: datetime.datetime | None = None
+) -> None:
     """Process birthday announcements, role cleanup, and reminders for one guild.
 
-    Runs hourly. For each user, computes "today" in their local timezone and only
-    processes events during the user's midnight hour (hour 0).
+    Runs hourly. Each entry's events are queued for the member's local midnight
+    in the guild's schedule; this pops whatever has come due since the last run.
     """
     log = gc.logger
     guild_id = int(gc.guild_id)
@@ -145,66 +145,78 @@ async def process_guild_birthdays(gc: GuildContext) -> None:
 
     guild_state.guild_name = gc.name
     cfg = guild_state.config
+    if now is None:
+        now = datetime.datetime.now(datetime.UTC)
+    sched = schedule.for_guild(guild_state, now)
+    due = sched.pop_due(now)
 
-    log.debug("Hourly birthday check", entry_count=len(guild_state.birthdays))
+    log.debug(
+        "Hourly birthday check", entry_count=len(guild_state.birthdays), due=len(due)
+    )
 
     changed = False
-    for uid, entry in list(guild_state.birthdays.items()):
-        local_hour = commands.user_local_hour(entry)
-        if local_hour != 0:
-            continue
-
-        local_today = commands.user_local_date(entry)
-        local_yesterday = commands.user_local_date_offset(entry, days=-1)
-        local_week_ahead = commands.user_local_date_offset(entry, days=7)
-
-        # Birthday announcements
-        if commands.is_birthday_on_date(entry, local_today):
-            if entry.last_announced == local_today:
-                log.debug("Already announced today, skipping", user_id=uid)
-                continue
-            member = await utils.guild_member(gc.bot, gc.guild_id, uid)
-            if member is None:
-                log.warning("Member left guild, removing birthday entry", user_id=uid)
-                del guild_state.birthdays[uid]
-                state.save(guild_state)
+    async with dm.DMBatch(gc.bot, "birthday week-ahead", log=log) as batch:
+        for fire in due:
+            uid = fire.user_id
+            entry = guild_state.birthdays.get(uid)
+            if entry is None:
                 continue
-            await announce_birthday(gc, member, entry, cfg)
-            entry.last_announced = local_today
-            changed = True
-            await asyncio.sleep(1)
-
-        # Role cleanup for yesterday's birthdays
-        elif cfg.birthday_role and commands.is_birthday_on_date(entry, local_yesterday):
-            member = await utils.guild_member(gc.bot, gc.guild_id, uid)
-            if member is None:
-                log.warning(
-                    "Member left guild during role cleanup, removing entry",
-                    user_id=uid,
-                )
-                del guild_state.birthdays[uid]
+            sched.reschedule(entry, fire)
+
+            # Birthday announcements
+            if fire.kind is schedule.FireKind.ANNOUNCE:
+                if entry.last_announced == fire.date:
+                    log.debug("Already announced today, skipping", user_id=uid)
+                    continue
+                member = await utils.guild_member(gc.bot, gc.guild_id, uid)
+                if member is None:
+                    log.warning(
+                        "Member left guild, removing birthday entry", user_id=uid
+                    )
+                    del guild_state.birthdays[uid]
+                    schedule.entry_removed(guild_id, uid)
+                    state.save(guild_state)
+                    continue
+                await announce_birthday(gc, member, entry, cfg)
+                entry.last_announced = fire.date
                 changed = True
-                continue
-            await cleanup_birthday_role(gc, member, cfg)
 
-        # Week-ahead DM reminder
-        if commands.is_birthday_on_date(entry, local_week_ahead):
-            await send_week_ahead_dm(gc, guild_state, uid, entry)
-            await asyncio.sleep(1)
+            # Role cleanup for yesterday's birthdays
+            elif fire.kind is schedule.FireKind.ROLE_CLEANUP:
+                if not cfg.birthday_role:
+                    continue
+                member = await utils.guild_member(gc.bot, gc.guild_id, uid)
+                if member is None:
+                    log.warning(
+                        "Member left guild during role cleanup, removing entry",
+                        user_id=uid,
+                    )
+                    del guild_state.birthdays[uid]
+                    schedule.entry_removed(guild_id, uid)
+                    changed = True
+                    continue
+                await cleanup_birthday_role(gc, member, cfg)
+
+            # Week-ahead DM reminder
+            else:
+                await send_week_ahead_dm(gc, guild_state, uid, entry, batch)
 
     if changed:
         state.save(guild_state)
 
 
 @loader.task(lightbulb.crontrigger("5 * * * *"))
+@metrics.timed_task
 async def birthdays_hourly(bot: hikari.GatewayBot) -> None:
     """Hourly task: announce birthdays at each user's local midnight."""
     bot = cast("DragonpawBot", bot)
     guilds = list(bot.cache.get_guilds_view().values())
     logger.debug("Birthday hourly run", guild_count=len(guilds))
+    # One clock read per tick, shared by every guild's schedule.
+    now = datetime.datetime.now(datetime.UTC)
     for guild in guilds:
         try:
             gc = GuildContext.from_guild(bot, guild)
-            await process_guild_birthdays(gc)
+            await process_guild_birthdays(gc, now)
         except Exception:
             logger.exception("Error processing birthdays for guild", guild=guild.name)
@@ -9,7 +9,7 @@ import lightbulb
 import structlog
 
 from dragonpaw_bot.context import GuildContext
-from dragonpaw_bot.plugins.birthdays import state
+from dragonpaw_bot.plugins.birthdays import schedule, state
 
 if TYPE_CHECKING:
     from dragonpaw_bot.bot import DragonpawBot
@@ -39,6 +39,7 @@ async def on_member_leave(event: hikari.MemberDeleteEvent) -> None:
         return
 
     del guild_state.birthdays[uid]
+    schedule.entry_removed(guild_id, uid)
 
     try:
         state.save(guild_state)
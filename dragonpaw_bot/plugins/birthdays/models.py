@@ -1,9 +1,9 @@
 import calendar
 import datetime
-import zoneinfo
 
 import pydantic
 
+from dragonpaw_bot.plugins.birthdays import timezones
 from dragonpaw_bot.state_store import GuildStateBase
 
 
@@ -27,12 +27,9 @@ class BirthdayEntry(pydantic.BaseModel):
     @pydantic.field_validator("timezone", mode="after")
     @classmethod
     def _validate_timezone(cls, v: str | None) -> str | None:
-        if v is not None:
-            try:
-                zoneinfo.ZoneInfo(v)
-            except (KeyError, zoneinfo.ZoneInfoNotFoundError):
-                msg = f"Invalid IANA timezone: {v}"
-                raise ValueError(msg)
+        if v is not None and timezones.zone(v) is None:
+            msg = f"Invalid IANA timezone: {v}"
+            raise ValueError(msg)
         return v
 
 
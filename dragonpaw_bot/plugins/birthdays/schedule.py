@@ -0,0 +1,163 @@
+"""Precomputed birthday fire times, kept in a min-heap per guild.
+
+Every entry has three yearly events, each at the member's local midnight:
+the announcement, the birthday-role cleanup the day after, and the week-ahead
+DM seven days before. Their next UTC instants go on the guild's heap, so the
+hourly cron only pops what's due instead of walking every registered birthday.
+
+Heaps live in memory and are built lazily from state on first use. Commands
+and listeners call `entry_changed` / `entry_removed` when a birthday is set or
+dropped; superseded heap items are skipped when popped rather than searched
+for and removed.
+"""
+
+from __future__ import annotations
+
+import calendar
+import dataclasses
+import datetime
+import enum
+import heapq
+import itertools
+from typing import TYPE_CHECKING
+
+import structlog
+
+from dragonpaw_bot.plugins.birthdays import timezones
+
+if TYPE_CHECKING:
+    from dragonpaw_bot.plugins.birthdays.models import (
+        BirthdayEntry,
+        BirthdayGuildState,
+    )
+
+logger = structlog.get_logger(__name__)
+
+#: When a heap is first built, events this recent still count as due, so a
+#: restart just after someone's midnight doesn't skip their birthday.
+CATCH_UP = datetime.timedelta(hours=1)
+
+_FEB = 2
+_LEAP_DAY = 29
+
+
+class FireKind(enum.StrEnum):
+    ANNOUNCE = "announce"
+    ROLE_CLEANUP = "role_cleanup"
+    WEEK_AHEAD = "week_ahead"
+
+
+#: Each event's local date relative to the birthday itself.
+_OFFSETS = {
+    FireKind.ANNOUNCE: datetime.timedelta(days=0),
+    FireKind.ROLE_CLEANUP: datetime.timedelta(days=1),
+    FireKind.WEEK_AHEAD: datetime.timedelta(days=-7),
+}
+
+
+@dataclasses.dataclass(order=True, frozen=True)
+class Fire:
+    """One scheduled event: fires at `at` (UTC) for the member's local `date`."""
+
+    at: datetime.datetime
+    user_id: int
+    kind: FireKind
+    date: datetime.date = dataclasses.field(compare=False)
+    version: int = dataclasses.field(compare=False)
+
+
+def _birthday_in(entry: BirthdayEntry, year: int) -> datetime.date:
+    """The entry's birthday in `year`; Feb 29 falls on Mar 1 in common years."""
+    if entry.month == _FEB and entry.day == _LEAP_DAY and not calendar.isleap(year):
+        return datetime.date(year, 3, 1)
+    return datetime.date(year, entry.month, entry.day)
+
+
+def next_fire(
+    entry: BirthdayEntry, kind: FireKind, after: datetime.datetime, version: int
+) -> Fire:
+    """The first `kind` event for this entry strictly after `after`."""
+    tz = timezones.entry_zone(entry)
+    local_year = after.astimezone(tz).year
+    for year in range(local_year - 1, local_year + 2):
+        date = _birthday_in(entry, year) + _OFFSETS[kind]
+        at = datetime.datetime.combine(date, datetime.time(), tz).astimezone(
+            datetime.UTC
+        )
+        if at > after:
+            return Fire(at, entry.user_id, kind, date, version)
+    # Three consecutive years always contain a future occurrence.
+    raise AssertionError("unreachable")
+
+
+class GuildSchedule:
+    """Min-heap of one guild's upcoming birthday events."""
+
+    def __init__(self) -> None:
+        self._heap: list[Fire] = []
+        # A fresh version on every change, so older heap items can be told
+        # apart. Drawn from one counter so a removed-then-re-added entry can't
+        # reuse the version of items still sitting in the heap.
+        self._versions: dict[int, int] = {}
+        self._counter = itertools.count(1)
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def schedule(self, entry: BirthdayEntry, after: datetime.datetime) -> None:
+        """(Re)schedule all of an entry's events, superseding any already queued."""
+        version = next(self._counter)
+        self._versions[entry.user_id] = version
+        for kind in FireKind:
+            heapq.heappush(self._heap, next_fire(entry, kind, after, version))
+
+    def remove(self, user_id: int) -> None:
+        self._versions.pop(user_id, None)
+
+    def reschedule(self, entry: BirthdayEntry, fire: Fire) -> None:
+        """Queue the next occurrence of an event that just fired."""
+        if self._versions.get(entry.user_id) == fire.version:
+            heapq.heappush(
+                self._heap, next_fire(entry, fire.kind, fire.at, fire.version)
+            )
+
+    def pop_due(self, now: datetime.datetime) -> list[Fire]:
+        """Remove and return every live event due at or before `now`, in order."""
+        due: list[Fire] = []
+        while self._heap and self._heap[0].at <= now:
+            fire = heapq.heappop(self._heap)
+            if self._versions.get(fire.user_id) == fire.version:
+                due.append(fire)
+        return due
+
+
+_schedules: dict[int, GuildSchedule] = {}
+
+
+def for_guild(guild_state: BirthdayGuildState, now: datetime.datetime) -> GuildSchedule:
+    """The guild's schedule, built from its state the first time it's asked for."""
+    sched = _schedules.get(guild_state.guild_id)
+    if sched is None:
+        sched = GuildSchedule()
+        for entry in guild_state.birthdays.values():
+            sched.schedule(entry, now - CATCH_UP)
+        _schedules[guild_state.guild_id] = sched
+        logger.debug(
+            "Built birthday schedule",
+            guild_id=guild_state.guild_id,
+            entries=len(sched),
+        )
+    return sched
+
+
+def entry_changed(guild_id: int, entry: BirthdayEntry) -> None:
+    """A birthday was set or edited: requeue its events from now."""
+    sched = _schedules.get(guild_id)
+    if sched is not None:
+        sched.schedule(entry, datetime.datetime.now(datetime.UTC))
+
+
+def entry_removed(guild_id: int, user_id: int) -> None:
+    sched = _schedules.get(guild_id)
+    if sched is not None:
+        sched.remove(user_id)
@@ -0,0 +1,57 @@
+"""Shared timezone lookups for the birthdays plugin.
+
+Entry validation, the fire schedule and the status command all resolve the
+same handful of IANA names over and over. Lookups are memoized here, misses
+included, so each distinct timezone is resolved once per process.
+"""
+
+from __future__ import annotations
+
+import datetime
+import functools
+import zoneinfo
+from typing import TYPE_CHECKING
+
+import structlog
+
+if TYPE_CHECKING:
+    from dragonpaw_bot.plugins.birthdays.models import BirthdayEntry
+
+logger = structlog.get_logger(__name__)
+
+_warned: set[str] = set()
+
+
+@functools.lru_cache(maxsize=1024)
+def zone(name: str) -> zoneinfo.ZoneInfo | None:
+    """The named IANA timezone, or None if there's no such zone."""
+    try:
+        return zoneinfo.ZoneInfo(name)
+    except (KeyError, ValueError, zoneinfo.ZoneInfoNotFoundError):
+        return None
+
+
+def entry_zone(entry: BirthdayEntry) -> datetime.tzinfo:
+    """Return the user's timezone, falling back to UTC on invalid values."""
+    if not entry.timezone:
+        return datetime.UTC
+    tz = zone(entry.timezone)
+    if tz is not None:
+        return tz
+    if entry.timezone not in _warned:
+        _warned.add(entry.timezone)
+        logger.warning(
+            "Invalid timezone in state, falling back to UTC",
+            user_id=entry.user_id,
+            timezone=entry.timezone,
+        )
+    return datetime.UTC
+
+
+def local_date(
+    entry: BirthdayEntry, now: datetime.datetime | None = None
+) -> datetime.date:
+    """The date in the user's timezone at `now` (one clock read if omitted)."""
+    if now is None:
+        now = datetime.datetime.now(datetime.UTC)
+    return now.astimezone(entry_zone(entry)).date()
@@ -7,16 +7,47 @@ import hikari  # noqa: TC002 — needed at runtime for DI annotation resolution
 import lightbulb
 import structlog
 
-from dragonpaw_bot.context import ChannelContext, GuildContext
+from dragonpaw_bot import metrics
+from dragonpaw_bot.context import (
+    ChannelContext,
+    GuildContext,
+    GuildThreads,
+    throttled_checkpoint,
+)
 from dragonpaw_bot.plugins.channel_cleanup import state as cleanup_state
 
 if TYPE_CHECKING:
     from dragonpaw_bot.bot import DragonpawBot
+    from dragonpaw_bot.plugins.channel_cleanup.models import CleanupGuildState
 
 logger = structlog.get_logger(__name__)
 loader = lightbulb.Loader()
 
 
+async def _cleanup_guild(gc: GuildContext, st: CleanupGuildState) -> None:
+    """Clean every configured channel concurrently, then persist moved purge marks.
+
+    The channels share one GuildThreads listing, so the guild-wide active
+    thread fetch happens once per run rather than once per channel.
+    """
+    before = [entry.purge_marks.model_copy() for entry in st.channels]
+
+    threads = GuildThreads(gc.bot, gc.guild_id)
+
+    checkpoint = throttled_checkpoint(lambda: cleanup_state.save(st))
+
+    await asyncio.gather(
+        *(
+            ChannelContext.from_entry(gc, entry).run_cleanup_isolated(
+                entry.expiry_minutes, entry.purge_marks, checkpoint, threads
+            )
+            for entry in st.channels
+        )
+    )
+    if [entry.purge_marks for entry in st.channels] != before:
+        cleanup_state.save(st)
+
+
 async def channel_cleanup_hourly(bot: hikari.GatewayBot) -> None:
     """Hourly task: purge old messages from configured channels (all channels run concurrently)."""
     bot = cast("DragonpawBot", bot)
@@ -27,9 +58,9 @@ async def channel_cleanup_hourly(bot: hikari.GatewayBot) -> None:
     for guild in guilds:
         try:
             gc = GuildContext.from_guild(bot, guild)
-            for entry in cleanup_state.load(int(guild.id)).channels:
-                cc = ChannelContext.from_entry(gc, entry)
-                tasks.append(cc.run_cleanup_isolated(entry.expiry_minutes))
+            st = cleanup_state.load(int(guild.id))
+            if st.channels:
+                tasks.append(_cleanup_guild(gc, st))
         except Exception:
             logger.exception("Error building cleanup tasks for guild", guild=guild.name)
     if tasks:
@@ -37,5 +68,6 @@ async def channel_cleanup_hourly(bot: hikari.GatewayBot) -> None:
 
 
 @loader.task(lightbulb.crontrigger("45 * * * *"))
+@metrics.timed_task
 async def _channel_cleanup_hourly_task(bot: hikari.GatewayBot) -> None:
     await channel_cleanup_hourly(bot)
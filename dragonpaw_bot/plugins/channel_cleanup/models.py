@@ -1,12 +1,14 @@
 import pydantic
 
 from dragonpaw_bot.state_store import GuildStateBase
+from dragonpaw_bot.structs import PurgeMarks
 
 
 class CleanupChannelEntry(pydantic.BaseModel):
     channel_id: int = pydantic.Field(gt=0)
     channel_name: str = pydantic.Field(min_length=1)
     expiry_minutes: int = pydantic.Field(gt=0)
+    purge_marks: PurgeMarks = pydantic.Field(default_factory=PurgeMarks)
 
 
 class CleanupGuildState(GuildStateBase):
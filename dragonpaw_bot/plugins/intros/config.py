@@ -50,6 +50,8 @@ class IntrosSet(
 
         st = intros_state.load(int(ctx.guild_id))
         st.guild_name = gc.name
+        if st.channel_id != int(self.channel.id):
+            st.reset_posters()
         st.channel_id = int(self.channel.id)
         st.channel_name = self.channel.name or str(self.channel.id)
 
@@ -147,6 +149,7 @@ class IntrosClear(
         st.guild_name = gc.name
         st.channel_id = None
         st.channel_name = ""
+        st.reset_posters()
         st.required_role_id = None
         st.required_role_name = ""
         st.missing_role_id = None
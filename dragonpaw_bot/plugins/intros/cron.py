@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, cast
 
 import hikari
 import lightbulb
 import structlog
 
+from dragonpaw_bot import metrics
 from dragonpaw_bot.context import (
     CHANNEL_CLEANUP_PERMS,
     GuildContext,
     check_channel_perms,
 )
 from dragonpaw_bot.plugins.intros import state as intros_state
+from dragonpaw_bot.rest_scheduler import scheduler
 from dragonpaw_bot.utils import guild_member, guild_members
 
 if TYPE_CHECKING:
@@ -22,6 +25,10 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 loader = lightbulb.Loader()
 
+#: How long the live-maintained poster index is trusted before a full channel
+#: walk rebuilds it, catching anything the listeners missed while offline.
+RECONCILE_EVERY = timedelta(days=7)
+
 
 @dataclass
 class IntrosScanResult:
@@ -45,16 +52,18 @@ async def scan_intros(
     was offline when they posted). It only touches members who pass the
     `required_role_id` filter — non-eligible holders (e.g. a validation-seeded
     member who doesn't yet have the required role) keep the role until they post.
-    Pass `members` / `posted_ids` to reuse data the caller already fetched. Caller
-    must ensure `st.channel_id` is set.
+    Pass `members` / `posted_ids` to reuse data the caller already fetched;
+    otherwise posters come from the index, rebuilt first if stale. Caller must
+    ensure `st.channel_id` is set.
     """
     assert st.channel_id is not None
 
     if posted_ids is None:
-        posted_ids = set()
-        async for message in gc.bot.rest.fetch_messages(st.channel_id):
-            if not message.author.is_bot and not message.is_pinned:
-                posted_ids.add(int(message.author.id))
+        if _index_stale(st):
+            _rebuild_index(
+                st, [m async for m in gc.bot.rest.fetch_messages(st.channel_id)]
+            )
+        posted_ids = set(st.posters)
 
     if members is None:
         members = await guild_members(gc.bot, gc.guild_id)
@@ -138,10 +147,13 @@ async def _set_role(
     role_id = st.missing_role_id
     verb = "add" if add else "remove"
     try:
-        if add:
-            await gc.bot.rest.add_role_to_member(gc.guild_id, member.id, role_id)
-        else:
-            await gc.bot.rest.remove_role_from_member(gc.guild_id, member.id, role_id)
+        async with scheduler.slot(f"member_roles:{gc.guild_id}"):
+            if add:
+                await gc.bot.rest.add_role_to_member(gc.guild_id, member.id, role_id)
+            else:
+                await gc.bot.rest.remove_role_from_member(
+                    gc.guild_id, member.id, role_id
+                )
     except hikari.NotFoundError:
         return False
     except hikari.ForbiddenError:
@@ -188,6 +200,7 @@ async def _try_delete(message: hikari.Message, reason: str, guild_name: str) ->
 
 
 @loader.task(lightbulb.crontrigger("30 9 * * *"))
+@metrics.timed_task
 async def intros_daily(bot: hikari.GatewayBot) -> None:
     """Daily task: tidy stale posts, then reconcile the missing-intro role."""
     bot = cast("DragonpawBot", bot)
@@ -229,31 +242,84 @@ async def _daily_guild(bot: DragonpawBot, guild: hikari.Guild) -> None:
         return
 
     members = await guild_members(bot, guild.id)
-    messages = [m async for m in bot.rest.fetch_messages(st.channel_id)]
-
-    await _cleanup_messages(gc, members, messages)
+    if _index_stale(st):
+        logger.debug("Rebuilding intro poster index", guild=guild.name)
+        messages = [m async for m in bot.rest.fetch_messages(st.channel_id)]
+        deleted = await _cleanup_messages(gc, members, messages)
+        _rebuild_index(st, [m for m in messages if int(m.id) not in deleted])
+    else:
+        await _cleanup_indexed(gc, st, members)
 
     if st.missing_role_id is not None:
-        posted_ids = {
-            int(m.author.id)
-            for m in messages
-            if not m.author.is_bot and not m.is_pinned
-        }
-        await _reconcile_missing(gc, st, members, posted_ids)
+        await _reconcile_missing(gc, st, members, set(st.posters))
+
+
+def _index_stale(st: IntrosGuildState) -> bool:
+    return (
+        st.posters_reconciled_at is None
+        or datetime.now(UTC) - st.posters_reconciled_at > RECONCILE_EVERY
+    )
+
+
+def _rebuild_index(st: IntrosGuildState, messages: list[hikari.Message]) -> None:
+    """Replace the poster index with what a full channel walk found."""
+    st.posters = {}
+    for message in messages:
+        if not message.author.is_bot and not message.is_pinned:
+            st.record_post(int(message.author.id), int(message.id))
+    st.posters_reconciled_at = datetime.now(UTC)
+    intros_state.save(st)
+
+
+async def _cleanup_indexed(
+    gc: GuildContext, st: IntrosGuildState, members: list[hikari.Member]
+) -> None:
+    """_cleanup_messages, fetching only the posts the index says need a look.
+
+    That's every post by an author who may have left, and every post by an
+    author with more than one — a lookup rather than a walk of the channel.
+    Posts pinned since the listener indexed them are forgotten, as a rebuild
+    would skip them.
+    """
+    assert st.channel_id is not None
+    member_ids = {int(m.id) for m in members}
+    messages: list[hikari.Message] = []
+    forget: set[int] = set()
+    for author_id, poster in st.posters.items():
+        if poster.count == 1 and author_id in member_ids:
+            continue
+        for message_id in poster.message_ids:
+            try:
+                message = await gc.bot.rest.fetch_message(st.channel_id, message_id)
+            except hikari.NotFoundError:
+                forget.add(message_id)
+                continue
+            if message.is_pinned:
+                forget.add(message_id)
+            else:
+                messages.append(message)
+    if not messages and not forget:
+        return
+
+    deleted = await _cleanup_messages(gc, members, messages)
+    if st.forget_posts(forget | deleted):
+        intros_state.save(st)
 
 
 async def _cleanup_messages(
     gc: GuildContext,
     members: list[hikari.Member],
     messages: list[hikari.Message],
-) -> None:
+) -> set[int]:
     """Delete intro posts from departed members and older duplicate posts.
 
     `messages` is newest-first, so the first occurrence per author is their keeper.
+    Returns the ids of the messages deleted.
     """
     member_ids = {int(m.id) for m in members}
     removed_departed: list[str] = []
     removed_dupes: list[str] = []
+    deleted: set[int] = set()
     seen_authors: set[int] = set()
     # Cache misses are confirmed via REST once each: the member list can be
     # incomplete mid-chunk, and we must never delete a present member's post.
@@ -276,12 +342,14 @@ async def _cleanup_messages(
 
         if not present:
             if await _try_delete(message, "intro message", gc.name):
+                deleted.add(int(message.id))
                 removed_departed.append(author_name)
                 logger.info(
                     "Removed departed member's intro", guild=gc.name, user=author_name
                 )
         elif author_id in seen_authors:
             if await _try_delete(message, "duplicate intro", gc.name):
+                deleted.add(int(message.id))
                 removed_dupes.append(author_name)
                 logger.info("Removed duplicate intro", guild=gc.name, user=author_name)
         else:
@@ -299,6 +367,8 @@ async def _cleanup_messages(
             f"✂️ *snorts smoke* Spotted some sneaky double-intros and trimmed the older one(s) from: {names}. One intro per hoard member! 🐾"
         )
 
+    return deleted
+
 
 async def _reconcile_missing(
     gc: GuildContext,
@@ -340,6 +410,7 @@ async def _reconcile_missing(
 
 
 @loader.task(lightbulb.crontrigger("15 20 * * 6"))
+@metrics.timed_task
 async def intros_weekly_naughty_list(bot: hikari.GatewayBot) -> None:
     """Weekly task: post naughty list of members who haven't introduced themselves."""
     bot = cast("DragonpawBot", bot)
@@ -1,4 +1,4 @@
-"""Intros plugin: live removal of the missing-intro role when a member posts."""
+"""Intros plugin: live poster index upkeep and missing-intro role removal."""
 
 from __future__ import annotations
 
@@ -10,6 +10,7 @@ import structlog
 
 from dragonpaw_bot.context import GuildContext
 from dragonpaw_bot.plugins.intros import state as intros_state
+from dragonpaw_bot.rest_scheduler import Priority, scheduler
 
 if TYPE_CHECKING:
     from dragonpaw_bot.bot import DragonpawBot
@@ -34,11 +35,13 @@ async def _handle_intro_post(event: hikari.GuildMessageCreateEvent) -> None:
 
     bot: DragonpawBot = event.app  # type: ignore[assignment]
     st = intros_state.load(int(event.guild_id))
-    if (
-        st.channel_id is None
-        or st.missing_role_id is None
-        or int(event.channel_id) != st.channel_id
-    ):
+    if st.channel_id is None or int(event.channel_id) != st.channel_id:
+        return
+
+    st.record_post(int(event.author_id), int(event.message_id))
+    intros_state.save(st)
+
+    if st.missing_role_id is None:
         return
 
     member = event.member or bot.cache.get_member(event.guild_id, event.author_id)
@@ -64,6 +67,35 @@ async def _handle_intro_post(event: hikari.GuildMessageCreateEvent) -> None:
         )
 
 
+@loader.listener(hikari.GuildMessageDeleteEvent)
+async def on_intro_delete(event: hikari.GuildMessageDeleteEvent) -> None:
+    """Keep the poster index in step when an intro is deleted."""
+    try:
+        _forget_posts(event.guild_id, event.channel_id, {int(event.message_id)})
+    except Exception:
+        logger.exception("Error handling intro delete", guild_id=int(event.guild_id))
+
+
+@loader.listener(hikari.GuildBulkMessageDeleteEvent)
+async def on_intro_bulk_delete(event: hikari.GuildBulkMessageDeleteEvent) -> None:
+    try:
+        _forget_posts(
+            event.guild_id, event.channel_id, {int(m) for m in event.message_ids}
+        )
+    except Exception:
+        logger.exception("Error handling intro delete", guild_id=int(event.guild_id))
+
+
+def _forget_posts(
+    guild_id: hikari.Snowflake, channel_id: hikari.Snowflake, message_ids: set[int]
+) -> None:
+    st = intros_state.load(int(guild_id))
+    if st.channel_id != int(channel_id):
+        return
+    if st.forget_posts(message_ids):
+        intros_state.save(st)
+
+
 async def _remove_missing_role(
     bot: DragonpawBot,
     guild_id: hikari.Snowflakeish,
@@ -73,7 +105,10 @@ async def _remove_missing_role(
     """Strip the missing-intro role. Returns True if removed."""
     assert st.missing_role_id is not None
     try:
-        await bot.rest.remove_role_from_member(guild_id, member.id, st.missing_role_id)
+        async with scheduler.slot(f"member_roles:{guild_id}", Priority.EVENT):
+            await bot.rest.remove_role_from_member(
+                guild_id, member.id, st.missing_role_id
+            )
     except hikari.NotFoundError:
         return False
     except hikari.ForbiddenError:
@@ -1,6 +1,24 @@
+import datetime
+
+import pydantic
+
 from dragonpaw_bot.state_store import GuildStateBase
 
 
+class IntroPoster(pydantic.BaseModel):
+    """One member's unpinned posts in the intros channel, newest first."""
+
+    message_ids: list[int] = []
+
+    @property
+    def newest_message_id(self) -> int:
+        return self.message_ids[0]
+
+    @property
+    def count(self) -> int:
+        return len(self.message_ids)
+
+
 class IntrosGuildState(GuildStateBase):
     channel_id: int | None = None
     channel_name: str = ""
@@ -8,3 +26,32 @@ class IntrosGuildState(GuildStateBase):
     required_role_name: str = ""
     missing_role_id: int | None = None
     missing_role_name: str = ""
+    # Who has posted, kept live by the message listeners and rebuilt from a full
+    # channel walk whenever posters_reconciled_at is unset or stale.
+    posters: dict[int, IntroPoster] = pydantic.Field(default_factory=dict)
+    posters_reconciled_at: datetime.datetime | None = None
+
+    def record_post(self, author_id: int, message_id: int) -> None:
+        poster = self.posters.setdefault(author_id, IntroPoster())
+        if message_id not in poster.message_ids:
+            poster.message_ids.append(message_id)
+            poster.message_ids.sort(reverse=True)
+
+    def forget_posts(self, message_ids: set[int]) -> bool:
+        """Drop deleted messages from the index. Returns True if anything changed."""
+        changed = False
+        for author_id, poster in list(self.posters.items()):
+            kept = [m for m in poster.message_ids if m not in message_ids]
+            if len(kept) == poster.count:
+                continue
+            changed = True
+            if kept:
+                poster.message_ids = kept
+            else:
+                del self.posters[author_id]
+        return changed
+
+    def reset_posters(self) -> None:
+        """Forget the index so the next daily run rebuilds it from the channel."""
+        self.posters = {}
+        self.posters_reconciled_at = None
@@ -7,16 +7,47 @@ import hikari  # noqa: TC002 — needed at runtime for DI annotation resolution
 import lightbulb
 import structlog
 
-from dragonpaw_bot.context import ChannelContext, GuildContext
+from dragonpaw_bot import metrics
+from dragonpaw_bot.context import (
+    ChannelContext,
+    GuildContext,
+    GuildThreads,
+    throttled_checkpoint,
+)
 from dragonpaw_bot.plugins.media_channels import state as media_state
 
 if TYPE_CHECKING:
     from dragonpaw_bot.bot import DragonpawBot
+    from dragonpaw_bot.plugins.media_channels.models import MediaGuildState
 
 logger = structlog.get_logger(__name__)
 loader = lightbulb.Loader()
 
 
+async def _cleanup_guild(gc: GuildContext, st: MediaGuildState) -> None:
+    """Clean every expiring media channel concurrently, then persist moved purge marks."""
+    entries = [entry for entry in st.channels if entry.expiry_minutes is not None]
+    before = [entry.purge_marks.model_copy() for entry in entries]
+
+    threads = GuildThreads(gc.bot, gc.guild_id)
+
+    checkpoint = throttled_checkpoint(lambda: media_state.save(st))
+
+    await asyncio.gather(
+        *(
+            ChannelContext.from_entry(gc, entry).run_cleanup_isolated(
+                entry.expiry_minutes,  # type: ignore[arg-type]  # filtered above
+                entry.purge_marks,
+                checkpoint,
+                threads,
+            )
+            for entry in entries
+        )
+    )
+    if [entry.purge_marks for entry in entries] != before:
+        media_state.save(st)
+
+
 async def media_channels_hourly(bot: hikari.GatewayBot) -> None:
     """Hourly task: purge old messages from media channels with expiry configured (all concurrent)."""
     bot = cast("DragonpawBot", bot)
@@ -27,10 +58,9 @@ async def media_channels_hourly(bot: hikari.GatewayBot) -> None:
     for guild in guilds:
         try:
             gc = GuildContext.from_guild(bot, guild)
-            for entry in media_state.load(int(guild.id)).channels:
-                if entry.expiry_minutes is not None:
-                    cc = ChannelContext.from_entry(gc, entry)
-                    tasks.append(cc.run_cleanup_isolated(entry.expiry_minutes))
+            st = media_state.load(int(guild.id))
+            if any(entry.expiry_minutes is not None for entry in st.channels):
+                tasks.append(_cleanup_guild(gc, st))
         except Exception:
             logger.exception("Error building cleanup tasks for guild", guild=guild.name)
     if tasks:
@@ -38,5 +68,6 @@ async def media_channels_hourly(bot: hikari.GatewayBot) -> None:
 
 
 @loader.task(lightbulb.crontrigger("30 * * * *"))
+@metrics.timed_task
 async def _media_channels_hourly_task(bot: hikari.GatewayBot) -> None:
     await media_channels_hourly(bot)
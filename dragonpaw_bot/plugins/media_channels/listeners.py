@@ -11,6 +11,7 @@ import structlog
 
 from dragonpaw_bot.context import GuildContext
 from dragonpaw_bot.plugins.media_channels import state as media_state
+from dragonpaw_bot.rest_scheduler import Priority, scheduler
 from dragonpaw_bot.utils import create_background_task, message_has_media
 
 if TYPE_CHECKING:
@@ -29,7 +30,8 @@ async def _delete_after(
 ) -> None:
     await asyncio.sleep(delay)
     try:
-        await bot.rest.delete_message(channel=channel_id, message=message_id)
+        async with scheduler.slot(f"delete_message:{channel_id}", Priority.EVENT):
+            await bot.rest.delete_message(channel=channel_id, message=message_id)
     except hikari.NotFoundError:
         pass  # Already deleted — expected race condition
     except hikari.ForbiddenError:
@@ -59,7 +61,8 @@ async def on_message(event: hikari.GuildMessageCreateEvent) -> None:
         return
 
     try:
-        await bot.rest.delete_message(channel=event.channel_id, message=msg.id)
+        async with scheduler.slot(f"delete_message:{event.channel_id}", Priority.EVENT):
+            await bot.rest.delete_message(channel=event.channel_id, message=msg.id)
     except hikari.NotFoundError:
         return  # User deleted their own message — enforcement is moot
     except hikari.ForbiddenError:
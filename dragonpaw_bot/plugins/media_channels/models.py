@@ -1,6 +1,7 @@
 import pydantic
 
 from dragonpaw_bot.state_store import GuildStateBase
+from dragonpaw_bot.structs import PurgeMarks
 
 
 class MediaChannelEntry(pydantic.BaseModel):
@@ -9,6 +10,7 @@ class MediaChannelEntry(pydantic.BaseModel):
     redirect_channel_id: int | None = None  # Per-channel redirect hint
     redirect_channel_name: str | None = None
     expiry_minutes: int | None = pydantic.Field(default=None, gt=0)
+    purge_marks: PurgeMarks = pydantic.Field(default_factory=PurgeMarks)
 
 
 class MediaGuildState(GuildStateBase):
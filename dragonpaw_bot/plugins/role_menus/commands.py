@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime
 import re
+import time
 import tomllib
 from typing import TYPE_CHECKING
 
@@ -15,6 +16,7 @@ from dragonpaw_bot.context import (
     CHANNEL_POST_PERMS,
     ChannelContext,
     GuildContext,
+    OutgoingMessage,
     check_channel_perms,
     check_role_manageable,
 )
@@ -28,7 +30,7 @@ from dragonpaw_bot.plugins.role_menus.models import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterable, Mapping
 
     from dragonpaw_bot.bot import DragonpawBot
 
@@ -138,7 +140,8 @@ async def configure_role_menus(
 ) -> list[str]:
     """Setup the role channel for the guild.
 
-    This wipes out all old role messages and sends new ones with select menus.
+    Each menu is one message with its select. Menus that haven't changed since
+    the last setup are left alone and changed ones are edited in place.
     """
     log = gc.logger
     errors: list[str] = []
@@ -161,9 +164,11 @@ async def configure_role_menus(
 
     emoji_map = await utils.guild_emojis(gc)
 
-    log.debug("Trying to delete old role menus...")
     cc = ChannelContext.from_channel(gc, int(channel.id), channel.name or "")
-    await cc.delete_my_messages()
+    previous = state.load(int(gc.guild_id))
+    posted = previous.posted if previous.role_channel_id == int(channel.id) else []
+    messages: list[OutgoingMessage] = []
+    pending: list[tuple[int, RoleMenuConfig, str, list[str]]] = []
 
     guild_state = RoleMenuGuildState(
         guild_id=int(gc.guild_id),
@@ -219,24 +224,29 @@ async def configure_role_menus(
                 "No valid options; menu posted with no select",
                 menu=menu.name,
             )
-            await channel.send(embed=embed)
+            messages.append(OutgoingMessage(embed=embed))
             continue
 
         select = build_menu_select(menu_slug, menu, valid_options, emoji_map)
         row = hikari.impl.MessageActionRowBuilder().add_component(select)
-        message = await channel.send(embed=embed, component=row)
-
-        menu_state = RoleMenuState(
-            menu_slug=menu_slug,
-            menu_name=menu.name,
-            message_id=int(message.id),
-            single=menu.single,
-            option_role_ids={
-                role_name: int(role_map[role_name].id)
-                for role_name, _, _ in valid_options
-            },
+        pending.append(
+            (len(messages), menu, menu_slug, [name for name, _, _ in valid_options])
+        )
+        messages.append(OutgoingMessage(embed=embed, component=row))
+
+    guild_state.posted = await cc.publish(messages, posted)
+    for index, menu, menu_slug, role_names in pending:
+        guild_state.menus.append(
+            RoleMenuState(
+                menu_slug=menu_slug,
+                menu_name=menu.name,
+                message_id=guild_state.posted[index].message_id,
+                single=menu.single,
+                option_role_ids={
+                    role_name: int(role_map[role_name].id) for role_name in role_names
+                },
+            )
         )
-        guild_state.menus.append(menu_state)
 
     state.save(guild_state)
     return errors
@@ -263,6 +273,17 @@ def _find_menu_state(
     return None
 
 
+async def _can_manage_all(
+    bot: DragonpawBot, guild_id: hikari.Snowflake, role_ids: Iterable[int]
+) -> bool:
+    """Whether the cache says the bot may grant and revoke every one of these roles."""
+    for role_id in role_ids:
+        role = bot.cache.get_role(role_id)
+        if role is None or await check_role_manageable(bot, guild_id, role):
+            return False
+    return True
+
+
 async def _apply_role_changes(
     interaction: hikari.ComponentInteraction,
     guild_state: RoleMenuGuildState,
@@ -270,7 +291,63 @@ async def _apply_role_changes(
     selected_roles: set[str],
     member_role_ids: set[hikari.Snowflake],
 ) -> tuple[list[str], list[str], list[str]]:
-    """Add/remove roles based on the diff. Returns (added, removed, failed) name lists."""
+    """Add/remove roles based on the diff. Returns (added, removed, failed) name lists.
+
+    Several changes go out as one `edit_member` call when the bot can manage
+    every role involved. Otherwise, or if that call is refused, each role is
+    changed on its own so the summary can name the ones that failed.
+    """
+    bot: DragonpawBot = interaction.app  # type: ignore[assignment]
+    guild_snowflake = hikari.Snowflake(guild_state.guild_id)
+
+    to_add: dict[str, int] = {}
+    to_remove: dict[str, int] = {}
+    for role_name, role_id in menu_state.option_role_ids.items():
+        has_role = hikari.Snowflake(role_id) in member_role_ids
+        wants_role = role_name in selected_roles
+        if wants_role and not has_role:
+            to_add[role_name] = role_id
+        elif has_role and not wants_role:
+            to_remove[role_name] = role_id
+
+    if len(to_add) + len(to_remove) > 1 and await _can_manage_all(
+        bot, guild_snowflake, [*to_add.values(), *to_remove.values()]
+    ):
+        # The edit replaces the whole role list, so start from the freshest
+        # copy we have: the interaction's may miss changes made since.
+        cached = bot.cache.get_member(guild_snowflake, interaction.user.id)
+        current = set(cached.role_ids) if cached else set(member_role_ids)
+        # hikari lists @everyone (the guild id) among a member's roles.
+        current.discard(guild_snowflake)
+        roles = sorted(
+            (current - {hikari.Snowflake(r) for r in to_remove.values()})
+            | {hikari.Snowflake(r) for r in to_add.values()}
+        )
+        try:
+            await bot.rest.edit_member(
+                guild_snowflake,
+                interaction.user.id,
+                roles=roles,
+                reason="Role menu selection",
+            )
+        except hikari.HTTPError as exc:
+            logger.info(
+                "Bulk role change refused, retrying one role at a time",
+                error=str(exc),
+            )
+        else:
+            logger.debug("Applied role menu changes", rest_calls=1)
+            return list(to_add), list(to_remove), []
+
+    return await _apply_roles_one_by_one(interaction, guild_state, to_add, to_remove)
+
+
+async def _apply_roles_one_by_one(
+    interaction: hikari.ComponentInteraction,
+    guild_state: RoleMenuGuildState,
+    to_add: dict[str, int],
+    to_remove: dict[str, int],
+) -> tuple[list[str], list[str], list[str]]:
     bot: DragonpawBot = interaction.app  # type: ignore[assignment]
     gc = GuildContext.from_interaction(interaction)
     guild_snowflake = hikari.Snowflake(guild_state.guild_id)
@@ -278,44 +355,44 @@ async def _apply_role_changes(
     removed: list[str] = []
     failed: list[str] = []
 
-    for role_name, role_id in menu_state.option_role_ids.items():
-        snowflake_id = hikari.Snowflake(role_id)
-        has_role = snowflake_id in member_role_ids
-        wants_role = role_name in selected_roles
+    for role_name, role_id in to_add.items():
+        try:
+            await bot.rest.add_role_to_member(
+                guild=guild_snowflake,
+                user=interaction.user.id,
+                role=hikari.Snowflake(role_id),
+                reason="Role menu selection",
+            )
+            added.append(role_name)
+        except hikari.ForbiddenError:
+            display = guild_state.role_names.get(role_id, role_name)
+            failed.append(display)
+            await gc.log(
+                f"🤯 I couldn't add the **{display}** role — my paws got blocked! "
+                "Please make sure my role is above it in the server's role hierarchy. 🐉",
+            )
 
-        if wants_role and not has_role:
-            try:
-                await bot.rest.add_role_to_member(
-                    guild=guild_snowflake,
-                    user=interaction.user.id,
-                    role=snowflake_id,
-                    reason="Role menu selection",
-                )
-                added.append(role_name)
-            except hikari.ForbiddenError:
-                display = guild_state.role_names.get(role_id, role_name)
-                failed.append(display)
-                await gc.log(
-                    f"🤯 I couldn't add the **{display}** role — my paws got blocked! "
-                    "Please make sure my role is above it in the server's role hierarchy. 🐉",
-                )
-        elif has_role and not wants_role:
-            try:
-                await bot.rest.remove_role_from_member(
-                    guild=guild_snowflake,
-                    user=interaction.user.id,
-                    role=snowflake_id,
-                    reason="Role menu selection",
-                )
-                removed.append(role_name)
-            except hikari.ForbiddenError:
-                display = guild_state.role_names.get(role_id, role_name)
-                failed.append(display)
-                await gc.log(
-                    f"🤯 I couldn't remove the **{display}** role — my paws got blocked! "
-                    "Please make sure my role is above it in the server's role hierarchy. 🐉",
-                )
+    for role_name, role_id in to_remove.items():
+        try:
+            await bot.rest.remove_role_from_member(
+                guild=guild_snowflake,
+                user=interaction.user.id,
+                role=hikari.Snowflake(role_id),
+                reason="Role menu selection",
+            )
+            removed.append(role_name)
+        except hikari.ForbiddenError:
+            display = guild_state.role_names.get(role_id, role_name)
+            failed.append(display)
+            await gc.log(
+                f"🤯 I couldn't remove the **{display}** role — my paws got blocked! "
+                "Please make sure my role is above it in the server's role hierarchy. 🐉",
+            )
 
+    if to_add or to_remove:
+        logger.debug(
+            "Applied role menu changes", rest_calls=len(to_add) + len(to_remove)
+        )
     return added, removed, failed
 
 
@@ -379,9 +456,11 @@ async def handle_role_menu_interaction(
     selected_roles = set(interaction.values) if interaction.values else set()
     member_role_ids = set(interaction.member.role_ids)
 
+    started = time.monotonic()
     added, removed, failed = await _apply_role_changes(
         interaction, guild_state, menu_state, selected_roles, member_role_ids
     )
+    apply_ms = round((time.monotonic() - started) * 1000)
 
     try:
         await interaction.edit_initial_response(
@@ -399,6 +478,7 @@ async def handle_role_menu_interaction(
             menu=menu_state.menu_name,
             added=added or None,
             removed=removed or None,
+            apply_ms=apply_ms,
         )
 
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pydantic
 
 from dragonpaw_bot.state_store import GuildStateBase
+from dragonpaw_bot.structs import PostedMessage  # noqa: TC001
 
 
 class RoleMenuOptionConfig(pydantic.BaseModel):
@@ -35,3 +36,5 @@ class RoleMenuGuildState(GuildStateBase):
     role_channel_id: int | None = None
     role_names: dict[int, str] = pydantic.Field(default_factory=dict)
     menus: list[RoleMenuState] = pydantic.Field(default_factory=list)
+    # What's in the role channel, in order, so a re-setup only edits changes.
+    posted: list[PostedMessage] = pydantic.Field(default_factory=list)
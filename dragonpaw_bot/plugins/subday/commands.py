@@ -7,7 +7,7 @@ import hikari
 import lightbulb
 import structlog
 
-from dragonpaw_bot import utils
+from dragonpaw_bot import dm, utils
 from dragonpaw_bot.colors import (
     SOLARIZED_CYAN,
     SOLARIZED_MAGENTA,
@@ -15,7 +15,7 @@ from dragonpaw_bot.colors import (
     SOLARIZED_YELLOW,
 )
 from dragonpaw_bot.context import GuildContext, role_list_label
-from dragonpaw_bot.plugins.subday import chart, prompts, state
+from dragonpaw_bot.plugins.subday import prompts, state
 from dragonpaw_bot.plugins.subday.constants import (
     MAX_EMBEDS_PER_MESSAGE,
     MILESTONE_WEEKS,
@@ -147,10 +147,9 @@ async def _dm_completion(
 ) -> None:
     """DM the target their completion embed and star chart."""
     try:
-        dm = await target.user.fetch_dm_channel()
         embed = _regular_completion_embed(target, week)
         embed.set_image(chart_bytes)
-        await dm.send(embed=embed)
+        await dm.send(target.app, target, embed=embed)
         logger.info(
             "Sent completion DM",
             guild=guild_name,
@@ -166,6 +165,15 @@ async def _dm_completion(
         )
 
 
+def _render_star_chart(
+    username: str, current_week: int, week_completed: bool
+) -> hikari.Bytes:
+    # Pillow is loaded the first time a chart is drawn, not at startup.
+    from dragonpaw_bot.plugins.subday import chart  # noqa: PLC0415
+
+    return chart.render_star_chart(username, current_week, week_completed)
+
+
 def _progress_footer(p: SubDayParticipant) -> str:
     """The Progress/Signed-up lines shared by the status embeds."""
     return (
@@ -243,7 +251,7 @@ async def _post_achievement(
             )
 
     # Generate star chart attachment (use guild display name)
-    chart_bytes = chart.render_star_chart(
+    chart_bytes = _render_star_chart(
         username=target.display_name,
         current_week=week,
         week_completed=True,
@@ -385,8 +393,7 @@ async def _do_signup_async(
     )
 
     try:
-        dm = await user.fetch_dm_channel()
-        await dm.send(embeds=[welcome_embed, prompt_embed])
+        await dm.send(bot, user, embeds=[welcome_embed, prompt_embed])
     except hikari.HTTPError as exc:
         logger.warning(
             "Cannot DM user for SubDay signup",
@@ -674,7 +681,7 @@ def _own_progress_embed(
 ) -> hikari.Embed:
     """Build the caller's own progress embed with star chart."""
     if p.graduated:
-        chart_bytes = chart.render_star_chart(
+        chart_bytes = _render_star_chart(
             username=display_name,
             current_week=p.current_week,
             week_completed=p.week_completed,
@@ -719,7 +726,7 @@ def _own_progress_embed(
 
     status_text += _milestone_prize_teaser(p.current_week, cfg)
 
-    chart_bytes = chart.render_star_chart(
+    chart_bytes = _render_star_chart(
         username=display_name,
         current_week=p.current_week,
         week_completed=p.week_completed,
@@ -882,8 +889,9 @@ class SubDayOwner(
         )
 
         try:
-            dm = await target.fetch_dm_channel()
             await dm.send(
+                gc.bot,
+                target,
                 content=(
                     f"**{ctx.user.mention}** in **{guild.name}** has asked you to be their "
                     f"owner for the **Where I am Led** journal program.\n\n"
@@ -940,9 +948,7 @@ async def _notify_sub_of_owner_decision(  # noqa: PLR0913
         else f"😢 **{owner_name}** declined ownership of **{sub_name}** 🐾"
     )
     try:
-        sub_user = await bot.rest.fetch_user(hikari.Snowflake(sub_user_id))
-        dm = await sub_user.fetch_dm_channel()
-        await dm.send(dm_text)
+        await dm.send(bot, sub_user_id, content=dm_text)
     except hikari.HTTPError:
         logger.warning(
             "Could not DM sub about owner decision",
@@ -1367,11 +1373,14 @@ class SubDayComplete(
                 owner_member = await gc.bot.rest.fetch_member(
                     gc.guild_id, hikari.Snowflake(participant.owner_id)
                 )
-                dm = await owner_member.user.fetch_dm_channel()
                 await dm.send(
-                    f"*happy tail wag* 🐉✨ <@{target_id}> just finished "
-                    f"**Week {week}** of Where I am Led! "
-                    f"They did a great job and deserve some praise~ 💜"
+                    gc.bot,
+                    owner_member,
+                    content=(
+                        f"*happy tail wag* 🐉✨ <@{target_id}> just finished "
+                        f"**Week {week}** of Where I am Led! "
+                        f"They did a great job and deserve some praise~ 💜"
+                    ),
                 )
                 logger.info(
                     "Notified owner of completion",
@@ -1541,8 +1550,7 @@ class SubDayResend(
         prompt = prompts.load_week(participant.current_week)
         embeds = prompts.build_resend_dm_embeds(prompt)
         try:
-            dm = await ctx.user.fetch_dm_channel()
-            await dm.send(embeds=embeds)
+            await dm.send(gc.bot, ctx.user, embeds=embeds)
         except hikari.ForbiddenError:
             logger.warning(
                 "Cannot DM user for SubDay resend (DMs disabled)",
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import asyncio
 from typing import TYPE_CHECKING, cast
 
-import hikari
+import hikari  # noqa: TC002 — needed at runtime for DI annotation resolution
 import lightbulb
 import structlog
 
+from dragonpaw_bot import dm, metrics
 from dragonpaw_bot.context import GuildContext
 from dragonpaw_bot.plugins.subday import prompts, state
 from dragonpaw_bot.utils import guild_member
@@ -33,61 +33,48 @@ async def _forward_owner_prompts(
     """Forward prompt copies to owners after the main Sunday loop."""
     log = logger.bind(guild=guild.name)
     owner_changed = False
-    for owner_id, sub_prompt_list in owner_prompts.items():
-        # Verify owner is still in the guild
-        if await guild_member(bot, guild.id, owner_id) is None:
-            log.info(
-                "Owner left the server, clearing owner references",
-                owner_id=owner_id,
-            )
-            for p in guild_state.participants.values():
-                if p.owner_id == owner_id:
-                    p.owner_id = None
-            owner_changed = True
-            continue
+    async with dm.DMBatch(bot, "subday owner prompts", log=log) as batch:
+        for owner_id, sub_prompt_list in owner_prompts.items():
+            # Verify owner is still in the guild
+            owner = await guild_member(bot, guild.id, owner_id)
+            if owner is None:
+                log.info(
+                    "Owner left the server, clearing owner references",
+                    owner_id=owner_id,
+                )
+                for p in guild_state.participants.values():
+                    if p.owner_id == owner_id:
+                        p.owner_id = None
+                owner_changed = True
+                continue
 
-        # Send one DM per sub
-        try:
-            owner_user = await bot.rest.fetch_user(hikari.Snowflake(owner_id))
-            dm = await owner_user.fetch_dm_channel()
+            # Send one DM per sub
             for sub_uid, prompt in sub_prompt_list:
-                try:
-                    owner_embeds = prompts.build_owner_dm_embeds(prompt, sub_uid)
-                    await dm.send(embeds=owner_embeds)
-                    log.info(
-                        "Sent owner prompt copy for sub",
-                        owner_id=owner_id,
-                        sub_uid=sub_uid,
-                        week=prompt.week,
-                    )
-                except (hikari.ForbiddenError, hikari.HTTPError) as exc:
-                    log.warning(
-                        "Failed to DM owner prompt for sub",
-                        owner_id=owner_id,
-                        sub_uid=sub_uid,
-                        error=str(exc),
-                    )
-                await asyncio.sleep(1)
-        except (hikari.ForbiddenError, hikari.HTTPError) as exc:
-            log.warning(
-                "Cannot DM owner",
-                owner_id=owner_id,
-                error=str(exc),
-            )
+                batch.send(
+                    owner.user,
+                    embeds=prompts.build_owner_dm_embeds(prompt, sub_uid),
+                    log=log.bind(owner_id=owner_id, sub_uid=sub_uid, week=prompt.week),
+                )
 
     if owner_changed:
         state.save(guild_state)
         log.info("Saved state after clearing departed owners")
 
 
-async def _advance_participant(
+async def _advance_participant(  # noqa: PLR0913
     bot: DragonpawBot,
     guild: hikari.Guild,
     uid: int,
     participant: SubDayParticipant,
     owner_prompts: dict[int, list[tuple[int, prompts.WeekPrompt]]],
+    *,
+    batch: dm.DMBatch,
 ) -> bool | None:
-    """Advance one participant. Returns True if changed, None if should be removed."""
+    """Advance one participant. Returns True if changed, None if should be removed.
+
+    The new week's prompt is queued on `batch`; once it's delivered the sub's
+    owner, if any, is queued for a copy in `owner_prompts`.
+    """
     log = logger.bind(guild=guild.name, user_id=uid)
     if not participant.week_completed:
         log.debug(
@@ -114,23 +101,18 @@ async def _advance_participant(
     participant.reminder_sent = False
     log.info("Advanced to week", week=participant.current_week)
 
-    try:
-        prompt = prompts.load_week(participant.current_week)
-        dm_embeds = prompts.build_weekly_dm_embeds(prompt)
-        dm = await member.user.fetch_dm_channel()
-        await dm.send(embeds=dm_embeds)
-        log.info(
-            "Sent SubDay week prompt",
-            week=participant.current_week,
-        )
+    prompt = prompts.load_week(participant.current_week)
+
+    def queue_owner_copy() -> None:
         if participant.owner_id:
             owner_prompts.setdefault(participant.owner_id, []).append((uid, prompt))
-    except hikari.ForbiddenError:
-        log.warning("Cannot DM user for SubDay prompt (DMs disabled)")
-    except hikari.HTTPError as exc:
-        log.warning("Failed to DM SubDay prompt", error=str(exc))
 
-    await asyncio.sleep(1)
+    batch.send(
+        member.user,
+        embeds=prompts.build_weekly_dm_embeds(prompt),
+        on_sent=queue_owner_copy,
+        log=log.bind(week=participant.current_week),
+    )
     return True
 
 
@@ -168,16 +150,19 @@ async def _process_guild_prompts(bot: DragonpawBot, guild: hikari.Guild) -> None
     owner_prompts: dict[int, list[tuple[int, prompts.WeekPrompt]]] = {}
     advanced: list[tuple[int, int]] = []
 
-    for uid, participant in guild_state.participants.items():
-        old_week = participant.current_week
-        result = await _advance_participant(bot, guild, uid, participant, owner_prompts)
-        if result is None:
-            to_remove.append(uid)
-            changed = True
-        elif result:
-            changed = True
-            if participant.current_week > old_week:
-                advanced.append((uid, participant.current_week))
+    async with dm.DMBatch(bot, "subday prompts", log=log) as batch:
+        for uid, participant in guild_state.participants.items():
+            old_week = participant.current_week
+            result = await _advance_participant(
+                bot, guild, uid, participant, owner_prompts, batch=batch
+            )
+            if result is None:
+                to_remove.append(uid)
+                changed = True
+            elif result:
+                changed = True
+                if participant.current_week > old_week:
+                    advanced.append((uid, participant.current_week))
 
     if to_remove:
         _cleanup_removed_participants(guild_state, to_remove)
@@ -195,6 +180,11 @@ async def _process_guild_prompts(bot: DragonpawBot, guild: hikari.Guild) -> None
             advanced_member = await guild_member(bot, guild.id, uid)
             who = advanced_member.display_name if advanced_member else str(uid)
             lines.append(f"- **{who}** → Week {week}")
+        if batch.report.undelivered:
+            lines.append(
+                f"⚠️ {batch.report.undelivered} prompt(s) couldn't be delivered "
+                "by DM — their DMs may be closed."
+            )
         await gc.log(
             f"📬 Sunday SubDay run complete! Sent next week's prompt to "
             f"{len(advanced)} participant(s):\n" + "\n".join(lines)
@@ -205,6 +195,7 @@ async def _process_guild_prompts(bot: DragonpawBot, guild: hikari.Guild) -> None
 
 
 @loader.task(lightbulb.crontrigger("0 14 * * 0"))
+@metrics.timed_task
 async def subday_sunday_prompts(bot: hikari.GatewayBot) -> None:
     """Advance completed participants and DM their next prompt."""
     bot = cast("DragonpawBot", bot)
@@ -235,76 +226,51 @@ async def _process_guild_friday_reminders(
         return
 
     gc = GuildContext.from_guild(bot, guild)
-    any_sent = False
-
-    for uid, participant in guild_state.participants.items():
-        if participant.week_completed or participant.reminder_sent:
-            continue
-
-        # Fetch member, skip if they left
-        member = await guild_member(bot, guild.id, uid)
-        if member is None:
-            log.info("Participant left server, skipping reminder", user_id=uid)
-            continue
-
-        # DM the sub
-        try:
-            dm = await member.user.fetch_dm_channel()
-            await dm.send(
-                f"*nuzzles gently* 🐉 Hey hey! Just a little Friday reminder — "
-                f"you still have your **Week {participant.current_week}** journal to finish! "
-                f"You've got this~ 💪🐾"
+    reminded: list[tuple[str, int]] = []
+
+    async with dm.DMBatch(bot, "subday friday reminders", log=log) as batch:
+        for uid, participant in guild_state.participants.items():
+            if participant.week_completed or participant.reminder_sent:
+                continue
+
+            # Fetch member, skip if they left
+            member = await guild_member(bot, guild.id, uid)
+            if member is None:
+                log.info("Participant left server, skipping reminder", user_id=uid)
+                continue
+
+            # DM the sub
+            batch.send(
+                member.user,
+                content=(
+                    f"*nuzzles gently* 🐉 Hey hey! Just a little Friday reminder — "
+                    f"you still have your **Week {participant.current_week}** journal to finish! "
+                    f"You've got this~ 💪🐾"
+                ),
+                log=log.bind(week=participant.current_week),
             )
-            log.info(
-                "Sent Friday reminder to sub",
-                user_id=uid,
-                week=participant.current_week,
-            )
-        except hikari.ForbiddenError:
-            log.warning("Cannot DM sub for Friday reminder (DMs disabled)", user_id=uid)
-        except hikari.HTTPError as exc:
-            log.warning("Failed to DM sub Friday reminder", user_id=uid, error=str(exc))
-
-        await asyncio.sleep(1)
 
-        # DM the owner if set
-        if participant.owner_id:
-            try:
-                owner_user = await bot.rest.fetch_user(
-                    hikari.Snowflake(participant.owner_id)
+            # DM the owner if set
+            if participant.owner_id:
+                batch.send(
+                    participant.owner_id,
+                    content=(
+                        f"*tugs on sleeve* 🐉 Psst! <@{uid}> hasn't finished their "
+                        f"**Week {participant.current_week}** journal yet. "
+                        f"Maybe give them a little nudge? 💜"
+                    ),
+                    log=log.bind(sub_id=uid, week=participant.current_week),
                 )
-                owner_dm = await owner_user.fetch_dm_channel()
-                await owner_dm.send(
-                    f"*tugs on sleeve* 🐉 Psst! <@{uid}> hasn't finished their "
-                    f"**Week {participant.current_week}** journal yet. "
-                    f"Maybe give them a little nudge? 💜"
-                )
-                log.info(
-                    "Sent Friday owner reminder",
-                    owner_id=participant.owner_id,
-                    sub_id=uid,
-                    week=participant.current_week,
-                )
-            except hikari.ForbiddenError:
-                log.warning(
-                    "Cannot DM owner for Friday reminder (DMs disabled)",
-                    owner_id=participant.owner_id,
-                )
-            except hikari.HTTPError as exc:
-                log.warning(
-                    "Failed to DM owner Friday reminder",
-                    owner_id=participant.owner_id,
-                    error=str(exc),
-                )
-            await asyncio.sleep(1)
 
-        participant.reminder_sent = True
-        any_sent = True
+            participant.reminder_sent = True
+            reminded.append((member.display_name, participant.current_week))
+
+    for name, week in reminded:
         await gc.log(
-            f"🔔 *gentle nudge delivered* I reminded **{member.display_name}** about Week {participant.current_week}~ 🐾"
+            f"🔔 *gentle nudge delivered* I reminded **{name}** about Week {week}~ 🐾"
         )
 
-    if any_sent:
+    if reminded:
         state.save(guild_state)
         log.info("Friday reminders complete, state saved")
     else:
@@ -312,6 +278,7 @@ async def _process_guild_friday_reminders(
 
 
 @loader.task(lightbulb.crontrigger("0 20 * * 5"))
+@metrics.timed_task
 async def subday_friday_reminders(bot: hikari.GatewayBot) -> None:
     """Friday noon PST (20:00 UTC): remind incomplete participants."""
     bot = cast("DragonpawBot", bot)
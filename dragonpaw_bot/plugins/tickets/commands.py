@@ -39,7 +39,7 @@ def _find_open_ticket(
     st: TicketGuildState, user_id: hikari.Snowflakeish
 ) -> OpenTicket | None:
     """The user's open ticket in this guild, if any."""
-    return next((t for t in st.open_tickets if t.user_id == user_id), None)
+    return st.ticket_for_user(int(user_id))
 
 
 async def _check_create_perms(
@@ -228,7 +228,7 @@ async def handle_topic_modal(interaction: hikari.ModalInteraction) -> None:
 
     # Persist ticket — re-load state to capture any concurrent mutations since the initial load
     st = tickets_state.load(int(interaction.guild_id))
-    st.open_tickets.append(
+    st.open_ticket(
         OpenTicket(
             user_id=int(interaction.user.id),
             channel_id=int(channel.id),
@@ -311,16 +311,14 @@ async def handle_ticket_close_confirm(interaction: hikari.ComponentInteraction)
     gc = GuildContext.from_interaction(interaction)
     st = tickets_state.load(int(interaction.guild_id))
 
-    ticket = next((t for t in st.open_tickets if t.channel_id == channel_id), None)
+    ticket = st.close_ticket(channel_id)
     if ticket:
         opener = gc.bot.cache.get_member(interaction.guild_id, ticket.user_id)
         opener_name = opener.display_name if opener else str(ticket.user_id)
+        tickets_state.save(st)
     else:
         opener_name = "someone"
 
-    st.open_tickets = [t for t in st.open_tickets if t.channel_id != channel_id]
-    tickets_state.save(st)
-
     await gc.delete_channel(channel_id)
 
     closer = (
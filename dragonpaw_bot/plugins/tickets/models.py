@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 import pydantic
 
 from dragonpaw_bot.state_store import GuildStateBase
@@ -16,3 +18,34 @@ class TicketGuildState(GuildStateBase):
     staff_role_id: int | None = None
     required_role_id: int | None = None
     open_tickets: list[OpenTicket] = pydantic.Field(default_factory=list)
+
+    # Lookups for the ticket buttons, derived from open_tickets when the state
+    # is built and kept in step by open_ticket/close_ticket. Not persisted.
+    _by_user: dict[int, OpenTicket] = pydantic.PrivateAttr(default_factory=dict)
+    _by_channel: dict[int, OpenTicket] = pydantic.PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: Any, /) -> None:
+        for ticket in self.open_tickets:
+            self._by_user[ticket.user_id] = ticket
+            self._by_channel[ticket.channel_id] = ticket
+
+    def ticket_for_user(self, user_id: int) -> OpenTicket | None:
+        return self._by_user.get(user_id)
+
+    def ticket_in_channel(self, channel_id: int) -> OpenTicket | None:
+        return self._by_channel.get(channel_id)
+
+    def open_ticket(self, ticket: OpenTicket) -> None:
+        self.open_tickets.append(ticket)
+        self._by_user[ticket.user_id] = ticket
+        self._by_channel[ticket.channel_id] = ticket
+
+    def close_ticket(self, channel_id: int) -> OpenTicket | None:
+        """Drop the ticket in this channel, returning it if there was one."""
+        ticket = self._by_channel.pop(channel_id, None)
+        if ticket is None:
+            return None
+        self.open_tickets.remove(ticket)
+        if self._by_user.get(ticket.user_id) is ticket:
+            del self._by_user[ticket.user_id]
+        return ticket
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import re
+import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -14,7 +16,10 @@ import structlog
 from dragonpaw_bot.context import GuildContext
 from dragonpaw_bot.plugins.intros import state as intros_state
 from dragonpaw_bot.plugins.validation import state as validation_state
+from dragonpaw_bot.plugins.validation import timers
 from dragonpaw_bot.plugins.validation.models import ValidationMember, ValidationStage
+from dragonpaw_bot.plugins.validation.timers import MAX_VALIDATION_DAYS
+from dragonpaw_bot.rest_scheduler import scheduler
 
 if TYPE_CHECKING:
     from dragonpaw_bot.bot import DragonpawBot
@@ -32,7 +37,6 @@ MIN_PHOTOS = 2
 SAMPLE_ID_PATH = ASSETS_DIR / "validation-id.jpg"
 SAMPLE_SELFIE_PATH = ASSETS_DIR / "validation-selfie.jpg"
 CHANNEL_CLOSE_DELAY = 30
-MAX_VALIDATION_DAYS = 4
 
 
 def _deadline_timestamp(joined_at: datetime) -> str:
@@ -114,13 +118,10 @@ async def on_member_join(event: hikari.MemberCreateEvent) -> None:
         return
 
     joined_at = datetime.now(UTC)
-    st.members.append(
-        ValidationMember(
-            user_id=int(event.member.id),
-            joined_at=joined_at,
-        )
-    )
+    member_entry = ValidationMember(user_id=int(event.member.id), joined_at=joined_at)
+    st.add_member(member_entry)
     validation_state.save(st)
+    timers.member_changed(st.guild_id, member_entry)
 
     row = bot.rest.build_message_action_row()
     row.add_interactive_button(
@@ -164,9 +165,7 @@ async def on_member_update(event: hikari.MemberUpdateEvent) -> None:
     if not st.member_role_id:
         return
 
-    member_entry = next(
-        (m for m in st.members if m.user_id == int(event.member.id)), None
-    )
+    member_entry = st.members.get(int(event.member.id))
     if not member_entry:
         return
 
@@ -209,8 +208,9 @@ async def on_member_update(event: hikari.MemberUpdateEvent) -> None:
         by_whom = f" — role given by **{actor_name}**"
     else:
         by_whom = ""
-    st.members = [m for m in st.members if m.user_id != int(event.member.id)]
+    st.remove_member(int(event.member.id))
     validation_state.save(st)
+    timers.member_removed(st.guild_id, int(event.member.id))
     await gc.log(
         f"*happy snort* Dropped **{event.member.display_name}** from onboarding — "
         f"they already have the member role{by_whom}! 🐉"
@@ -237,17 +237,12 @@ async def on_message_create(event: hikari.GuildMessageCreateEvent) -> None:
         return
 
     st = validation_state.load(int(event.guild_id))
-    member_entry = next(
-        (
-            m
-            for m in st.members
-            if m.channel_id == int(event.channel_id)
-            and m.stage == ValidationStage.AWAITING_PHOTOS
-            and m.user_id == int(event.author_id)
-        ),
-        None,
-    )
-    if not member_entry:
+    member_entry = st.members.get(int(event.author_id))
+    if (
+        not member_entry
+        or member_entry.channel_id != int(event.channel_id)
+        or member_entry.stage != ValidationStage.AWAITING_PHOTOS
+    ):
         return
 
     image_count = sum(
@@ -263,6 +258,7 @@ async def on_message_create(event: hikari.GuildMessageCreateEvent) -> None:
     if member_entry.photo_count >= MIN_PHOTOS:
         member_entry.stage = ValidationStage.AWAITING_STAFF
         validation_state.save(st)
+        timers.member_removed(st.guild_id, member_entry.user_id)
 
         bot: DragonpawBot = event.app  # type: ignore[assignment]
         gc = GuildContext.from_guild(
@@ -313,14 +309,11 @@ async def on_member_leave(event: hikari.MemberDeleteEvent) -> None:
     bot: DragonpawBot = event.app  # type: ignore[assignment]
     st = validation_state.load(int(event.guild_id))
 
-    member_entry = next(
-        (m for m in st.members if m.user_id == int(event.user_id)), None
-    )
+    member_entry = st.remove_member(int(event.user_id))
     if not member_entry:
         return
-
-    st.members = [m for m in st.members if m.user_id != int(event.user_id)]
     validation_state.save(st)
+    timers.member_removed(st.guild_id, member_entry.user_id)
 
     gc = GuildContext.from_guild(
         bot,
@@ -348,24 +341,66 @@ async def on_member_leave(event: hikari.MemberDeleteEvent) -> None:
         )
 
 
-async def _reconcile_guild(bot: DragonpawBot, guild_id: int) -> None:
-    """Check all in-progress validations for one guild and remove stale entries."""
-    st = validation_state.load(guild_id)
-    if not st.members:
-        return
+# ---------------------------------------------------------------------------- #
+#                             Startup reconcile                                 #
+# ---------------------------------------------------------------------------- #
+
+#: Longest the startup reconcile waits for member chunking before it starts
+#: checking guilds anyway (cache misses just fall back to REST).
+CHUNK_WAIT_SECONDS = 30.0
+#: How often the reconcile re-checks whether chunking has finished.
+_CHUNK_POLL_SECONDS = 1.0
+
+# Guilds whose startup member chunking has delivered its last chunk.
+_chunked_guilds: set[int] = set()
 
-    gc = GuildContext.from_guild(
-        bot,
-        bot.cache.get_guild(guild_id) or await bot.rest.fetch_guild(guild_id),
-    )
 
-    to_remove: list[int] = []
+@loader.listener(hikari.MemberChunkEvent)
+async def on_member_chunk(event: hikari.MemberChunkEvent) -> None:
+    if event.chunk_index == event.chunk_count - 1:
+        _chunked_guilds.add(int(event.guild_id))
 
-    for member_entry in st.members:
+
+async def _wait_for_chunking(guild_ids: set[int]) -> None:
+    """Wait (up to CHUNK_WAIT_SECONDS) until these guilds' members are cached."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + CHUNK_WAIT_SECONDS
+    while pending := guild_ids - _chunked_guilds:
+        if loop.time() >= deadline:
+            logger.info(
+                "Startup reconcile: member chunking unfinished, using REST for misses",
+                guilds=len(pending),
+            )
+            return
+        await asyncio.sleep(_CHUNK_POLL_SECONDS)
+
+
+@dataclasses.dataclass
+class _ReconcileStats:
+    members: int = 0
+    removed: int = 0
+    rest_calls: int = 0
+
+
+async def _reconcile_member(
+    bot: DragonpawBot,
+    gc: GuildContext,
+    member_entry: ValidationMember,
+    stats: _ReconcileStats,
+) -> bool:
+    """Whether this onboarding entry is stale: the member left or their channel is gone.
+
+    The member and channel caches are trusted when they have an answer; a miss
+    is confirmed over REST, since the member cache can be incomplete mid-chunk.
+    """
+    guild_id = int(gc.guild_id)
+    member = bot.cache.get_member(guild_id, member_entry.user_id)
+    if member is None:
+        stats.rest_calls += 1
         try:
-            member = await bot.rest.fetch_member(guild_id, member_entry.user_id)
+            async with scheduler.slot(f"member:{guild_id}"):
+                member = await bot.rest.fetch_member(guild_id, member_entry.user_id)
         except hikari.NotFoundError:
-            to_remove.append(member_entry.user_id)
             await gc.log(
                 f"*sad snort* **{member_entry.user_id}** left the server while I was napping — "
                 f"cleaning up their onboarding! 🐉"
@@ -383,55 +418,118 @@ async def _reconcile_guild(bot: DragonpawBot, guild_id: int) -> None:
                         f"This channel will be deleted in {CHANNEL_CLOSE_DELAY} seconds~ 🐉",
                     )
                 )
-            continue
+            return True
         except hikari.HTTPError:
             logger.warning(
                 "Startup reconcile: failed to fetch member",
                 user_id=member_entry.user_id,
                 guild_id=guild_id,
             )
-            continue
+            return False
 
-        if not member_entry.channel_id:
-            continue
+    if not member_entry.channel_id:
+        return False
+    if bot.cache.get_guild_channel(member_entry.channel_id) is not None:
+        return False
 
-        try:
+    stats.rest_calls += 1
+    try:
+        async with scheduler.slot(f"channel:{guild_id}"):
             await bot.rest.fetch_channel(member_entry.channel_id)
-        except hikari.NotFoundError:
-            to_remove.append(member_entry.user_id)
-            await gc.log(
-                f"*confused sniff* Validate channel for **{member.display_name}** is gone — "
-                f"cleaned up their onboarding entry! 🐉"
-            )
-            logger.info(
-                "Startup reconcile: validate channel gone",
-                user_id=member_entry.user_id,
-                channel_id=member_entry.channel_id,
-            )
-        except hikari.HTTPError:
-            logger.warning(
-                "Startup reconcile: failed to fetch channel",
-                user_id=member_entry.user_id,
-                channel_id=member_entry.channel_id,
-                guild_id=guild_id,
-            )
+    except hikari.NotFoundError:
+        await gc.log(
+            f"*confused sniff* Validate channel for **{member.display_name}** is gone — "
+            f"cleaned up their onboarding entry! 🐉"
+        )
+        logger.info(
+            "Startup reconcile: validate channel gone",
+            user_id=member_entry.user_id,
+            channel_id=member_entry.channel_id,
+        )
+        return True
+    except hikari.HTTPError:
+        logger.warning(
+            "Startup reconcile: failed to fetch channel",
+            user_id=member_entry.user_id,
+            channel_id=member_entry.channel_id,
+            guild_id=guild_id,
+        )
+    return False
+
+
+async def _reconcile_guild(
+    bot: DragonpawBot, guild_id: int, stats: _ReconcileStats | None = None
+) -> None:
+    """Check all in-progress validations for one guild and remove stale entries."""
+    st = validation_state.load(guild_id)
+    if not st.members:
+        return
+    if stats is None:
+        stats = _ReconcileStats()
+
+    guild = bot.cache.get_guild(guild_id)
+    if guild is None:
+        stats.rest_calls += 1
+        guild = await bot.rest.fetch_guild(guild_id)
+    gc = GuildContext.from_guild(bot, guild)
+
+    entries = list(st.members.values())
+    stats.members += len(entries)
+    # The checks share the REST scheduler's background pool, which bounds how
+    # many are in flight across every guild being reconciled.
+    stale = await asyncio.gather(
+        *(_reconcile_member(bot, gc, entry, stats) for entry in entries)
+    )
+    to_remove = [
+        entry.user_id
+        for entry, is_stale in zip(entries, stale, strict=True)
+        if is_stale
+    ]
 
     if to_remove:
-        remove_ids = set(to_remove)
-        st.members = [m for m in st.members if m.user_id not in remove_ids]
+        for user_id in to_remove:
+            st.remove_member(user_id)
+            timers.member_removed(guild_id, user_id)
+        stats.removed += len(to_remove)
         validation_state.save(st)
 
 
+async def _reconcile_guild_safely(
+    bot: DragonpawBot, guild_id: int, stats: _ReconcileStats
+) -> None:
+    try:
+        await _reconcile_guild(bot, guild_id, stats)
+    except Exception:
+        logger.exception("Startup reconcile failed for guild", guild_id=guild_id)
+
+
 @loader.listener(hikari.StartedEvent)
 async def on_startup_reconcile(event: hikari.StartedEvent) -> None:
     """On startup, clean up validation state for members who left or had channels deleted."""
     bot: DragonpawBot = event.app  # type: ignore[assignment]
-    logger.info("Running startup validation reconcile")
-    for guild_id in validation_state.all_guild_ids():
-        try:
-            await _reconcile_guild(bot, guild_id)
-        except Exception:
-            logger.exception("Startup reconcile failed for guild", guild_id=guild_id)
+    guild_ids = {
+        guild_id
+        for guild_id in validation_state.all_guild_ids()
+        if validation_state.load(guild_id).members
+    }
+    if not guild_ids:
+        return
+
+    logger.info("Running startup validation reconcile", guilds=len(guild_ids))
+    started = time.monotonic()
+    await _wait_for_chunking(guild_ids)
+    stats = _ReconcileStats()
+    await asyncio.gather(
+        *(_reconcile_guild_safely(bot, guild_id, stats) for guild_id in guild_ids)
+    )
+    logger.info(
+        "Startup validation reconcile complete",
+        guilds=len(guild_ids),
+        members=stats.members,
+        removed=stats.removed,
+        rest_calls=stats.rest_calls,
+        seconds=round(time.monotonic() - started, 1),
+    )
 
 
 # ---------------------------------------------------------------------------- #
@@ -467,9 +565,7 @@ async def handle_rules_agreed(interaction: hikari.ComponentInteraction) -> None:
     gc = GuildContext.from_interaction(interaction)
     st = validation_state.load(int(interaction.guild_id))
 
-    member_entry = next(
-        (m for m in st.members if m.user_id == int(interaction.user.id)), None
-    )
+    member_entry = st.members.get(int(interaction.user.id))
     if not member_entry:
         await interaction.edit_initial_response(
             content="*confused head tilt* Hmm, I don't have you in my onboarding list! Please let staff know. 🐉"
@@ -565,7 +661,7 @@ async def handle_approve_button(interaction: hikari.ComponentInteraction) -> Non
         return
 
     st = validation_state.load(int(interaction.guild_id))
-    member_entry = next((m for m in st.members if m.channel_id == channel_id), None)
+    member_entry = st.member_in_channel(channel_id)
 
     if member_entry and int(interaction.user.id) == member_entry.user_id:
         await interaction.create_initial_response(
@@ -619,7 +715,7 @@ async def handle_approve_modal(interaction: hikari.ModalInteraction) -> None:  #
         return
 
     st = validation_state.load(int(interaction.guild_id))
-    member_entry = next((m for m in st.members if m.channel_id == channel_id), None)
+    member_entry = st.member_in_channel(channel_id)
     if member_entry and int(interaction.user.id) == member_entry.user_id:
         await interaction.edit_initial_response(
             content="*side-eyes you* 🐉 You can't approve your own verification! 🐾"
@@ -653,8 +749,9 @@ async def handle_approve_modal(interaction: hikari.ModalInteraction) -> None:  #
 
     user_id = hikari.Snowflake(member_entry.user_id)
 
-    st.members = [m for m in st.members if m.channel_id != channel_id]
+    st.remove_member(member_entry.user_id)
     validation_state.save(st)
+    timers.member_removed(st.guild_id, member_entry.user_id)
 
     try:
         await bot.rest.edit_member(interaction.guild_id, user_id, nickname=name)
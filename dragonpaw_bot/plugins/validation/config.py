@@ -13,8 +13,8 @@ from dragonpaw_bot.context import (
 )
 from dragonpaw_bot.plugins.validation import state as validation_state
 from dragonpaw_bot.plugins.validation.commands import MAX_VALIDATION_DAYS
-from dragonpaw_bot.plugins.validation.cron import REMINDER_INTERVAL_HOURS
 from dragonpaw_bot.plugins.validation.models import ValidationStage
+from dragonpaw_bot.plugins.validation.timers import REMINDER_INTERVAL_HOURS
 
 logger = structlog.get_logger(__name__)
 
@@ -190,13 +190,13 @@ class ValidationStatus(
         st = validation_state.load(int(ctx.guild_id))
 
         awaiting_rules = sum(
-            1 for m in st.members if m.stage == ValidationStage.AWAITING_RULES
+            1 for m in st.members.values() if m.stage == ValidationStage.AWAITING_RULES
         )
         awaiting_photos = sum(
-            1 for m in st.members if m.stage == ValidationStage.AWAITING_PHOTOS
+            1 for m in st.members.values() if m.stage == ValidationStage.AWAITING_PHOTOS
         )
         awaiting_staff = sum(
-            1 for m in st.members if m.stage == ValidationStage.AWAITING_STAFF
+            1 for m in st.members.values() if m.stage == ValidationStage.AWAITING_STAFF
         )
 
         bot: hikari.GatewayBot = ctx.client.app  # type: ignore[assignment]
@@ -7,25 +7,38 @@ import hikari
 import lightbulb
 import structlog
 
+from dragonpaw_bot import metrics
 from dragonpaw_bot.context import GuildContext
 from dragonpaw_bot.plugins.validation import state as validation_state
+from dragonpaw_bot.plugins.validation import timers
 from dragonpaw_bot.plugins.validation.commands import (
-    MAX_VALIDATION_DAYS,
     MIN_PHOTOS,
     RULES_AGREED_PREFIX,
     _close_validate_channel,
     _deadline_timestamp,
 )
 from dragonpaw_bot.plugins.validation.models import ValidationStage
+from dragonpaw_bot.plugins.validation.timers import (
+    MAX_VALIDATION_DAYS,
+    REMINDER_INTERVAL_HOURS,
+)
 from dragonpaw_bot.utils import create_background_task
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from dragonpaw_bot.bot import DragonpawBot
+    from dragonpaw_bot.plugins.validation.models import (
+        ValidationGuildState,
+        ValidationMember,
+    )
 
 logger = structlog.get_logger(__name__)
 loader = lightbulb.Loader()
 
-REMINDER_INTERVAL_HOURS = 16
+#: How long to wait on a guild that isn't in the cache yet. Right after a
+#: restart every overdue deadline fires before GUILD_CREATE has arrived.
+UNCACHED_RETRY = timedelta(minutes=1)
 
 
 def _build_rules_button_row(
@@ -41,8 +54,165 @@ def _build_rules_button_row(
     return row
 
 
-async def validation_reminder_cron(bot: hikari.GatewayBot) -> None:  # noqa: PLR0912
-    """Ping unvalidated members every 16h; kick and close channel after 4 days."""
+async def _attend_member(
+    bot: DragonpawBot,
+    gc: GuildContext,
+    st: ValidationGuildState,
+    member: ValidationMember,
+    now: datetime,
+) -> None:
+    """Kick or remind one member if their deadline has come."""
+    if member.stage == ValidationStage.AWAITING_STAFF:
+        return
+
+    if now >= member.joined_at + timedelta(days=MAX_VALIDATION_DAYS):
+        # Drop from state and persist *before* kicking. The kick fires a
+        # MemberDeleteEvent; without this, on_member_leave treats our own
+        # kick as a voluntary departure — a confusing "flew away" staff
+        # log and a redundant channel close. kick_member logs the kick.
+        st.remove_member(member.user_id)
+        validation_state.save(st)
+        kicked = bot.cache.get_member(gc.guild_id, member.user_id)
+        await gc.kick_member(
+            member.user_id,
+            reason=f"Did not complete validation within {MAX_VALIDATION_DAYS} days",
+            display_name=kicked.display_name if kicked else None,
+        )
+        if member.channel_id:
+            # Background task, like every other close call site: the helper
+            # sleeps 30s inline, and a failure here must not hold up the
+            # rest of the guild's members.
+            create_background_task(
+                _close_validate_channel(
+                    gc,
+                    member.channel_id,
+                    f"*puffs a small smoke ring* ⏰ Hey <@{member.user_id}> — "
+                    f"your {MAX_VALIDATION_DAYS}-day validation window has closed. "
+                    f"This channel will disappear shortly. "
+                    f"You're welcome to rejoin the server and try again! 🐉",
+                )
+            )
+        return
+
+    next_reminder = member.joined_at + timedelta(
+        hours=REMINDER_INTERVAL_HOURS * (member.reminder_count + 1)
+    )
+    if now < next_reminder:
+        return
+
+    lobby_channel_id = st.lobby_channel_id
+    assert lobby_channel_id, "_attend_guild skips guilds without a lobby"
+    if member.stage == ValidationStage.AWAITING_RULES:
+        try:
+            await bot.rest.create_message(
+                channel=lobby_channel_id,
+                content=(
+                    f"*gentle nudge* Hey <@{member.user_id}>! 🐉 Just a little reminder — "
+                    f"you haven't finished reading the rules yet! Give 'em a read and "
+                    f"smack the button below when you're ready~ 🐾\n\n"
+                    f"⏳ I'll have to boop you back out of the nest {_deadline_timestamp(member.joined_at)} "
+                    f"if you haven't finished up—so don't keep me waiting! 🐾"
+                ),
+                components=[_build_rules_button_row(bot, member.user_id)],
+            )
+        except hikari.HTTPError:
+            logger.warning(
+                "Failed to send lobby reminder",
+                user_id=member.user_id,
+                guild=gc.name,
+            )
+        else:
+            member.reminder_count += 1
+            st.touch()
+            logger.debug(
+                "Sent lobby reminder",
+                user_id=member.user_id,
+                reminder_count=member.reminder_count,
+                guild=gc.name,
+            )
+    elif member.stage == ValidationStage.AWAITING_PHOTOS and member.channel_id:
+        try:
+            await bot.rest.create_message(
+                channel=member.channel_id,
+                content=(
+                    f"*peers in curiously* Hey <@{member.user_id}>! 🐉 Don't forget — "
+                    f"I'm still waiting for your verification photos! Drop at least {MIN_PHOTOS} "
+                    f"photos in here when you're ready~ 🐾\n\n"
+                    f"⏳ I'll have to boop you back out of the nest {_deadline_timestamp(member.joined_at)} "
+                    f"if you haven't finished up—so don't keep me waiting! 🐾"
+                ),
+            )
+        except hikari.HTTPError:
+            logger.warning(
+                "Failed to send photo reminder",
+                user_id=member.user_id,
+                guild=gc.name,
+            )
+        else:
+            member.reminder_count += 1
+            st.touch()
+            logger.debug(
+                "Sent photo reminder",
+                user_id=member.user_id,
+                reminder_count=member.reminder_count,
+                guild=gc.name,
+            )
+
+
+async def _attend_guild(
+    bot: DragonpawBot,
+    guild: hikari.Guild,
+    user_ids: Iterable[int] | None,
+    now: datetime,
+) -> None:
+    """Attend the given members of one guild (all of them if `user_ids` is None)."""
+    st = validation_state.load(int(guild.id))
+    if not st.lobby_channel_id:
+        return
+
+    gc = GuildContext.from_guild(bot, guild)
+    if user_ids is None:
+        members = list(st.members.values())
+    else:
+        members = [st.members[uid] for uid in user_ids if uid in st.members]
+
+    for member in members:
+        await _attend_member(bot, gc, st, member, now)
+        if member.user_id in st.members:
+            # A reminder that didn't go out is retried after a while, not at once.
+            timers.member_changed(st.guild_id, member, now + timers.RETRY_AFTER)
+        else:
+            timers.member_removed(st.guild_id, member.user_id)
+
+    validation_state.save_if_dirty(st)
+
+
+async def fire_timers(bot: DragonpawBot, due: list[timers.Timer]) -> None:
+    """Handle the deadlines the timer wheel says have come due."""
+    now = datetime.now(UTC)
+    by_guild: dict[int, list[timers.Timer]] = {}
+    for timer in due:
+        by_guild.setdefault(timer.guild_id, []).append(timer)
+
+    for guild_id, guild_due in by_guild.items():
+        guild = bot.cache.get_guild(guild_id)
+        if guild is None:
+            logger.debug("Validation timers for uncached guild", guild_id=guild_id)
+            timers.wheel.postpone(guild_due, now + UNCACHED_RETRY)
+            continue
+        try:
+            await _attend_guild(bot, guild, [t.user_id for t in guild_due], now)
+        except Exception:
+            logger.exception("Error in validation timers for guild", guild=guild.name)
+            timers.wheel.postpone(guild_due, now + timers.RETRY_AFTER)
+
+
+async def validation_reminder_cron(bot: hikari.GatewayBot) -> None:
+    """Daily backstop: attend any onboarding member the timer wheel isn't tracking.
+
+    Normally that's nobody. Failed and uncached deadlines are retried by the
+    wheel itself; this catches members whose timer was dropped anyway.
+    """
     bot = cast("DragonpawBot", bot)
     now = datetime.now(UTC)
     guilds = list(bot.cache.get_guilds_view().values())
@@ -50,114 +220,39 @@ async def validation_reminder_cron(bot: hikari.GatewayBot) -> None:  # noqa: PLR
     for guild in guilds:
         try:
             st = validation_state.load(int(guild.id))
-            if not st.lobby_channel_id:
-                continue
-
-            gc = GuildContext.from_guild(bot, guild)
-            deadline = timedelta(days=MAX_VALIDATION_DAYS)
-
-            for member in st.members:
-                if member.stage == ValidationStage.AWAITING_STAFF:
-                    continue
-
-                if now >= member.joined_at + deadline:
-                    # Drop from state and persist *before* kicking. The kick fires a
-                    # MemberDeleteEvent; without this, on_member_leave treats our own
-                    # kick as a voluntary departure — a confusing "flew away" staff
-                    # log and a redundant channel close. kick_member logs the kick.
-                    st.members = [m for m in st.members if m.user_id != member.user_id]
-                    validation_state.save(st)
-                    kicked = bot.cache.get_member(guild.id, member.user_id)
-                    await gc.kick_member(
-                        member.user_id,
-                        reason=f"Did not complete validation within {MAX_VALIDATION_DAYS} days",
-                        display_name=kicked.display_name if kicked else None,
-                    )
-                    if member.channel_id:
-                        # Background task, like every other close call site: the helper
-                        # sleeps 30s inline, and a failure here must not abort the
-                        # rest of the guild's sweep.
-                        create_background_task(
-                            _close_validate_channel(
-                                gc,
-                                member.channel_id,
-                                f"*puffs a small smoke ring* ⏰ Hey <@{member.user_id}> — "
-                                f"your {MAX_VALIDATION_DAYS}-day validation window has closed. "
-                                f"This channel will disappear shortly. "
-                                f"You're welcome to rejoin the server and try again! 🐉",
-                            )
-                        )
-                    continue
-
-                next_reminder = member.joined_at + timedelta(
-                    hours=REMINDER_INTERVAL_HOURS * (member.reminder_count + 1)
-                )
-                if now < next_reminder:
-                    continue
-
-                if member.stage == ValidationStage.AWAITING_RULES:
-                    try:
-                        await bot.rest.create_message(
-                            channel=st.lobby_channel_id,
-                            content=(
-                                f"*gentle nudge* Hey <@{member.user_id}>! 🐉 Just a little reminder — "
-                                f"you haven't finished reading the rules yet! Give 'em a read and "
-                                f"smack the button below when you're ready~ 🐾\n\n"
-                                f"⏳ I'll have to boop you back out of the nest {_deadline_timestamp(member.joined_at)} "
-                                f"if you haven't finished up—so don't keep me waiting! 🐾"
-                            ),
-                            components=[_build_rules_button_row(bot, member.user_id)],
-                        )
-                    except hikari.HTTPError:
-                        logger.warning(
-                            "Failed to send lobby reminder",
-                            user_id=member.user_id,
-                            guild=guild.name,
-                        )
-                    else:
-                        member.reminder_count += 1
-                        logger.debug(
-                            "Sent lobby reminder",
-                            user_id=member.user_id,
-                            reminder_count=member.reminder_count,
-                            guild=guild.name,
-                        )
-                elif (
-                    member.stage == ValidationStage.AWAITING_PHOTOS
-                    and member.channel_id
-                ):
-                    try:
-                        await bot.rest.create_message(
-                            channel=member.channel_id,
-                            content=(
-                                f"*peers in curiously* Hey <@{member.user_id}>! 🐉 Don't forget — "
-                                f"I'm still waiting for your verification photos! Drop at least {MIN_PHOTOS} "
-                                f"photos in here when you're ready~ 🐾\n\n"
-                                f"⏳ I'll have to boop you back out of the nest {_deadline_timestamp(member.joined_at)} "
-                                f"if you haven't finished up—so don't keep me waiting! 🐾"
-                            ),
-                        )
-                    except hikari.HTTPError:
-                        logger.warning(
-                            "Failed to send photo reminder",
-                            user_id=member.user_id,
-                            guild=guild.name,
-                        )
-                    else:
-                        member.reminder_count += 1
-                        logger.debug(
-                            "Sent photo reminder",
-                            user_id=member.user_id,
-                            reminder_count=member.reminder_count,
-                            guild=guild.name,
-                        )
-
-            validation_state.save(st)
+            strays = [
+                uid
+                for uid in st.members
+                if not timers.wheel.is_pending(st.guild_id, uid)
+            ]
+            if strays:
+                await _attend_guild(bot, guild, strays, now)
         except Exception:
             logger.exception("Error in validation cron for guild", guild=guild.name)
 
 
-@loader.task(lightbulb.crontrigger("15 * * * *"))  # every hour
+@loader.listener(hikari.StartedEvent)
+async def on_started(event: hikari.StartedEvent) -> None:
+    """Rebuild the timer wheel from saved state and start it running."""
+    bot = cast("DragonpawBot", event.app)
+    timers.wheel.clear()
+    timers.wheel.load(
+        validation_state.load(guild_id) for guild_id in validation_state.all_guild_ids()
+    )
+
+    async def fire(due: list[timers.Timer]) -> None:
+        await fire_timers(bot, due)
+
+    timers.wheel.start(fire)
+
+
+@loader.listener(hikari.StoppingEvent)
+async def on_stopping(_: hikari.StoppingEvent) -> None:
+    timers.wheel.stop()
+
+
+@loader.task(lightbulb.crontrigger("15 4 * * *"))  # daily
+@metrics.timed_task
 async def _validation_reminder_cron_task(
     bot: hikari.GatewayBot = lightbulb.di.INJECTED,
 ) -> None:
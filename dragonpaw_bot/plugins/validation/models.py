@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import enum
 from datetime import datetime  # noqa: TC003
+from typing import Any
 
 import pydantic
 
@@ -34,5 +35,46 @@ class ValidationGuildState(GuildStateBase):
     roles_channel_id: int | None = None
     events_channel_id: int | None = None
     chat_channel_id: int | None = None
-    # runtime
-    members: list[ValidationMember] = pydantic.Field(default_factory=list)
+    # runtime, keyed by user_id
+    members: dict[int, ValidationMember] = pydantic.Field(default_factory=dict)
+
+    # Set by anything that changes the state, so periodic sweeps can skip the
+    # write when nothing happened. Not persisted.
+    _dirty: bool = pydantic.PrivateAttr(default=False)
+
+    @pydantic.field_validator("members", mode="before")
+    @classmethod
+    def _key_members_by_user(cls, value: Any) -> Any:
+        """State files used to store members as a list; key those by user_id."""
+        if isinstance(value, list):
+            return {
+                (m.user_id if isinstance(m, ValidationMember) else m["user_id"]): m
+                for m in value
+            }
+        return value
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def touch(self) -> None:
+        """Note an in-place change to a member, so the next sweep saves it."""
+        self._dirty = True
+
+    def mark_saved(self) -> None:
+        self._dirty = False
+
+    def add_member(self, member: ValidationMember) -> None:
+        self.members[member.user_id] = member
+        self._dirty = True
+
+    def remove_member(self, user_id: int) -> ValidationMember | None:
+        member = self.members.pop(user_id, None)
+        if member is not None:
+            self._dirty = True
+        return member
+
+    def member_in_channel(self, channel_id: int) -> ValidationMember | None:
+        return next(
+            (m for m in self.members.values() if m.channel_id == channel_id), None
+        )
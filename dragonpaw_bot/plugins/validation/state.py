@@ -5,7 +5,19 @@ from dragonpaw_bot.state_store import GuildStateStore
 
 store = GuildStateStore("validation", ValidationGuildState)
 load = store.load
-save = store.save
+
+
+def save(st: ValidationGuildState) -> None:
+    store.save(st)
+    st.mark_saved()
+
+
+def save_if_dirty(st: ValidationGuildState) -> bool:
+    """Save only if something changed since the last save. Returns whether it did."""
+    if not st.dirty:
+        return False
+    save(st)
+    return True
 
 
 def all_guild_ids() -> list[int]:
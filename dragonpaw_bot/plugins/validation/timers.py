@@ -0,0 +1,238 @@
+"""Validation deadlines, kept in one min-heap across every guild.
+
+Each member still onboarding has one pending deadline: their next reminder,
+or the kick once the validation window is up. The runner sleeps until the
+earliest of them, so reminders land on time instead of at the next hourly
+tick, and nothing walks members whose deadline is days off.
+
+The heap lives in memory. It's rebuilt from the validation state files at
+startup, which already hold everything needed: join time, reminder count
+and stage. Handlers call `member_changed` / `member_removed` as members move
+through onboarding; superseded heap items are skipped when popped rather
+than searched for and removed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import enum
+import heapq
+import itertools
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import structlog
+
+from dragonpaw_bot.plugins.validation.models import ValidationStage
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
+    from dragonpaw_bot.plugins.validation.models import (
+        ValidationGuildState,
+        ValidationMember,
+    )
+
+logger = structlog.get_logger(__name__)
+
+MAX_VALIDATION_DAYS = 4
+REMINDER_INTERVAL_HOURS = 16
+#: Longest the runner sleeps between checks, so a clock jump can't strand it.
+MAX_SLEEP_SECONDS = 3600.0
+#: How long before a deadline whose handling failed is tried again.
+RETRY_AFTER = timedelta(hours=1)
+
+
+class TimerKind(enum.StrEnum):
+    REMIND = "remind"
+    KICK = "kick"
+
+
+@dataclasses.dataclass(order=True, frozen=True)
+class Timer:
+    """One member's next deadline: fires at `at` (UTC)."""
+
+    at: datetime
+    guild_id: int
+    user_id: int
+    kind: TimerKind = dataclasses.field(compare=False)
+    version: int = dataclasses.field(compare=False)
+
+
+def next_deadline(member: ValidationMember) -> tuple[datetime, TimerKind] | None:
+    """When this member next needs attention, or None while staff review them."""
+    if member.stage == ValidationStage.AWAITING_STAFF:
+        return None
+    kick_at = member.joined_at + timedelta(days=MAX_VALIDATION_DAYS)
+    remind_at = member.joined_at + timedelta(
+        hours=REMINDER_INTERVAL_HOURS * (member.reminder_count + 1)
+    )
+    if remind_at < kick_at:
+        return remind_at, TimerKind.REMIND
+    return kick_at, TimerKind.KICK
+
+
+class TimerWheel:
+    """Min-heap of every guild's validation deadlines, plus the loop that fires them."""
+
+    def __init__(self) -> None:
+        self._heap: list[Timer] = []
+        # A fresh version on every change, so older heap items can be told
+        # apart; one counter, so a member who leaves and rejoins can't reuse one.
+        self._versions: dict[tuple[int, int], int] = {}
+        self._counter = itertools.count(1)
+        self._wake: asyncio.Future[None] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def schedule(
+        self,
+        guild_id: int,
+        member: ValidationMember,
+        not_before: datetime | None = None,
+    ) -> None:
+        """(Re)schedule a member's next deadline, superseding any already queued.
+
+        `not_before` holds back a deadline that's already passed, e.g. a
+        reminder that failed to send and should be retried later, not at once.
+        """
+        key = (guild_id, member.user_id)
+        deadline = next_deadline(member)
+        if deadline is None:
+            self._versions.pop(key, None)
+            return
+        version = next(self._counter)
+        self._versions[key] = version
+        at, kind = deadline
+        if not_before is not None:
+            at = max(at, not_before)
+        timer = Timer(at, guild_id, member.user_id, kind, version)
+        heapq.heappush(self._heap, timer)
+        if self._heap[0] is timer:
+            self._notify()
+
+    def postpone(self, due: Iterable[Timer], until: datetime) -> None:
+        """Requeue popped timers at `until`, unless they've been handled since."""
+        for timer in due:
+            key = (timer.guild_id, timer.user_id)
+            if self._versions.get(key) != timer.version:
+                continue
+            version = next(self._counter)
+            self._versions[key] = version
+            heapq.heappush(
+                self._heap,
+                dataclasses.replace(timer, at=max(timer.at, until), version=version),
+            )
+        if self._heap and self._heap[0].at <= until:
+            self._notify()
+
+    def cancel(self, guild_id: int, user_id: int) -> None:
+        self._versions.pop((guild_id, user_id), None)
+
+    def is_pending(self, guild_id: int, user_id: int) -> bool:
+        """Whether this member has a deadline queued or being handled right now."""
+        return (guild_id, user_id) in self._versions
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._versions.clear()
+
+    def load(self, guild_states: Iterable[ValidationGuildState]) -> None:
+        """Queue every onboarding member in guilds with validation set up."""
+        for st in guild_states:
+            if not st.lobby_channel_id:
+                continue
+            for member in st.members.values():
+                self.schedule(st.guild_id, member)
+        logger.info("Built validation timers", pending=len(self))
+
+    def pop_due(self, now: datetime) -> list[Timer]:
+        """Remove and return every live timer due at or before `now`, in order."""
+        due: list[Timer] = []
+        while self._heap and self._heap[0].at <= now:
+            timer = heapq.heappop(self._heap)
+            if self._versions.get((timer.guild_id, timer.user_id)) == timer.version:
+                due.append(timer)
+        return due
+
+    def next_at(self) -> datetime | None:
+        """When the earliest live timer is due, dropping superseded ones on the way."""
+        while self._heap:
+            head = self._heap[0]
+            if self._versions.get((head.guild_id, head.user_id)) == head.version:
+                return head.at
+            heapq.heappop(self._heap)
+        return None
+
+    async def run(self, fire: Callable[[list[Timer]], Awaitable[None]]) -> None:
+        """Fire due timers forever, sleeping until the next one in between.
+
+        `fire` should reschedule, postpone or cancel each member it handles.
+        Any it doesn't are dropped afterwards, leaving them to the daily
+        sweep. If `fire` raises, every timer it didn't get to is retried
+        after `RETRY_AFTER`.
+        """
+        while True:
+            now = datetime.now(UTC)
+            due = self.pop_due(now)
+            if due:
+                try:
+                    await fire(due)
+                except Exception:
+                    logger.exception("Validation timers failed", count=len(due))
+                    self.postpone(due, now + RETRY_AFTER)
+                finally:
+                    for timer in due:
+                        key = (timer.guild_id, timer.user_id)
+                        if self._versions.get(key) == timer.version:
+                            del self._versions[key]
+                continue
+            next_at = self.next_at()
+            delay = (
+                MAX_SLEEP_SECONDS
+                if next_at is None
+                else min((next_at - now).total_seconds(), MAX_SLEEP_SECONDS)
+            )
+            await self._sleep(delay)
+
+    async def _sleep(self, seconds: float) -> None:
+        # A plain future rather than an asyncio.Event: a module-level Event
+        # binds to the first loop that waits on it.
+        self._wake = asyncio.get_running_loop().create_future()
+        try:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake, max(seconds, 0.0))
+        finally:
+            self._wake = None
+
+    def start(self, fire: Callable[[list[Timer]], Awaitable[None]]) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(fire), name="validation-timers")
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _notify(self) -> None:
+        """A new earliest deadline: cut the runner's sleep short."""
+        if self._wake is not None and not self._wake.done():
+            self._wake.set_result(None)
+
+
+wheel = TimerWheel()
+
+
+def member_changed(
+    guild_id: int, member: ValidationMember, not_before: datetime | None = None
+) -> None:
+    """A member joined, moved stage or was reminded: requeue their next deadline."""
+    wheel.schedule(guild_id, member, not_before)
+
+
+def member_removed(guild_id: int, user_id: int) -> None:
+    wheel.cancel(guild_id, user_id)
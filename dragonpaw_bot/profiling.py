@@ -0,0 +1,210 @@
+"""On-demand CPU and memory profiling of the live bot.
+
+A `ProfileRun` turns on cProfile and tracemalloc together and, when stopped,
+writes three files to `PROFILE_DIR`: the raw `.prof` (open it with pstats or
+snakeviz), the memory growth between the start and end snapshots, and a
+plain-text summary of the top functions by own time and the top allocation
+sites. The summary is also returned for posting to a log channel.
+
+Runs are started from `/config debug profile` for a fixed duration, or by
+sending the process SIGUSR1 (once to start, again to stop and write the
+summary to the log). Only one run can be active at a time.
+
+cProfile only sees the thread it was enabled on. That is the event-loop
+thread, where every handler and cron runs. Stopping only disables the
+profiler and snapshots memory on the loop; comparing snapshots and writing
+the files happen on a worker thread, so a stop doesn't stall the bot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import dataclasses
+import datetime
+import io
+import pstats
+import signal
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import structlog
+
+from dragonpaw_bot.state_store import DEFAULT_STATE_DIR
+from dragonpaw_bot.utils import create_background_task
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = structlog.get_logger(__name__)
+
+PROFILE_DIR = DEFAULT_STATE_DIR / "profiles"
+#: Lines in each section of the summary.
+TOP_N = 15
+#: Stack depth tracemalloc records per allocation.
+TRACEMALLOC_FRAMES = 10
+#: Bounds on `/config debug profile` run length.
+MIN_SECONDS = 5
+MAX_SECONDS = 600
+
+
+class ProfilerBusy(Exception):
+    """Raised when a run is started while another is still going."""
+
+
+@dataclasses.dataclass
+class ProfileResult:
+    stem: Path
+    seconds: float
+    summary: str
+
+    @property
+    def files(self) -> list[Path]:
+        return [self.stem.with_suffix(ext) for ext in (".prof", ".mem.txt", ".txt")]
+
+
+def _short_path(filename: str) -> str:
+    """Trim site-packages and repo prefixes so summary lines stay readable."""
+    for marker in ("site-packages/", "dragonpaw_bot/"):
+        if marker in filename:
+            keep = "" if marker == "site-packages/" else marker
+            return keep + filename.split(marker, 1)[1]
+    return filename
+
+
+def _cpu_summary(stats: pstats.Stats, top: int) -> list[str]:
+    rows = sorted(
+        stats.stats.items(),
+        key=lambda item: item[1][2],
+        reverse=True,
+    )
+    lines = [f"{'own s':>8} {'cum s':>8} {'calls':>8}  function"]
+    for (filename, lineno, name), (_, calls, own, cum, _) in rows[:top]:
+        where = f"{_short_path(filename)}:{lineno}" if lineno else filename
+        lines.append(f"{own:8.3f} {cum:8.3f} {calls:8d}  {name} ({where})")
+    return lines
+
+
+def _memory_summary(diff: list[tracemalloc.StatisticDiff], top: int) -> list[str]:
+    lines = [f"{'grew KiB':>9} {'now KiB':>9}  allocated at"]
+    for stat in diff[:top]:
+        frame = stat.traceback[0]
+        lines.append(
+            f"{stat.size_diff / 1024:9.1f} {stat.size / 1024:9.1f}  "
+            f"{_short_path(frame.filename)}:{frame.lineno}"
+        )
+    return lines
+
+
+class ProfileRun:
+    """One start/stop cycle of cProfile plus tracemalloc snapshots."""
+
+    def __init__(self, trigger: str) -> None:
+        self.trigger = trigger
+        self.started_at = datetime.datetime.now(datetime.UTC)
+        self.seconds = 0.0
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._profiler = cProfile.Profile()
+        self._owns_tracemalloc = not tracemalloc.is_tracing()
+        if self._owns_tracemalloc:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        self._baseline = tracemalloc.take_snapshot()
+        self._profiler.enable()
+        logger.info("Profiling started", trigger=trigger)
+
+    def halt(self) -> None:
+        """Stop profiling and take the closing memory snapshot."""
+        self._profiler.disable()
+        self._snapshot = tracemalloc.take_snapshot()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+        self.seconds = (
+            datetime.datetime.now(datetime.UTC) - self.started_at
+        ).total_seconds()
+
+    async def write(self, top: int = TOP_N) -> ProfileResult:
+        """Write a halted run's results off the loop; returns where they went."""
+        return await asyncio.to_thread(self._write, top)
+
+    def _write(self, top: int) -> ProfileResult:
+        assert self._snapshot is not None, "halt() first"
+        snapshot, seconds = self._snapshot, self.seconds
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        stem = PROFILE_DIR / self.started_at.strftime("profile-%Y%m%dT%H%M%SZ")
+        self._profiler.dump_stats(stem.with_suffix(".prof"))
+
+        diff = snapshot.compare_to(self._baseline, "lineno")
+        with open(stem.with_suffix(".mem.txt"), "w") as f:
+            f.writelines(f"{stat}\n" for stat in diff)
+
+        stats = pstats.Stats(self._profiler, stream=io.StringIO())
+        summary = "\n".join(
+            [
+                f"Profile of {seconds:.0f}s ({self.trigger})",
+                "",
+                "CPU, by own time:",
+                *_cpu_summary(stats, top),
+                "",
+                "Memory, by growth:",
+                *_memory_summary(diff, top),
+            ]
+        )
+        stem.with_suffix(".txt").write_text(summary + "\n")
+        logger.info("Profiling finished", path=str(stem), seconds=round(seconds, 1))
+        return ProfileResult(stem=stem, seconds=seconds, summary=summary)
+
+
+_active: ProfileRun | None = None
+
+
+def is_running() -> bool:
+    return _active is not None
+
+
+def start(trigger: str) -> ProfileRun:
+    """Begin a run that lasts until `stop()`."""
+    global _active  # noqa: PLW0603
+    if _active is not None:
+        raise ProfilerBusy(f"A profile started by {_active.trigger} is running")
+    _active = ProfileRun(trigger)
+    return _active
+
+
+def _detach(run: ProfileRun | None = None) -> ProfileRun | None:
+    """Halt the active run (only if it is `run`, when given) and hand it back."""
+    global _active
+    if _active is None or (run is not None and run is not _active):
+        return None
+    active, _active = _active, None
+    active.halt()
+    return active
+
+
+async def stop(top: int = TOP_N, run: ProfileRun | None = None) -> ProfileResult | None:
+    """End the current run and write its results; None if nothing was running.
+
+    With `run`, only that run is stopped: None if it already ended, e.g. by
+    SIGUSR1, so a stale timer can't cut short whichever run came next.
+    """
+    active = _detach(run)
+    if active is None:
+        return None
+    return await active.write(top)
+
+
+async def _log_summary(run: ProfileRun) -> None:
+    result = await run.write()
+    logger.info("Profile summary", summary="\n" + result.summary)
+
+
+def _on_signal() -> None:
+    run = _detach()
+    if run is not None:
+        create_background_task(_log_summary(run))
+    else:
+        start("SIGUSR1")
+
+
+def install_signal_handler(loop: asyncio.AbstractEventLoop) -> None:
+    """SIGUSR1 toggles a profiling run; the summary goes to the log."""
+    loop.add_signal_handler(signal.SIGUSR1, _on_signal)
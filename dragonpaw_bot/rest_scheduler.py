@@ -0,0 +1,149 @@
+"""Priority gate for the bot's own background REST traffic.
+
+Hikari shares one set of rate-limit buckets between everything the bot does, so
+a big cron sweep (channel purges, role shuffles, DM runs) can queue a command's
+response behind hundreds of deletes. Background work takes a `slot()` before
+each REST call; interactive handlers mark themselves `busy()` while they run,
+and a slot counts as busy at its own priority while it waits and runs. A slot
+only opens once no higher-priority work is in flight, the
+route still has a free token, and the background pool isn't full.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import enum
+import time
+from typing import TYPE_CHECKING
+
+import structlog
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+logger = structlog.get_logger(__name__)
+
+#: Concurrent background calls allowed on one route (e.g. one channel's deletes).
+#: Kept below Discord's per-route buckets so interactive calls still find room.
+ROUTE_TOKENS = 2
+#: Concurrent background calls allowed across all routes.
+MAX_IN_FLIGHT = 8
+#: Longest a background call defers to higher-priority work before going anyway,
+#: so a handler that never finishes can't freeze every cron.
+MAX_YIELD_SECONDS = 30.0
+#: How often a waiting call re-checks, in case a wake-up was missed.
+_RECHECK_SECONDS = 1.0
+
+
+class Priority(enum.IntEnum):
+    """Lower value wins: background work yields to anything above it."""
+
+    INTERACTIVE = 0
+    EVENT = 1
+    CRON = 2
+
+
+class RestScheduler:
+    """Tracks in-flight work per priority and hands out per-route tokens."""
+
+    def __init__(
+        self,
+        *,
+        route_tokens: int = ROUTE_TOKENS,
+        max_in_flight: int = MAX_IN_FLIGHT,
+        max_yield_seconds: float = MAX_YIELD_SECONDS,
+    ) -> None:
+        self.route_tokens = route_tokens
+        self.max_in_flight = max_in_flight
+        self.max_yield_seconds = max_yield_seconds
+        self._busy: collections.Counter[Priority] = collections.Counter()
+        self._route_in_flight: collections.Counter[str] = collections.Counter()
+        self._in_flight = 0
+        # Plain futures rather than an asyncio.Condition: a module-level
+        # Condition binds to the first loop that waits on it.
+        self._waiters: list[asyncio.Future[None]] = []
+
+    @contextlib.contextmanager
+    def busy(self, priority: Priority) -> Iterator[None]:
+        """Mark work of this priority as in flight for the duration of the block."""
+        self._busy[priority] += 1
+        try:
+            yield
+        finally:
+            self._busy[priority] -= 1
+            self._wake()
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, route: str, priority: Priority = Priority.CRON
+    ) -> AsyncIterator[None]:
+        """Wait for a turn on `route`, then hold its token for the block.
+
+        The slot counts as busy work of its priority from the moment it starts
+        waiting, so an event call queued for a token holds back new cron calls.
+        """
+        with self.busy(priority):
+            async with self._acquire(route, priority):
+                yield
+
+    @contextlib.asynccontextmanager
+    async def _acquire(self, route: str, priority: Priority) -> AsyncIterator[None]:
+        started = time.monotonic()
+        while True:
+            yielding = time.monotonic() - started < self.max_yield_seconds
+            if not self._outranked(priority, yielding) and self._has_capacity(route):
+                break
+            await self._wait()
+
+        waited = time.monotonic() - started
+        if waited >= _RECHECK_SECONDS:
+            logger.debug(
+                "REST slot waited",
+                route=route,
+                priority=priority.name,
+                seconds=round(waited, 1),
+            )
+
+        self._route_in_flight[route] += 1
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._route_in_flight[route] -= 1
+            if not self._route_in_flight[route]:
+                del self._route_in_flight[route]
+            self._wake()
+
+    def _outranked(self, priority: Priority, yielding: bool) -> bool:
+        if not yielding:
+            return False
+        return any(self._busy[p] for p in Priority if p < priority)
+
+    def _has_capacity(self, route: str) -> bool:
+        return (
+            self._in_flight < self.max_in_flight
+            and self._route_in_flight[route] < self.route_tokens
+        )
+
+    async def _wait(self) -> None:
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            await asyncio.wait_for(fut, _RECHECK_SECONDS)
+        except TimeoutError:
+            pass
+        finally:
+            with contextlib.suppress(ValueError):
+                self._waiters.remove(fut)
+
+    def _wake(self) -> None:
+        waiters, self._waiters = self._waiters, []
+        for fut in waiters:
+            if not fut.done():
+                fut.set_result(None)
+
+
+scheduler = RestScheduler()
@@ -13,6 +13,8 @@ import safer
 import structlog
 import yaml
 
+from dragonpaw_bot import metrics
+
 logger = structlog.get_logger(__name__)
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
@@ -41,8 +43,10 @@ class GuildStateStore[StateT: GuildStateBase]:
     def load(self, guild_id: int) -> StateT:
         """Load guild state from cache or disk. Returns empty state if none exists."""
         if guild_id in self.cache:
+            metrics.state_cache.inc(store=self.name, result="hit")
             return self.cache[guild_id]
 
+        metrics.state_cache.inc(store=self.name, result="miss")
         path = self.path(guild_id)
         data = None
         if path.exists():
@@ -50,7 +54,7 @@ class GuildStateStore[StateT: GuildStateBase]:
                 "Loading state", store=self.name, guild_id=guild_id, path=str(path)
             )
             try:
-                with open(path) as f:
+                with open(path) as f, metrics.state_load_seconds.time(store=self.name):
                     data = yaml.safe_load(f)
             except (OSError, yaml.YAMLError):
                 logger.exception(
@@ -76,6 +80,7 @@ class GuildStateStore[StateT: GuildStateBase]:
                 raise
 
         self.cache[guild_id] = st
+        metrics.state_cached_guilds.set(len(self.cache), store=self.name)
         return st
 
     def save(self, guild_state: StateT) -> None:
@@ -89,7 +94,10 @@ class GuildStateStore[StateT: GuildStateBase]:
         )
         self.state_dir.mkdir(parents=True, exist_ok=True)
         try:
-            with safer.open(path, "w") as f:
+            with (
+                metrics.state_save_seconds.time(store=self.name),
+                safer.open(path, "w") as f,
+            ):
                 yaml.dump(
                     guild_state.model_dump(mode="json"),
                     f,
@@ -105,3 +113,4 @@ class GuildStateStore[StateT: GuildStateBase]:
             )
             raise
         self.cache[guild_state.guild_id] = guild_state
+        metrics.state_cached_guilds.set(len(self.cache), store=self.name)
@@ -6,6 +6,20 @@ import hikari
 import pydantic
 
 
+# ---------------------------------------------------------------------------- #
+#       Posted messages: what the bot last published into a managed channel    #
+# ---------------------------------------------------------------------------- #
+class PostedMessage(pydantic.BaseModel):
+    """One message the bot published, with a digest of what it said.
+
+    Kept in channel order, so a refresh can edit just the messages whose
+    digest changed; see ``ChannelContext.publish``.
+    """
+
+    message_id: int
+    digest: str
+
+
 # ---------------------------------------------------------------------------- #
 #              States: The thing we keep after setting up the Guild            #
 # ---------------------------------------------------------------------------- #
@@ -21,6 +35,34 @@ class GuildState(pydantic.BaseModel):
     log_channel_id: hikari.Snowflake | None = None
     general_channel_id: hikari.Snowflake | None = None
     button_channel_id: hikari.Snowflake | None = None
+    button_messages: list[PostedMessage] = pydantic.Field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------- #
+#          Purge marks: how far a channel's cleanup has already scanned        #
+# ---------------------------------------------------------------------------- #
+class PurgeMarks(pydantic.BaseModel):
+    """Where the last completed cleanup run left a channel.
+
+    Everything between ``oldest_surviving_id`` and ``last_scanned_id`` is known
+    to be clear or queued in ``backlog`` (bar pinned messages), so the next run
+    only pages through what is newer than ``last_scanned_id`` plus whatever is
+    at or below ``oldest_surviving_id`` when the backlog filled up before the
+    pager reached it.
+
+    ``backlog`` holds ids too old to bulk-delete, oldest-paged last; they are
+    single-deleted a few per run without fetching their history again.
+
+    While a run is in progress, ``cursor_id`` is the oldest message it has
+    finished with and ``run_cutoff_id`` the cutoff it started from, so a run
+    cut short by a restart picks up from the cursor instead of the top.
+    """
+
+    last_scanned_id: int | None = None
+    oldest_surviving_id: int | None = None
+    run_cutoff_id: int | None = None
+    cursor_id: int | None = None
+    backlog: list[int] = pydantic.Field(default_factory=list)
 
 
 # ---------------------------------------------------------------------------- #
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import re
-from collections.abc import Awaitable, Callable, Coroutine, Mapping, Sequence
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterable,
+    Mapping,
+    Sequence,
+)
 from typing import TYPE_CHECKING, Any
 
 import hikari
 import hikari.messages
 import structlog
-from emojis.db.db import EMOJI_DB
 
 if TYPE_CHECKING:
     from dragonpaw_bot.bot import DragonpawBot
@@ -148,20 +155,58 @@ async def guild_channel_by_name(
     return None
 
 
-async def guild_emojis(
-    gc: GuildContext,
-) -> Mapping[str, hikari.KnownCustomEmoji | hikari.UnicodeEmoji]:
-    emoji_map: dict[str, hikari.KnownCustomEmoji | hikari.UnicodeEmoji] = {}
+#: Every unicode emoji by its aliases, built from EMOJI_DB on first use.
+_unicode_emojis: dict[str, hikari.KnownCustomEmoji | hikari.UnicodeEmoji] | None = None
+
+# Each guild's custom emojis by name, read from the hikari cache on first use
+# and replaced by the EmojisUpdateEvent listener in bot.py. Both tables carry the
+# union value type so guild_emojis can chain them (dict values are invariant).
+_custom_emojis: dict[
+    hikari.Snowflake, dict[str, hikari.KnownCustomEmoji | hikari.UnicodeEmoji]
+] = {}
+
+
+def _unicode_emoji_table() -> dict[str, hikari.KnownCustomEmoji | hikari.UnicodeEmoji]:
+    global _unicode_emojis  # noqa: PLW0603
+    if _unicode_emojis is None:
+        # The emoji database is large; load it on the first lookup, not at startup.
+        from emojis.db.db import EMOJI_DB  # noqa: PLC0415
+
+        table: dict[str, hikari.KnownCustomEmoji | hikari.UnicodeEmoji] = {}
+        for u in EMOJI_DB:
+            emoji = hikari.UnicodeEmoji.parse(u.emoji)
+            for alias in u.aliases:
+                table[alias] = emoji
+        _unicode_emojis = table
+    return _unicode_emojis
 
-    for e in gc.bot.cache.get_emojis_view_for_guild(gc.guild_id).values():
-        emoji_map[e.name] = e
-        logger.debug("Guild emoji", name=e.name, emoji=e)
 
-    for u in EMOJI_DB:
-        for alias in u.aliases:
-            emoji_map[alias] = hikari.UnicodeEmoji.parse(u.emoji)
+def update_guild_emojis(
+    guild_id: hikari.Snowflake, emojis: Iterable[hikari.KnownCustomEmoji]
+) -> None:
+    """Replace a guild's custom emoji map, e.g. from an EmojisUpdateEvent."""
+    custom: dict[str, hikari.KnownCustomEmoji | hikari.UnicodeEmoji] = {
+        e.name: e for e in emojis
+    }
+    _custom_emojis[guild_id] = custom
+
+
+def invalidate_emojis(guild_id: hikari.Snowflake) -> None:
+    """Forget a guild's custom emojis; the next lookup rereads the cache."""
+    _custom_emojis.pop(guild_id, None)
+
 
-    return emoji_map
+async def guild_emojis(
+    gc: GuildContext,
+) -> Mapping[str, hikari.KnownCustomEmoji | hikari.UnicodeEmoji]:
+    """Emojis by name: the guild's custom ones, then every unicode alias."""
+    custom = _custom_emojis.get(gc.guild_id)
+    if custom is None:
+        update_guild_emojis(
+            gc.guild_id, gc.bot.cache.get_emojis_view_for_guild(gc.guild_id).values()
+        )
+        custom = _custom_emojis[gc.guild_id]
+    return collections.ChainMap(custom, _unicode_emoji_table())
 
 
 async def guild_roles(gc: GuildContext) -> Mapping[str, hikari.Role]:
@@ -0,0 +1,86 @@
+"""Profile what importing the bot costs, and fail if startup has regressed.
+
+Runs ``python -X importtime -c "import dragonpaw_bot.bot"`` in a fresh
+interpreter and prints the slowest modules by cumulative time. Exits non-zero
+when the total import time is over budget, or when a dependency that should
+load on first use (Pillow, palettable, the emoji database) got pulled in at
+startup.
+
+    uv run python scripts/import_profile.py [--top 25] [--budget 2.5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+#: Modules that must not be imported until something actually needs them.
+LAZY_MODULES = ("PIL", "palettable", "emojis")
+#: Seconds `import dragonpaw_bot.bot` may take before this script complains.
+DEFAULT_BUDGET = 2.5
+
+# bot.py reads these at import time; the token only has to parse.
+DUMMY_ENV = {
+    "BOT_TOKEN": "MTIzNDU2Nzg5MDEyMzQ1Njc4OQ.GabcDE.fake",
+    "CLIENT_ID": "1",
+}
+
+
+def profile() -> list[tuple[str, int, int]]:
+    """(module, self µs, cumulative µs) for every module imported, in order."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import dragonpaw_bot.bot"],
+        cwd=ROOT,
+        env={**DUMMY_ENV, **os.environ},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        rows.append((name.strip(), int(own), int(cumulative)))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET)
+    args = parser.parse_args()
+
+    rows = profile()
+    total = sum(own for _, own, _ in rows) / 1e6
+    print(f"{'cum ms':>8} {'self ms':>8}  module")
+    for name, own, cumulative in sorted(rows, key=lambda r: r[2], reverse=True)[
+        : args.top
+    ]:
+        print(f"{cumulative / 1000:8.1f} {own / 1000:8.1f}  {name}")
+    print(f"\n{len(rows)} modules, {total:.2f}s total (budget {args.budget:.2f}s)")
+
+    failed = False
+    eager = sorted(
+        {
+            name
+            for name, _, _ in rows
+            if any(name == m or name.startswith(m + ".") for m in LAZY_MODULES)
+        }
+    )
+    if eager:
+        print(f"Imported at startup but should be lazy: {', '.join(eager)}")
+        failed = True
+    if total > args.budget:
+        print(f"Import time {total:.2f}s is over the {args.budget:.2f}s budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,7 +9,8 @@ os.environ.setdefault(
 os.environ.setdefault("CLIENT_ID", "000000000000000000")
 
 import dragonpaw_bot.bot as bot_module
-from dragonpaw_bot import journal
+from dragonpaw_bot import context, dm, journal, metrics, utils
+from dragonpaw_bot import logging as bot_logging
 
 
 @pytest.fixture()
@@ -31,3 +32,60 @@ def _isolate_journal_store(monkeypatch, tmp_path):
     journal.store.cache.clear()
     yield
     journal.store.cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_permission_cache():
+    """Bot permissions are cached per guild/channel; tests reuse the same ids."""
+    context._guild_perms.clear()
+    context._channel_perms.clear()
+    yield
+    context._guild_perms.clear()
+    context._channel_perms.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_bot_owners():
+    """The bot's owners are looked up once per process."""
+    context._bot_owner_ids.clear()
+    yield
+    context._bot_owner_ids.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_emoji_cache():
+    """Custom emoji maps are cached per guild; tests reuse the same ids."""
+    utils._custom_emojis.clear()
+    yield
+    utils._custom_emojis.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_metrics():
+    """Metrics are process-wide totals; start every test from zero."""
+    metrics.registry.clear()
+    yield
+    metrics.registry.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_log_sampling():
+    """Debug repeats are counted process-wide; don't let one test mute another."""
+    bot_logging.rate_limiter.reset()
+    yield
+    bot_logging.rate_limiter.reset()
+
+
+@pytest.fixture(autouse=True)
+def _unpaced_dms(monkeypatch):
+    """The DM pacer is shared process-wide; give each test a fresh, fast one."""
+    monkeypatch.setattr(dm, "pacer", dm.TokenBucket(rate=1000.0, burst=1000))
+
+
+@pytest.fixture(autouse=True)
+def _isolate_dm_channels(monkeypatch, tmp_path):
+    """Every DM records its channel on disk; keep that out of state/."""
+    monkeypatch.setattr(dm.channels, "state_dir", tmp_path)
+    dm.channels.clear()
+    yield
+    dm.channels.clear()
@@ -7,10 +7,20 @@ import pytest
 
 from dragonpaw_bot.plugins.birthdays import config as birthdays_config
 from dragonpaw_bot.plugins.birthdays import cron as birthdays_cron
+from dragonpaw_bot.plugins.birthdays import schedule as birthdays_schedule
 from dragonpaw_bot.plugins.birthdays import state as birthdays_state
+from dragonpaw_bot.plugins.birthdays import timezones as birthdays_timezones
 from dragonpaw_bot.plugins.birthdays.commands import _days_until_birthday
 from dragonpaw_bot.plugins.birthdays.models import BirthdayEntry, BirthdayGuildState
 
+
+@pytest.fixture(autouse=True)
+def _clear_schedules():
+    birthdays_schedule._schedules.clear()
+    yield
+    birthdays_schedule._schedules.clear()
+
+
 # ---------------------------------------------------------------------------- #
 #                          process_guild_birthdays                             #
 # ---------------------------------------------------------------------------- #
@@ -34,9 +44,6 @@ async def test_cron_processes_entry_without_timezone(tmp_path, monkeypatch):
     )
     birthdays_state.save(st)
 
-    # Pin the clock to the user's local midnight so the hourly gate opens.
-    monkeypatch.setattr(birthdays_cron.commands, "user_local_hour", lambda _e: 0)
-
     member = Mock()
     member.display_name = "Birthday Person"
     monkeypatch.setattr(
@@ -54,7 +61,9 @@ async def test_cron_processes_entry_without_timezone(tmp_path, monkeypatch):
     gc.name = "TestGuild"
     gc.logger = MagicMock()
 
-    await birthdays_cron.process_guild_birthdays(gc)
+    # Just after the user's local midnight, the first run that sees the event.
+    now = datetime.datetime.combine(today, datetime.time(0, 5), datetime.UTC)
+    await birthdays_cron.process_guild_birthdays(gc, now)
 
     assert announced == [42]
     birthdays_state.store.cache.clear()
@@ -160,3 +169,127 @@ def test_entry_rejects_feb_30():
 def test_entry_rejects_april_31():
     with pytest.raises(pydantic.ValidationError):
         BirthdayEntry(user_id=1, month=4, day=31)
+
+
+# ---------------------------------------------------------------------------- #
+#                               Fire schedule                                  #
+# ---------------------------------------------------------------------------- #
+
+UTC = datetime.UTC
+
+
+def _at(*args: int) -> datetime.datetime:
+    return datetime.datetime(*args, tzinfo=UTC)
+
+
+def test_next_fire_uses_local_midnight():
+    entry = BirthdayEntry(user_id=1, month=6, day=10, timezone="America/New_York")
+    fire = birthdays_schedule.next_fire(
+        entry, birthdays_schedule.FireKind.ANNOUNCE, _at(2026, 1, 1), 1
+    )
+    assert fire.at == _at(2026, 6, 10, 4)  # EDT midnight
+    assert fire.date == datetime.date(2026, 6, 10)
+
+
+def test_next_fire_week_ahead_wraps_year():
+    entry = BirthdayEntry(user_id=1, month=1, day=3)
+    fire = birthdays_schedule.next_fire(
+        entry, birthdays_schedule.FireKind.WEEK_AHEAD, _at(2026, 12, 1), 1
+    )
+    assert fire.at == _at(2026, 12, 27)
+
+
+def test_next_fire_feb29_falls_on_mar1_in_common_years():
+    entry = BirthdayEntry(user_id=1, month=2, day=29)
+    fire = birthdays_schedule.next_fire(
+        entry, birthdays_schedule.FireKind.ANNOUNCE, _at(2027, 1, 1), 1
+    )
+    assert fire.date == datetime.date(2027, 3, 1)
+
+
+def test_schedule_pops_only_due_events_in_order():
+    sched = birthdays_schedule.GuildSchedule()
+    sched.schedule(BirthdayEntry(user_id=1, month=3, day=5), _at(2026, 1, 1))
+    sched.schedule(BirthdayEntry(user_id=2, month=3, day=1), _at(2026, 1, 1))
+    due = sched.pop_due(_at(2026, 3, 2))
+    assert [(f.user_id, f.kind) for f in due] == [
+        (2, birthdays_schedule.FireKind.WEEK_AHEAD),
+        (1, birthdays_schedule.FireKind.WEEK_AHEAD),
+        (2, birthdays_schedule.FireKind.ANNOUNCE),
+        (2, birthdays_schedule.FireKind.ROLE_CLEANUP),
+    ]
+    assert sched.pop_due(_at(2026, 3, 2)) == []
+
+
+def test_schedule_skips_removed_and_superseded_entries():
+    sched = birthdays_schedule.GuildSchedule()
+    sched.schedule(BirthdayEntry(user_id=1, month=3, day=5), _at(2026, 1, 1))
+    sched.schedule(BirthdayEntry(user_id=2, month=3, day=5), _at(2026, 1, 1))
+    sched.remove(1)
+    sched.schedule(BirthdayEntry(user_id=2, month=4, day=5), _at(2026, 1, 1))
+    due = sched.pop_due(_at(2026, 3, 31))
+    assert [(f.user_id, f.date) for f in due] == [(2, datetime.date(2026, 3, 29))]
+
+
+def test_schedule_readded_entry_fires_once():
+    sched = birthdays_schedule.GuildSchedule()
+    sched.schedule(BirthdayEntry(user_id=1, month=3, day=5), _at(2026, 1, 1))
+    sched.remove(1)
+    sched.schedule(BirthdayEntry(user_id=1, month=3, day=5), _at(2026, 1, 1))
+    due = sched.pop_due(_at(2026, 3, 5, 12))
+    kinds = [f.kind for f in due]
+    assert kinds.count(birthdays_schedule.FireKind.ANNOUNCE) == 1
+
+
+def test_schedule_reschedules_next_year_after_firing():
+    entry = BirthdayEntry(user_id=1, month=3, day=5)
+    sched = birthdays_schedule.GuildSchedule()
+    sched.schedule(entry, _at(2026, 3, 4, 12))
+    (fire,) = sched.pop_due(_at(2026, 3, 5, 1))
+    sched.reschedule(entry, fire)
+    assert sched.pop_due(_at(2027, 3, 5, 1))[-1].date == datetime.date(2027, 3, 5)
+
+
+async def test_cron_does_nothing_when_no_event_due(tmp_path, monkeypatch):
+    monkeypatch.setattr(birthdays_state.store, "state_dir", tmp_path)
+    birthdays_state.store.cache.clear()
+    birthdays_state.save(
+        BirthdayGuildState(
+            guild_id=1, birthdays={42: BirthdayEntry(user_id=42, month=3, day=5)}
+        )
+    )
+    lookup = AsyncMock()
+    monkeypatch.setattr(birthdays_cron.utils, "guild_member", lookup)
+    gc = MagicMock()
+    gc.guild_id = hikari.Snowflake(1)
+
+    await birthdays_cron.process_guild_birthdays(gc, _at(2026, 3, 5, 2))
+
+    lookup.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------- #
+#                               Timezones                                      #
+# ---------------------------------------------------------------------------- #
+
+
+def test_zone_lookup_is_memoized():
+    birthdays_timezones.zone.cache_clear()
+    first = birthdays_timezones.zone("Europe/Berlin")
+    assert birthdays_timezones.zone("Europe/Berlin") is first
+    assert birthdays_timezones.zone.cache_info().hits == 1
+
+
+def test_zone_unknown_name_is_none():
+    assert birthdays_timezones.zone("Mars/Olympus_Mons") is None
+
+
+def test_local_date_uses_given_clock():
+    entry = BirthdayEntry(user_id=1, month=1, day=1, timezone="Asia/Tokyo")
+    now = _at(2026, 3, 4, 20)  # Already the 5th in Tokyo
+    assert birthdays_timezones.local_date(entry, now) == datetime.date(2026, 3, 5)
+
+
+def test_entry_zone_falls_back_to_utc_for_bad_state():
+    entry = BirthdayEntry.model_construct(user_id=1, month=1, day=1, timezone="Nope")
+    assert birthdays_timezones.entry_zone(entry) is datetime.UTC
@@ -1,5 +1,8 @@
 import datetime
 import logging
+import subprocess
+import sys
+import time
 import tomllib
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock
@@ -10,6 +13,7 @@ import pytest
 import yaml
 
 import dragonpaw_bot.bot as bot_module
+from dragonpaw_bot import metrics
 from dragonpaw_bot.bot import (
     STATE_DIR,
     _state_to_yaml_dict,
@@ -281,3 +285,40 @@ async def test_handler_exception_logs_and_responds(monkeypatch, caplog):
     interaction.create_initial_response.assert_called_once()
     call_kwargs = interaction.create_initial_response.call_args
     assert "error occurred" in str(call_kwargs).lower()
+
+
+async def test_dispatch_time_is_recorded_per_plugin(monkeypatch):
+    handler = AsyncMock()
+    monkeypatch.setattr(
+        bot_module, "_INTERACTION_ROUTES", [("test_prefix:", handler, "testing")]
+    )
+
+    await on_component_interaction(_make_component_event("test_prefix:123"))
+
+    handler.assert_awaited_once()
+    assert metrics.interaction_seconds.count(plugin="testing", kind="component") == 1
+
+
+def test_startup_time_is_recorded_once(monkeypatch):
+    monkeypatch.setattr(bot_module, "STARTED_AT", time.monotonic() - 3)
+    bot_module._record_startup()
+    # A reconnect much later doesn't overwrite the first connect's time.
+    monkeypatch.setattr(bot_module, "STARTED_AT", time.monotonic() - 900)
+    bot_module._record_startup()
+
+    assert 3 <= metrics.startup_seconds.value() < 60
+
+
+def test_heavy_dependencies_load_on_first_use():
+    code = (
+        "import sys, dragonpaw_bot.bot; "
+        "print(sorted(m for m in ('PIL', 'palettable', 'emojis') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.splitlines()[-1] == "[]"
@@ -1,6 +1,7 @@
 """Tests for the button channel."""
 
 import datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import hikari
@@ -12,6 +13,7 @@ import dragonpaw_bot.plugins.subday.state as subday_state
 import dragonpaw_bot.plugins.tickets.state as tickets_state
 from dragonpaw_bot import buttons
 from dragonpaw_bot.bot import _INTERACTION_ROUTES
+from dragonpaw_bot.context import ChannelContext
 from dragonpaw_bot.plugins.activity.models import ActivityGuildMeta
 from dragonpaw_bot.plugins.birthdays.models import (
     BirthdayGuildConfig,
@@ -197,12 +199,10 @@ def _guild_context(button_channel_id: int | None) -> MagicMock:
 def no_perm_problems(monkeypatch):
     """ChannelContext built by post_buttons reports full permissions and a
     no-op wipe."""
-    cc = MagicMock()
-    cc.channel_name = "buttons"
-    cc.check_perms = AsyncMock(return_value=[])
-    cc.delete_my_messages = AsyncMock()
-    monkeypatch.setattr(buttons, "_channel_context", lambda gc, channel_id: cc)
-    return cc
+    wipe = AsyncMock()
+    monkeypatch.setattr(ChannelContext, "check_perms", AsyncMock(return_value=[]))
+    monkeypatch.setattr(ChannelContext, "delete_my_messages", wipe)
+    return SimpleNamespace(delete_my_messages=wipe)
 
 
 async def test_post_buttons_without_a_channel_warns(isolated_state):
@@ -244,6 +244,18 @@ async def test_post_buttons_posts_a_note_when_nothing_is_configured(
     )
 
 
+async def test_post_buttons_records_what_it_posted(isolated_state, no_perm_problems):
+    tickets_state.save(TicketGuildState(guild_id=GUILD_ID, staff_role_id=77))
+    gc = _guild_context(CHANNEL_ID)
+    gc.bot.rest.create_message.return_value = MagicMock(id=hikari.Snowflake(901))
+
+    await buttons.post_buttons(gc)
+
+    state = gc.state.return_value
+    assert [p.message_id for p in state.button_messages] == [901]
+    gc.bot.state_update.assert_called_once_with(state)
+
+
 async def test_post_buttons_bails_on_missing_permissions(isolated_state, monkeypatch):
     tickets_state.save(TicketGuildState(guild_id=GUILD_ID, staff_role_id=77))
 
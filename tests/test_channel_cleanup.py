@@ -157,7 +157,9 @@ async def test_cron_isolates_run_cleanup_failures(monkeypatch):
 
     monkeypatch.setattr(cleanup_state, "load", fake_load)
 
-    async def flaky_run_cleanup(self, expiry_minutes):
+    async def flaky_run_cleanup(
+        self, expiry_minutes, marks=None, checkpoint=None, threads=None
+    ):
         if int(self.channel_id) == 300:
             raise RuntimeError("simulated cleanup error")
 
@@ -167,3 +169,52 @@ async def test_cron_isolates_run_cleanup_failures(monkeypatch):
 
     # Cron must not raise — _safe_run_cleanup catches per-task failures
     await cleanup_cron.channel_cleanup_hourly(bot)
+
+
+async def test_cron_saves_state_when_purge_marks_move(monkeypatch):
+    bot = _make_cron_bot([1])
+    st = CleanupGuildState(
+        guild_id=1,
+        channels=[
+            CleanupChannelEntry(
+                channel_id=300, channel_name="venting", expiry_minutes=60
+            )
+        ],
+    )
+    monkeypatch.setattr(cleanup_state, "load", lambda _gid: st)
+    save = MagicMock()
+    monkeypatch.setattr(cleanup_state, "save", save)
+
+    async def advancing_run_cleanup(
+        self, expiry_minutes, marks=None, checkpoint=None, threads=None
+    ):
+        marks.last_scanned_id = 12345
+
+    monkeypatch.setattr(
+        "dragonpaw_bot.context.ChannelContext.run_cleanup", advancing_run_cleanup
+    )
+
+    await cleanup_cron.channel_cleanup_hourly(bot)
+
+    save.assert_called_once_with(st)
+    assert st.channels[0].purge_marks.last_scanned_id == 12345
+
+
+async def test_cron_skips_save_when_purge_marks_unchanged(monkeypatch):
+    bot = _make_cron_bot([1])
+    st = CleanupGuildState(
+        guild_id=1,
+        channels=[
+            CleanupChannelEntry(
+                channel_id=300, channel_name="venting", expiry_minutes=60
+            )
+        ],
+    )
+    monkeypatch.setattr(cleanup_state, "load", lambda _gid: st)
+    save = MagicMock()
+    monkeypatch.setattr(cleanup_state, "save", save)
+    monkeypatch.setattr("dragonpaw_bot.context.ChannelContext.run_cleanup", AsyncMock())
+
+    await cleanup_cron.channel_cleanup_hourly(bot)
+
+    save.assert_not_called()
@@ -8,7 +8,9 @@ import pytest
 from dragonpaw_bot import journal
 from dragonpaw_bot.context import (
     PRIVATE_CHANNEL_USER_PERMS,
+    ChannelContext,
     GuildContext,
+    OutgoingMessage,
     actor_name,
     check_guild_perms,
     is_guild_admin,
@@ -50,6 +52,7 @@ def _mock_bot_for_guild(
         extra_role = Mock(spec=hikari.Role)
         extra_role.id = hikari.Snowflake(999)
         extra_role.permissions = extra_role_perms
+        extra_role.position = 1
         role_map[extra_role.id] = extra_role
         member.role_ids = [extra_role.id]
     else:
@@ -433,3 +436,86 @@ async def test_user_without_kind_raises(journal_store):
     gc = _journal_gc(log_channel_id=hikari.Snowflake(99))
     with pytest.raises(ValueError):
         await gc.log("x", journal_user=_subject())
+
+
+# ---------------------------------------------------------------------------- #
+#                           ChannelContext.publish                              #
+# ---------------------------------------------------------------------------- #
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+def _publish_cc(*, in_channel: list[int]) -> ChannelContext:
+    """A ChannelContext whose channel holds bot messages with these ids."""
+    bot = Mock()
+    bot.user_id = BOT_USER_ID
+    history = [
+        Mock(id=hikari.Snowflake(i), author=Mock(id=BOT_USER_ID)) for i in in_channel
+    ]
+    bot.rest.fetch_messages = Mock(
+        return_value=Mock(limit=Mock(side_effect=lambda _n: _aiter(history)))
+    )
+    bot.rest.create_message = AsyncMock(
+        side_effect=[Mock(id=hikari.Snowflake(i)) for i in range(900, 910)]
+    )
+    bot.rest.edit_message = AsyncMock()
+    bot.rest.delete_message = AsyncMock()
+    gc = GuildContext(bot=bot, guild_id=GUILD_ID, name="Test", log_channel_id=None)
+    cc = ChannelContext.from_channel(gc, 70, "roles")
+    cc.delete_my_messages = AsyncMock()
+    return cc
+
+
+def _cards(*titles: str) -> list[OutgoingMessage]:
+    return [OutgoingMessage(embed=hikari.Embed(title=t)) for t in titles]
+
+
+async def test_publish_first_time_wipes_and_posts():
+    cc = _publish_cc(in_channel=[])
+
+    posted = await cc.publish(_cards("a", "b"), [])
+
+    cc.delete_my_messages.assert_awaited_once_with(None)
+    assert [p.message_id for p in posted] == [900, 901]
+
+
+async def test_publish_unchanged_makes_no_writes():
+    cc = _publish_cc(in_channel=[])
+    posted = await cc.publish(_cards("a", "b"), [])
+    cc = _publish_cc(in_channel=[900, 901])
+
+    again = await cc.publish(_cards("a", "b"), posted)
+
+    assert again == posted
+    cc.bot.rest.create_message.assert_not_awaited()
+    cc.bot.rest.edit_message.assert_not_awaited()
+    cc.delete_my_messages.assert_not_awaited()
+
+
+async def test_publish_edits_changed_and_trims_extras():
+    cc = _publish_cc(in_channel=[])
+    posted = await cc.publish(_cards("a", "b", "c"), [])
+    cc = _publish_cc(in_channel=[900, 901, 902])
+
+    again = await cc.publish(_cards("a", "B"), posted)
+
+    cc.bot.rest.edit_message.assert_awaited_once()
+    assert cc.bot.rest.edit_message.await_args.args[1] == 901
+    cc.bot.rest.delete_message.assert_awaited_once_with(cc.channel_id, 902)
+    assert [p.message_id for p in again] == [900, 901]
+
+
+async def test_publish_reposts_when_messages_went_missing():
+    cc = _publish_cc(in_channel=[])
+    posted = await cc.publish(_cards("a", "b"), [])
+    cc = _publish_cc(in_channel=[900])
+
+    again = await cc.publish(_cards("a", "b"), posted)
+
+    # The wipe needn't look further back than the oldest message it posted.
+    cc.delete_my_messages.assert_awaited_once_with(900)
+    assert cc.bot.rest.create_message.await_count == 2
+    assert len(again) == 2
@@ -0,0 +1,182 @@
+import asyncio
+import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import hikari
+import pytest
+
+from dragonpaw_bot import dm
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch):
+    monkeypatch.setattr(dm, "BACKOFF_SECONDS", 0.0)
+
+
+def _app() -> MagicMock:
+    """A bot whose DM channel for user N has id N + 1000."""
+    app = MagicMock()
+    app.rest.create_dm_channel = AsyncMock(
+        side_effect=lambda user_id: MagicMock(id=int(user_id) + 1000)
+    )
+    app.rest.create_message = AsyncMock()
+    return app
+
+
+def _forbidden() -> hikari.ForbiddenError:
+    return hikari.ForbiddenError(url="", headers={}, raw_body=b"")
+
+
+def _not_found() -> hikari.NotFoundError:
+    return hikari.NotFoundError(url="", headers={}, raw_body=b"")
+
+
+def _server_error() -> hikari.InternalServerError:
+    return hikari.InternalServerError(url="", status=500, headers={}, raw_body=b"")
+
+
+# ---------------------------------------------------------------------------- #
+#                                   Batches                                    #
+# ---------------------------------------------------------------------------- #
+
+
+async def test_batch_sends_and_reports():
+    app = _app()
+
+    async with dm.DMBatch(app, "test") as batch:
+        for user_id in range(1, 4):
+            batch.send(user_id, content="hi")
+
+    assert app.rest.create_message.await_count == 3
+    app.rest.create_message.assert_any_await(1001, content="hi")
+    assert batch.report.sent == 3
+    assert batch.report.undelivered == 0
+
+
+async def test_forbidden_is_not_retried():
+    app = _app()
+    app.rest.create_message.side_effect = _forbidden()
+    on_sent = MagicMock()
+
+    async with dm.DMBatch(app, "test") as batch:
+        outcome = batch.send(1, content="hi", on_sent=on_sent)
+
+    assert outcome.result() is dm.DMOutcome.FORBIDDEN
+    assert app.rest.create_message.await_count == 1
+    on_sent.assert_not_called()
+
+
+async def test_server_error_is_retried_then_sent():
+    app = _app()
+    app.rest.create_message.side_effect = [_server_error(), None]
+    on_sent = MagicMock()
+
+    async with dm.DMBatch(app, "test") as batch:
+        batch.send(1, content="hi", on_sent=on_sent)
+
+    assert app.rest.create_message.await_count == 2
+    assert batch.report.sent == 1
+    assert batch.report.retries == 1
+    on_sent.assert_called_once()
+
+
+async def test_gives_up_after_max_attempts():
+    app = _app()
+    app.rest.create_message.side_effect = _server_error()
+
+    async with dm.DMBatch(app, "test") as batch:
+        batch.send(1, content="hi")
+
+    assert app.rest.create_message.await_count == dm.MAX_ATTEMPTS
+    assert batch.report.failed == 1
+
+
+async def test_batch_caps_concurrent_sends():
+    app = _app()
+    peak = 0
+    active = 0
+
+    async def slow_send(*_args, **_kwargs):
+        nonlocal peak, active
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    app.rest.create_message.side_effect = slow_send
+
+    async with dm.DMBatch(app, "test", concurrency=2) as batch:
+        for user_id in range(6):
+            batch.send(user_id, content="hi")
+
+    assert peak == 2
+    assert batch.report.sent == 6
+
+
+async def test_token_bucket_paces_after_burst(monkeypatch):
+    sleep = AsyncMock()
+    monkeypatch.setattr(dm.asyncio, "sleep", sleep)
+    bucket = dm.TokenBucket(rate=2.0, burst=2)
+
+    for _ in range(4):
+        await bucket.take()
+
+    # Two free tokens, then each caller waits off its own growing deficit.
+    delays = [c.args[0] for c in sleep.await_args_list]
+    assert len(delays) == 2
+    assert delays[0] == pytest.approx(0.5, abs=0.05)
+    assert delays[1] == pytest.approx(1.0, abs=0.05)
+
+
+# ---------------------------------------------------------------------------- #
+#                               DM channel cache                               #
+# ---------------------------------------------------------------------------- #
+
+
+async def test_repeat_dm_skips_channel_lookup():
+    app = _app()
+
+    await dm.send(app, 7, content="one")
+    await dm.send(app, 7, content="two")
+
+    app.rest.create_dm_channel.assert_awaited_once_with(7)
+    app.rest.create_message.assert_awaited_with(1007, content="two")
+
+
+async def test_channel_cache_survives_restart():
+    await dm.send(_app(), 7, content="one")
+    dm.channels.clear()
+
+    app = _app()
+    await dm.send(app, 7, content="two")
+
+    app.rest.create_dm_channel.assert_not_awaited()
+
+
+async def test_stale_channel_is_looked_up_again():
+    dm.channels.put(7, 555)
+    app = _app()
+    app.rest.create_message.side_effect = [_not_found(), None]
+
+    await dm.send(app, 7, content="hi")
+
+    app.rest.create_dm_channel.assert_awaited_once_with(7)
+    assert dm.channels.get(7) == 1007
+
+
+async def test_forbidden_forgets_cached_channel():
+    dm.channels.put(7, 1007)
+    app = _app()
+    app.rest.create_message.side_effect = _forbidden()
+
+    with pytest.raises(hikari.ForbiddenError):
+        await dm.send(app, 7, content="hi")
+
+    assert dm.channels.get(7) is None
+
+
+def test_expired_channel_is_dropped(monkeypatch):
+    dm.channels.put(7, 1007)
+    monkeypatch.setattr(dm, "DM_CHANNEL_TTL", datetime.timedelta(0))
+
+    assert dm.channels.get(7) is None
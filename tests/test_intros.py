@@ -1,3 +1,5 @@
+import itertools
+from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
@@ -48,14 +50,19 @@ def _member(
     return m
 
 
+_message_ids = itertools.count(1000)
+
+
 def _message(
     author_id: int,
     *,
+    message_id: int | None = None,
     pinned: bool = False,
     is_bot: bool = False,
     display_name: str | None = None,
 ) -> MagicMock:
     msg = MagicMock(spec=hikari.Message)
+    msg.id = hikari.Snowflake(message_id or next(_message_ids))
     msg.author = MagicMock(spec=hikari.User)
     msg.author.id = hikari.Snowflake(author_id)
     msg.author.is_bot = is_bot
@@ -294,8 +301,11 @@ async def test_set_role_removes_via_remove_endpoint():
 # ---------------------------------------------------------------------------- #
 
 
-async def test_scan_ignores_pinned_and_bot_messages_when_fetching():
+async def test_scan_ignores_pinned_and_bot_messages_when_fetching(
+    tmp_path, monkeypatch
+):
     """Pinned prompts and bot posts don't count as anyone's introduction."""
+    monkeypatch.setattr(intros_state.store, "state_dir", tmp_path)
     pinned = _message(2, pinned=True)
     from_bot = _message(3, is_bot=True)
     bot = _bot(messages=(pinned, from_bot))
@@ -501,6 +511,90 @@ async def test_daily_guild_ignores_pinned_and_bot_posts_when_reconciling(
     }
 
 
+async def test_daily_guild_uses_fresh_index_without_walking_channel(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(intros_state.store, "state_dir", tmp_path)
+    intros_state.store.cache.clear()
+    st = _state(posters_reconciled_at=datetime.now(UTC))
+    st.record_post(2, 11)
+    st.record_post(2, 12)
+    st.record_post(3, 13)
+    intros_state.save(st)
+    monkeypatch.setattr(intros_cron, "check_channel_perms", AsyncMock(return_value=[]))
+
+    newest, older = _message(2, message_id=12), _message(2, message_id=11)
+    bot = _bot(members=(_member(2), _member(3)))
+    bot.rest.fetch_message = AsyncMock(side_effect=[newest, older])
+
+    await _daily_guild(bot, _guild())
+
+    bot.rest.fetch_messages.assert_not_called()
+    # Only the author with two posts needed a look.
+    assert [c.args[1] for c in bot.rest.fetch_message.await_args_list] == [12, 11]
+    older.delete.assert_awaited_once()
+    newest.delete.assert_not_awaited()
+    assert intros_state.load(GUILD_ID).posters[2].message_ids == [12]
+
+
+async def test_daily_guild_forgets_indexed_posts_already_gone(tmp_path, monkeypatch):
+    monkeypatch.setattr(intros_state.store, "state_dir", tmp_path)
+    intros_state.store.cache.clear()
+    st = _state(posters_reconciled_at=datetime.now(UTC))
+    st.record_post(4, 14)
+    intros_state.save(st)
+    monkeypatch.setattr(intros_cron, "check_channel_perms", AsyncMock(return_value=[]))
+
+    bot = _bot()
+    bot.rest.fetch_message = AsyncMock(side_effect=_not_found())
+
+    await _daily_guild(bot, _guild())
+
+    assert intros_state.load(GUILD_ID).posters == {}
+
+
+async def test_daily_guild_forgets_indexed_posts_since_pinned(tmp_path, monkeypatch):
+    """The listener indexes every post; a rebuild skips pinned ones, so must we."""
+    monkeypatch.setattr(intros_state.store, "state_dir", tmp_path)
+    intros_state.store.cache.clear()
+    st = _state(posters_reconciled_at=datetime.now(UTC))
+    st.record_post(2, 11)
+    st.record_post(2, 12)
+    intros_state.save(st)
+    monkeypatch.setattr(intros_cron, "check_channel_perms", AsyncMock(return_value=[]))
+
+    pinned = _message(2, message_id=12, pinned=True)
+    intro = _message(2, message_id=11)
+    bot = _bot(members=(_member(2),))
+    bot.rest.fetch_message = AsyncMock(side_effect=[pinned, intro])
+
+    await _daily_guild(bot, _guild())
+
+    pinned.delete.assert_not_awaited()
+    intro.delete.assert_not_awaited()
+    assert intros_state.load(GUILD_ID).posters[2].message_ids == [11]
+
+
+async def test_daily_guild_rebuilds_stale_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(intros_state.store, "state_dir", tmp_path)
+    intros_state.store.cache.clear()
+    stale = datetime.now(UTC) - intros_cron.RECONCILE_EVERY - timedelta(hours=1)
+    st = _state(posters_reconciled_at=stale)
+    st.record_post(9, 99)  # Posted while we weren't looking, since deleted
+    intros_state.save(st)
+    monkeypatch.setattr(intros_cron, "check_channel_perms", AsyncMock(return_value=[]))
+
+    member = _member(2)
+    bot = _bot(members=(member,), messages=(_message(2, message_id=21),))
+
+    await _daily_guild(bot, _guild())
+
+    loaded = intros_state.load(GUILD_ID)
+    assert set(loaded.posters) == {2}
+    assert loaded.posters_reconciled_at is not None
+    assert loaded.posters_reconciled_at > stale
+
+
 async def test_daily_guild_returns_when_channel_unconfigured(tmp_path, monkeypatch):
     monkeypatch.setattr(intros_state.store, "state_dir", tmp_path)
     intros_state.store.cache.clear()
@@ -514,6 +608,32 @@ async def test_daily_guild_returns_when_channel_unconfigured(tmp_path, monkeypat
     bot.rest.fetch_messages.assert_not_called()
 
 
+# ---------------------------------------------------------------------------- #
+#                               Poster index                                   #
+# ---------------------------------------------------------------------------- #
+
+
+def test_record_post_keeps_newest_first_without_duplicates():
+    st = _state()
+    st.record_post(2, 11)
+    st.record_post(2, 13)
+    st.record_post(2, 11)
+    assert st.posters[2].message_ids == [13, 11]
+    assert st.posters[2].newest_message_id == 13
+    assert st.posters[2].count == 2
+
+
+def test_forget_posts_drops_emptied_authors():
+    st = _state()
+    st.record_post(2, 11)
+    st.record_post(3, 12)
+    st.record_post(3, 13)
+    assert st.forget_posts({11, 13})
+    assert set(st.posters) == {3}
+    assert st.posters[3].message_ids == [12]
+    assert not st.forget_posts({99})
+
+
 # ---------------------------------------------------------------------------- #
 #                            State persistence                                 #
 # ---------------------------------------------------------------------------- #
@@ -0,0 +1,126 @@
+import json
+import logging
+import queue
+
+import pytest
+import structlog
+
+from dragonpaw_bot.logging import (
+    DeferredQueueHandler,
+    RateLimiter,
+    configure_logging,
+    set_level,
+    stop_logging,
+)
+
+
+@pytest.fixture
+def reconfigure():
+    """Tests reconfigure logging; put the default setup back afterwards."""
+    yield configure_logging
+    configure_logging()
+
+
+def test_json_format_writes_one_object_per_line(reconfigure, capsys):
+    reconfigure("json")
+    structlog.contextvars.bind_contextvars(guild="Nest")
+    try:
+        structlog.get_logger("dragonpaw_bot.test_json").info("Hatched", eggs=3)
+    finally:
+        structlog.contextvars.clear_contextvars()
+    stop_logging()  # Flushes the queue.
+
+    lines = [line for line in capsys.readouterr().out.splitlines() if line]
+    entry = json.loads(lines[-1])
+    assert entry["event"] == "Hatched"
+    assert entry["eggs"] == 3
+    assert entry["guild"] == "Nest"
+    assert entry["level"] == "info"
+
+
+def test_stdlib_records_keep_the_callers_context(reconfigure, capsys):
+    reconfigure("json")
+    structlog.contextvars.bind_contextvars(guild="Nest")
+    try:
+        logging.getLogger("hikari.test_foreign").warning("Gateway %s", "hiccup")
+    finally:
+        structlog.contextvars.clear_contextvars()
+    stop_logging()
+
+    lines = [line for line in capsys.readouterr().out.splitlines() if line]
+    entry = json.loads(lines[-1])
+    assert entry["event"] == "Gateway hiccup"
+    assert entry["guild"] == "Nest"
+    assert entry["logger"] == "hikari.test_foreign"
+    assert entry["timestamp"].endswith("Z")
+
+
+def test_queue_handler_leaves_formatting_to_the_listener():
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    handler = DeferredQueueHandler(records)
+    record = logging.LogRecord(
+        "dragonpaw_bot", logging.INFO, __file__, 1, {"event": "raw"}, None, None
+    )
+
+    handler.handle(record)
+
+    assert records.get_nowait() is record
+    assert record.msg == {"event": "raw"}
+
+
+def test_rate_limiter_drops_repeats_and_reports_them():
+    clock = [0.0]
+    limiter = RateLimiter(burst=2, window_seconds=10.0, clock=lambda: clock[0])
+    log = logging.getLogger("dragonpaw_bot.chatty")
+
+    def emit(method="debug"):
+        return limiter(log, method, {"event": "Activity recorded"})
+
+    emit()
+    emit()
+    with pytest.raises(structlog.DropEvent):
+        emit()
+    with pytest.raises(structlog.DropEvent):
+        emit()
+    assert emit("warning") == {"event": "Activity recorded"}
+
+    clock[0] = 10.0
+    assert emit()["suppressed"] == 2
+    assert "suppressed" not in emit()
+
+
+def test_rate_limiter_reports_a_burst_that_never_recurs():
+    clock = [0.0]
+    limiter = RateLimiter(burst=1, window_seconds=10.0, clock=lambda: clock[0])
+    flood = logging.getLogger("dragonpaw_bot.flood")
+    other = logging.getLogger("dragonpaw_bot.other")
+
+    limiter(flood, "debug", {"event": "Burst"})
+    for _ in range(3):
+        with pytest.raises(structlog.DropEvent):
+            limiter(flood, "debug", {"event": "Burst"})
+
+    clock[0] = 10.0
+    with structlog.testing.capture_logs() as logs:
+        limiter(other, "debug", {"event": "Something else"})
+
+    assert logs == [
+        {
+            "event": "Similar debug messages suppressed",
+            "suppressed_event": "Burst",
+            "suppressed": 3,
+            "log_level": "debug",
+        }
+    ]
+    assert set(limiter._windows) == {("dragonpaw_bot.other", "Something else")}
+
+
+def test_set_level_reports_effective_levels():
+    child = "dragonpaw_bot.test_levels"
+    try:
+        assert set_level(child, "debug") == ("INFO", "DEBUG")
+        assert set_level(child, "NOTSET") == ("DEBUG", "INFO")
+        with pytest.raises(ValueError, match="Unknown log level"):
+            set_level(child, "LOUD")
+    finally:
+        logging.getLogger(child).setLevel(logging.NOTSET)
@@ -0,0 +1,50 @@
+import asyncio
+import logging
+import time
+
+import structlog
+
+from dragonpaw_bot import metrics
+from dragonpaw_bot.loop_monitor import LoopMonitor
+
+
+def test_percentiles_are_exported_on_publish():
+    mon = LoopMonitor(window=100)
+    for ms in range(1, 101):
+        mon.record(ms / 1000)
+    assert metrics.loop_lag_quantile.value(quantile="1") == 0
+
+    mon.publish()
+
+    assert metrics.loop_lag_quantile.value(quantile="0.5") == 0.051
+    assert metrics.loop_lag_quantile.value(quantile="0.99") == 0.1
+    assert metrics.loop_lag_quantile.value(quantile="1") == 0.1
+    assert metrics.loop_lag_seconds.count() == 100
+
+
+def _hog_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def test_blocked_loop_is_reported_with_stack_and_context(caplog):
+    mon = LoopMonitor(tick_seconds=0.02, stall_seconds=0.1)
+
+    async def busy_handler():
+        structlog.contextvars.bind_contextvars(guild="Dragon's Nest")
+        _hog_the_loop(0.5)
+
+    with caplog.at_level(logging.WARNING, logger="dragonpaw_bot.loop_monitor"):
+        mon.start()
+        await asyncio.sleep(0.05)
+        await asyncio.create_task(busy_handler(), name="busy handler")
+        await mon.stop()
+
+    reports = [r.msg for r in caplog.records if isinstance(r.msg, dict)]
+    assert len(reports) == 1
+    report = reports[0]
+    assert report["event"] == "Event loop blocked"
+    assert report["task"] == "busy handler"
+    assert report["guild"] == "Dragon's Nest"
+    assert "_hog_the_loop" in report["stack"]
+    assert metrics.loop_stalls.value() == 1
+    assert not mon.running
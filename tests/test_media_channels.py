@@ -265,7 +265,9 @@ async def test_cron_isolates_run_cleanup_failures(monkeypatch):
 
     monkeypatch.setattr(media_state, "load", fake_load)
 
-    async def flaky_run_cleanup(self, expiry_minutes):
+    async def flaky_run_cleanup(
+        self, expiry_minutes, marks=None, checkpoint=None, threads=None
+    ):
         if int(self.channel_id) == 300:
             raise RuntimeError("simulated cleanup error")
 
@@ -0,0 +1,131 @@
+import inspect
+import types
+
+import pytest
+
+from dragonpaw_bot import metrics
+
+
+def test_counter_renders_labelled_samples():
+    counter = metrics.Counter("demo_total", "Demo things.", ("kind",))
+    counter.inc(kind="a")
+    counter.inc(2, kind='say "hi"')
+
+    assert counter.render() == (
+        "# HELP demo_total Demo things.\n"
+        "# TYPE demo_total counter\n"
+        'demo_total{kind="a"} 1\n'
+        'demo_total{kind="say \\"hi\\""} 2'
+    )
+
+
+def test_counter_rejects_wrong_labels():
+    counter = metrics.Counter("demo_total", "Demo things.", ("kind",))
+
+    with pytest.raises(ValueError, match="takes labels"):
+        counter.inc(flavour="a")
+
+
+def test_gauge_goes_both_ways():
+    gauge = metrics.Gauge("demo_level", "Demo level.")
+    gauge.set(5)
+    gauge.dec(2)
+
+    assert gauge.value() == 3
+    assert "# TYPE demo_level gauge" in gauge.render()
+
+
+def test_histogram_buckets_are_cumulative():
+    hist = metrics.Histogram("demo_seconds", "Demo time.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        hist.observe(value)
+
+    lines = hist.render().splitlines()[2:]
+    assert lines == [
+        'demo_seconds_bucket{le="0.1"} 1',
+        'demo_seconds_bucket{le="1"} 2',
+        'demo_seconds_bucket{le="+Inf"} 3',
+        "demo_seconds_sum 5.55",
+        "demo_seconds_count 3",
+    ]
+
+
+def test_metric_subclass_must_implement_samples():
+    class Half(metrics.Metric):
+        def clear(self) -> None:
+            pass
+
+    with pytest.raises(TypeError, match="samples"):
+        Half("half", "Half a metric.")
+
+
+def test_registry_refuses_duplicate_names():
+    registry = metrics.Registry()
+    registry.register(metrics.Counter("demo_total", "Demo."))
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(metrics.Gauge("demo_total", "Demo."))
+
+
+def test_registry_runs_collectors_before_rendering():
+    registry = metrics.Registry()
+    gauge = registry.register(metrics.Gauge("demo_level", "Demo level."))
+    registry.add_collector(lambda: gauge.set(7))
+
+    assert "demo_level 7" in registry.render()
+
+
+@pytest.mark.parametrize(
+    ("path", "route"),
+    [
+        ("/api/v10/channels/123/messages/456", "/channels/{id}/messages/{id}"),
+        ("/api/v10/webhooks/123/s3cr3t/messages/@original", "/webhooks/{id}/{token}/messages/@original"),
+        ("/api/v10/interactions/123/s3cr3t/callback", "/interactions/{id}/{token}/callback"),
+        ("/api/v10/channels/1/messages/2/reactions/%F0%9F%90%89/@me", "/channels/{id}/messages/{id}/reactions/{emoji}/@me"),
+    ],
+)  # fmt: skip
+def test_route_template_drops_ids_and_secrets(path, route):
+    assert metrics.route_template(path) == route
+
+
+async def test_instrumented_listeners_are_timed_and_removable():
+    class Ping:
+        pass
+
+    async def on_ping(_):
+        pass
+
+    manager = types.SimpleNamespace(_listeners={Ping: [on_ping]})
+
+    assert metrics.instrument_listeners(manager) == 1
+    assert metrics.instrument_listeners(manager) == 0
+    await manager._listeners[Ping][0](Ping())
+
+    assert metrics.listener_seconds.count(event="Ping", listener="on_ping") == 1
+    manager._listeners[Ping].remove(on_ping)
+    assert manager._listeners[Ping] == []
+
+
+async def test_endpoint_serves_the_registry():
+    metrics.rest_requests.inc(method="GET", route="/gateway/bot", status="200")
+
+    response = await metrics._handle_metrics(None)
+
+    assert response.content_type == "text/plain"
+    assert (
+        'dragonpaw_rest_requests_total{method="GET",route="/gateway/bot",status="200"} 1'
+        in response.body.decode()
+    )
+
+
+async def test_timed_task_records_failures_and_keeps_the_signature():
+    @metrics.timed_task
+    async def nightly(bot: int) -> None:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await nightly(bot=1)
+
+    assert nightly.__name__ == "nightly"
+    assert list(inspect.signature(nightly).parameters) == ["bot"]
+    assert metrics.task_seconds.count(task="nightly", outcome="error") == 1
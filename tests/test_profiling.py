@@ -0,0 +1,107 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dragonpaw_bot import debug, profiling
+from dragonpaw_bot.context import NotAuthorized, bot_owner_only
+
+
+@pytest.fixture(autouse=True)
+async def profile_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(profiling, "PROFILE_DIR", tmp_path)
+    yield tmp_path
+    await profiling.stop()
+
+
+def _busy_work() -> int:
+    return sum(i * i for i in range(50_000))
+
+
+async def test_run_writes_results_and_summary(profile_dir):
+    profiling.start("test")
+    _busy_work()
+    result = await profiling.stop(top=50)
+
+    assert result is not None
+    assert all(path.exists() for path in result.files)
+    assert all(path.parent == profile_dir for path in result.files)
+    assert "_busy_work" in result.summary
+    assert "Memory, by growth:" in result.summary
+    assert not profiling.is_running()
+
+
+async def test_only_one_run_at_a_time():
+    profiling.start("first")
+
+    with pytest.raises(profiling.ProfilerBusy, match="first"):
+        profiling.start("second")
+
+
+async def test_stop_without_a_run_is_a_no_op():
+    assert await profiling.stop() is None
+
+
+async def test_signal_toggles_a_run(profile_dir, monkeypatch):
+    written = asyncio.Event()
+    write = profiling.ProfileRun._write
+
+    def write_off_loop(self, *args):
+        assert threading.current_thread() is not threading.main_thread()
+        try:
+            return write(self, *args)
+        finally:
+            loop.call_soon_threadsafe(written.set)
+
+    loop = asyncio.get_running_loop()
+    monkeypatch.setattr(profiling.ProfileRun, "_write", write_off_loop)
+    profiling._on_signal()
+    assert profiling.is_running()
+
+    profiling._on_signal()
+    assert not profiling.is_running()
+    await asyncio.wait_for(written.wait(), 5)
+    assert list(profile_dir.glob("*.prof"))
+
+
+async def test_stale_command_timer_leaves_a_newer_run_alone():
+    gc = MagicMock(log=AsyncMock())
+    run = profiling.start("command")
+    profiling._on_signal()  # SIGUSR1 stops the command's run...
+    profiling._on_signal()  # ...and starts another.
+
+    await debug._finish_profile(gc, run, 0, "Someone")
+
+    assert profiling.is_running()
+    gc.log.assert_not_awaited()
+
+
+def test_clipped_summary_fits_a_discord_message():
+    summary = "\n".join(f"line {i} " + "x" * 80 for i in range(100))
+
+    clipped = debug._clip_summary(summary)
+
+    assert len(clipped) <= debug._SUMMARY_CHARS + 2
+    assert clipped.endswith("…")
+    assert clipped.startswith("line 0 ")
+
+
+def _owner_ctx(user_id: int) -> MagicMock:
+    application = MagicMock()
+    application.owner.id = 1
+    application.team.members = {2: MagicMock()}
+    ctx = MagicMock()
+    ctx.user.id = user_id
+    ctx.client.app.rest.fetch_application = AsyncMock(return_value=application)
+    return ctx
+
+
+@pytest.mark.parametrize("user_id", [1, 2])
+async def test_bot_owners_and_team_pass(user_id):
+    await bot_owner_only.func(MagicMock(), _owner_ctx(user_id))
+
+
+async def test_guild_admins_are_not_bot_owners():
+    with pytest.raises(NotAuthorized):
+        await bot_owner_only.func(MagicMock(), _owner_ctx(3))
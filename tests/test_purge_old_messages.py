@@ -1,9 +1,13 @@
+import asyncio
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock
 
 import hikari
+import pytest
 
-from dragonpaw_bot.context import ChannelContext
+from dragonpaw_bot import context
+from dragonpaw_bot.context import ChannelContext, GuildThreads, throttled_checkpoint
+from dragonpaw_bot.structs import PurgeMarks
 
 GUILD = "test-guild"
 CHANNEL = "test-channel"
@@ -30,7 +34,12 @@ def _make_cc(
         async def _async_gen(*args, **kwargs):
             before = kwargs.get("before")
             for m in messages:
-                if before is None or m.created_at < before:
+                if before is None:
+                    yield m
+                elif isinstance(before, hikari.Snowflake):
+                    if m.id < before:
+                        yield m
+                elif m.created_at < before:
                     yield m
 
         bot.rest.fetch_messages = Mock(side_effect=_async_gen)
@@ -171,9 +180,11 @@ async def test_forbidden_on_single_delete_breaks_loop():
     cc.bot.rest.delete_message = AsyncMock(
         side_effect=hikari.ForbiddenError(url="x", headers={}, raw_body=b"")
     )
-    count = await cc.purge_old_messages(expiry_minutes=60)
-    assert count == 3
+    marks = PurgeMarks()
+    count = await cc.purge_old_messages(expiry_minutes=60, marks=marks)
+    assert count == 0
     assert cc.bot.rest.delete_message.call_count == 1  # Stopped after first failure
+    assert marks.backlog == [1, 2, 3]  # Kept for a later run
 
 
 async def test_single_delete_limit_caps_deletes():
@@ -220,11 +231,260 @@ async def test_single_delete_limit_custom():
     assert cc.bot.rest.delete_message.call_count == 10
 
 
+# ---------------------------------------------------------------------------- #
+#                               Purge marks                                    #
+# ---------------------------------------------------------------------------- #
+
+
+def _dated_msg(age_hours: float, *, pinned: bool = False) -> Mock:
+    """A message whose id is a real snowflake for its created_at, newest-first safe."""
+    msg = _msg(age_hours, pinned=pinned)
+    msg.id = hikari.Snowflake.from_datetime(msg.created_at)
+    return msg
+
+
+async def test_marks_advance_after_complete_run():
+    marks = PurgeMarks()
+    cc = _make_cc(_dated_msg(age_hours=48))
+    await cc.purge_old_messages(expiry_minutes=60, marks=marks)
+    assert marks.last_scanned_id is not None
+    assert marks.oldest_surviving_id is None
+
+
+async def test_marks_skip_history_already_cleared():
+    # Newest-first, as Discord returns them.
+    fresh = _dated_msg(age_hours=3)
+    cleared = _dated_msg(age_hours=48)
+    marks = PurgeMarks(
+        last_scanned_id=int(
+            hikari.Snowflake.from_datetime(datetime.now(UTC) - timedelta(hours=24))
+        )
+    )
+    cc = _make_cc(fresh, cleared)
+    count = await cc.purge_old_messages(expiry_minutes=60, marks=marks)
+    assert count == 1
+    (call_args,) = cc.bot.rest.delete_messages.call_args_list
+    assert call_args[0][1] == [fresh.id]
+
+
+async def test_marks_queue_leftovers_from_capped_run():
+    msgs = [_dated_msg(age_hours=24 * 20 + i) for i in range(5)]
+    marks = PurgeMarks()
+    cc = _make_cc(*msgs)
+    await cc.purge_old_messages(expiry_minutes=60, single_delete_limit=3, marks=marks)
+    assert marks.backlog == [int(msgs[3].id), int(msgs[4].id)]
+    assert marks.oldest_surviving_id is None
+
+
+async def test_marks_revisit_leftovers_on_next_run():
+    msgs = [_dated_msg(age_hours=24 * 20 + i) for i in range(5)]
+    marks = PurgeMarks(
+        last_scanned_id=int(hikari.Snowflake.from_datetime(datetime.now(UTC))),
+        oldest_surviving_id=int(msgs[3].id),
+    )
+    cc = _make_cc(*msgs)
+    count = await cc.purge_old_messages(expiry_minutes=60, marks=marks)
+    assert count == 2
+    deleted = [c.kwargs["message"] for c in cc.bot.rest.delete_message.call_args_list]
+    assert deleted == [msgs[3].id, msgs[4].id]
+    assert marks.oldest_surviving_id is None
+
+
+async def test_marks_unchanged_when_delete_forbidden():
+    marks = PurgeMarks()
+    cc = _make_cc(_dated_msg(age_hours=48))
+    cc.bot.rest.delete_messages = AsyncMock(
+        side_effect=hikari.ForbiddenError(url="x", headers={}, raw_body=b"")
+    )
+    await cc.purge_old_messages(expiry_minutes=60, marks=marks)
+    assert marks == PurgeMarks()
+
+
+# ---------------------------------------------------------------------------- #
+#                            Streaming pipeline                                #
+# ---------------------------------------------------------------------------- #
+
+
+async def test_bulk_deletes_start_before_paging_finishes():
+    msgs = [_dated_msg(age_hours=48 + i / 100) for i in range(150)]
+    calls_seen_mid_page: list[int] = []
+    cc = _make_cc()
+
+    async def _paging(*args, **kwargs):
+        for i, m in enumerate(msgs):
+            if i == 120:
+                calls_seen_mid_page.append(cc.bot.rest.delete_messages.call_count)
+            yield m
+
+    cc.bot.rest.fetch_messages = Mock(side_effect=_paging)
+    count = await cc.purge_old_messages(expiry_minutes=60)
+    assert count == 150
+    assert calls_seen_mid_page == [1]
+
+
+async def test_checkpoint_called_as_deletes_land():
+    msgs = [_dated_msg(age_hours=48 + i / 100) for i in range(250)]
+    checkpoint = Mock()
+    marks = PurgeMarks()
+    cc = _make_cc(*msgs)
+    await cc.purge_old_messages(expiry_minutes=60, marks=marks, checkpoint=checkpoint)
+    assert checkpoint.call_count == 2  # after the 100th and 200th
+
+
+def test_throttled_checkpoint_saves_at_most_once_per_interval():
+    clock = [0.0]
+    save = Mock()
+    checkpoint = throttled_checkpoint(save, min_seconds=30, clock=lambda: clock[0])
+
+    checkpoint()
+    clock[0] = 31.0
+    checkpoint()
+    checkpoint()
+    clock[0] = 45.0
+    checkpoint()
+
+    assert save.call_count == 1
+
+
+async def test_interrupted_run_resumes_from_cursor():
+    msgs = [_dated_msg(age_hours=48 + i) for i in range(4)]
+    run_cutoff = int(hikari.Snowflake.from_datetime(datetime.now(UTC)))
+    marks = PurgeMarks(run_cutoff_id=run_cutoff, cursor_id=int(msgs[1].id))
+    cc = _make_cc(*msgs)
+    count = await cc.purge_old_messages(expiry_minutes=60, marks=marks)
+    assert count == 2
+    assert cc.bot.rest.fetch_messages.call_args.kwargs["before"] == msgs[1].id
+    (call_args,) = cc.bot.rest.delete_messages.call_args_list
+    assert call_args[0][1] == [msgs[2].id, msgs[3].id]
+    assert marks == PurgeMarks(last_scanned_id=run_cutoff)
+
+
+async def test_progress_kept_when_single_delete_refused():
+    recent = _dated_msg(age_hours=48)
+    old = _dated_msg(age_hours=24 * 20)
+    marks = PurgeMarks()
+    cc = _make_cc(recent, old)
+    cc.bot.rest.delete_message = AsyncMock(
+        side_effect=hikari.ForbiddenError(url="x", headers={}, raw_body=b"")
+    )
+    await cc.purge_old_messages(expiry_minutes=60, marks=marks)
+    # The window was fully walked; the refused delete just stays queued.
+    assert marks.last_scanned_id is not None
+    assert marks.cursor_id is None
+    assert marks.backlog == [int(old.id)]
+
+
+# ---------------------------------------------------------------------------- #
+#                           Single-delete backlog                              #
+# ---------------------------------------------------------------------------- #
+
+
+async def test_backlog_drains_without_refetching_history():
+    msgs = [_dated_msg(age_hours=24 * 20 + i) for i in range(5)]
+    marks = PurgeMarks()
+    cc = _make_cc(*msgs)
+    await cc.purge_old_messages(expiry_minutes=60, single_delete_limit=2, marks=marks)
+
+    # Nothing new in the channel: the next run must not page old history again.
+    cc = _make_cc()
+    count = await cc.purge_old_messages(
+        expiry_minutes=60, single_delete_limit=2, marks=marks
+    )
+    assert count == 2
+    deleted = [c.kwargs["message"] for c in cc.bot.rest.delete_message.call_args_list]
+    assert deleted == [msgs[2].id, msgs[3].id]
+    assert marks.backlog == [int(msgs[4].id)]
+
+
+async def test_backlog_not_queued_twice_after_restart():
+    msgs = [_dated_msg(age_hours=24 * 20 + i) for i in range(3)]
+    run_cutoff = int(hikari.Snowflake.from_datetime(datetime.now(UTC)))
+    # Crashed after queueing msgs[0] but before its cursor was saved.
+    marks = PurgeMarks(run_cutoff_id=run_cutoff, backlog=[int(msgs[0].id)])
+    cc = _make_cc(*msgs)
+    await cc.purge_old_messages(expiry_minutes=60, single_delete_limit=0, marks=marks)
+    assert marks.backlog == [int(m.id) for m in msgs]
+
+
+async def test_checkpoint_saves_backlog_without_deleted_ids():
+    marks = PurgeMarks(backlog=list(range(1, 251)))
+    saved: list[list[int]] = []
+    cc = _make_cc()
+    await cc.purge_old_messages(
+        expiry_minutes=60,
+        marks=marks,
+        checkpoint=lambda: saved.append(marks.backlog[:]),
+    )
+    assert [len(b) for b in saved] == [150, 50]
+    assert saved[0][0] == 101
+    assert marks.backlog == []
+
+
+async def test_drain_rate_defaults_to_module_setting(monkeypatch):
+    monkeypatch.setattr("dragonpaw_bot.context.SINGLE_DELETES_PER_RUN", 3)
+    marks = PurgeMarks(backlog=[1, 2, 3, 4, 5])
+    cc = _make_cc()
+    assert await cc.purge_old_messages(expiry_minutes=60, marks=marks) == 3
+    assert marks.backlog == [4, 5]
+
+
+async def test_paging_pauses_when_backlog_full(monkeypatch):
+    monkeypatch.setattr("dragonpaw_bot.context.MAX_BACKLOG", 10)
+    msgs = [_dated_msg(age_hours=24 * 20 + i) for i in range(50)]
+    yielded = 0
+    marks = PurgeMarks()
+    cc = _make_cc()
+
+    async def _paging(*args, **kwargs):
+        nonlocal yielded
+        for m in msgs:
+            yielded += 1
+            yield m
+
+    cc.bot.rest.fetch_messages = Mock(side_effect=_paging)
+    await cc.purge_old_messages(expiry_minutes=60, single_delete_limit=0, marks=marks)
+    assert yielded == 11
+    assert len(marks.backlog) == 10
+    assert marks.oldest_surviving_id == int(msgs[10].id)
+
+
+async def test_backlog_eta_reported_while_pending():
+    msgs = [_dated_msg(age_hours=24 * 20 + i) for i in range(5)]
+    cc = _make_cc(*msgs)
+    cc.log = AsyncMock()
+    await cc.purge_old_messages(
+        expiry_minutes=60, single_delete_limit=2, marks=PurgeMarks()
+    )
+    (call,) = cc.log.call_args_list
+    assert "**3**" in call.args[0]
+    assert "2h" in call.args[0]
+
+
+async def test_backlog_completion_reported_once():
+    marks = PurgeMarks(backlog=[1, 2])
+    cc = _make_cc()
+    cc.log = AsyncMock()
+    await cc.purge_old_messages(expiry_minutes=60, marks=marks)
+    assert marks.backlog == []
+    assert "caught up" in cc.log.call_args.args[0]
+
+    cc.log.reset_mock()
+    await cc.purge_old_messages(expiry_minutes=60, marks=marks)
+    cc.log.assert_not_called()
+
+
 # ---------------------------------------------------------------------------- #
 #                            purge_old_threads tests                           #
 # ---------------------------------------------------------------------------- #
 
 
+@pytest.fixture(autouse=True)
+def _clear_archived_thread_cache():
+    context._archived_threads.clear()
+    yield
+    context._archived_threads.clear()
+
+
 def _thread(
     age_hours: float,
     *,
@@ -237,6 +497,8 @@ def _thread(
     thread.name = f"thread-{age_hours}h"
     thread.parent_id = hikari.Snowflake(channel_id)
     thread.created_at = datetime.now(UTC) - timedelta(hours=age_hours)
+    thread.metadata = Mock()
+    thread.metadata.archive_timestamp = thread.created_at
     if has_messages:
         last_msg = Mock()
         last_msg.created_at = datetime.now(UTC) - timedelta(hours=age_hours)
@@ -267,9 +529,10 @@ def _make_cc_threads(
     else:
         _archived = archived or []
 
-        async def _archived_gen(*args, **kwargs):
+        async def _archived_gen(*args, before=hikari.UNDEFINED, **kwargs):
             for t in _archived:
-                yield t
+                if before is hikari.UNDEFINED or t.metadata.archive_timestamp < before:
+                    yield t
 
         bot.rest.fetch_public_archived_threads = Mock(side_effect=_archived_gen)
 
@@ -375,6 +638,74 @@ async def test_purge_old_threads_mixed_active_and_archived():
     assert cc.bot.rest.delete_channel.call_count == 2
 
 
+# ---------------------------------------------------------------------------- #
+#                          Shared thread listings                              #
+# ---------------------------------------------------------------------------- #
+
+
+async def test_active_threads_fetched_once_per_guild_run():
+    mine = _thread(age_hours=48)
+    theirs = _thread(age_hours=49, channel_id=7)
+    cc = _make_cc_threads(active=[mine, theirs])
+    other = ChannelContext(
+        bot=cc.bot,
+        guild_id=cc.guild_id,
+        name=GUILD,
+        log_channel_id=None,
+        channel_id=hikari.Snowflake(7),
+        channel_name="other",
+    )
+    threads = GuildThreads(cc.bot, cc.guild_id)
+    counts = await asyncio.gather(
+        cc.purge_old_threads(60, threads), other.purge_old_threads(60, threads)
+    )
+    assert counts == [1, 1]
+    cc.bot.rest.fetch_active_threads.assert_awaited_once()
+
+
+async def test_archived_threads_only_new_ones_paged_next_run():
+    older = _thread(age_hours=0.5)
+    cc = _make_cc_threads(archived=[older])
+    assert await cc.purge_old_threads(expiry_minutes=120) == 0
+
+    newer = _thread(age_hours=0.25)
+    seen: list[Mock] = []
+
+    async def _archived_gen(*args, **kwargs):
+        for t in [newer, older]:
+            seen.append(t)
+            yield t
+
+    cc.bot.rest.fetch_public_archived_threads = Mock(side_effect=_archived_gen)
+    # Both now stale: the older one is deleted from the cache without a re-page.
+    count = await cc.purge_old_threads(expiry_minutes=1)
+    assert count == 2
+    assert seen == [newer, older]  # Stopped at the already-covered thread
+    assert context._archived_threads[cc.channel_id].threads == {}
+
+
+async def test_archived_scan_capped_and_resumed(monkeypatch):
+    monkeypatch.setattr("dragonpaw_bot.context.ARCHIVED_THREAD_SCAN_LIMIT", 2)
+    archived = [_thread(age_hours=0.1 * (i + 1)) for i in range(5)]
+    cc = _make_cc_threads(archived=archived)
+    threads = GuildThreads(cc.bot, cc.guild_id)
+    known = await threads.archived(cc.channel_id)
+    # Top pass capped at 2, then one capped pass into the gap below it.
+    assert len(known) == 4
+    known = await threads.archived(cc.channel_id)
+    assert len(known) == 5
+    assert context._archived_threads[cc.channel_id].gaps == []
+
+
+async def test_unarchived_thread_dropped_from_archived_cache():
+    t = _thread(age_hours=48)
+    cc = _make_cc_threads(archived=[t])
+    await cc.purge_old_threads(expiry_minutes=60 * 24 * 7)
+    cc.bot.rest.fetch_active_threads = AsyncMock(return_value=[t])
+    await cc.purge_old_threads(expiry_minutes=60 * 24 * 7)
+    assert t.id not in context._archived_threads[cc.channel_id].threads
+
+
 # ---------------------------------------------------------------------------- #
 #                    run_cleanup calls purge_old_threads                       #
 # ---------------------------------------------------------------------------- #
@@ -391,5 +722,77 @@ async def test_run_cleanup_calls_purge_old_threads(monkeypatch):
 
     await cc.run_cleanup(expiry_minutes=60)
 
-    mock_msgs.assert_awaited_once_with(60)
-    mock_threads.assert_awaited_once_with(60)
+    mock_msgs.assert_awaited_once_with(60, marks=None, checkpoint=None)
+    mock_threads.assert_awaited_once_with(60, None)
+
+
+# ---------------------------------------------------------------------------- #
+#                              delete_my_messages                               #
+# ---------------------------------------------------------------------------- #
+
+BOT_ID = hikari.Snowflake(7)
+
+
+def _posted(message_id: int, age_days: float, *, author=BOT_ID) -> Mock:
+    msg = Mock(spec=hikari.Message)
+    msg.id = hikari.Snowflake(message_id)
+    msg.created_at = datetime.now(UTC) - timedelta(days=age_days)
+    msg.author = Mock(id=author)
+    return msg
+
+
+def _history_cc(*messages: Mock) -> ChannelContext:
+    """A channel whose history, newest first, is `messages`."""
+    cc = _make_cc(*messages)
+    cc.bot.user_id = BOT_ID
+    return cc
+
+
+async def test_delete_my_messages_bulk_deletes_recent_ones():
+    msgs = [_posted(1000 - i, age_days=1) for i in range(150)]
+    cc = _history_cc(*msgs, _posted(5, age_days=1, author=hikari.Snowflake(99)))
+
+    assert await cc.delete_my_messages() == 150
+
+    batches = [c.args[1] for c in cc.bot.rest.delete_messages.await_args_list]
+    assert [len(b) for b in batches] == [100, 50]
+    cc.bot.rest.delete_message.assert_not_awaited()
+
+
+async def test_delete_my_messages_singles_old_ones():
+    cc = _history_cc(_posted(20, age_days=1), _posted(10, age_days=30))
+
+    assert await cc.delete_my_messages() == 2
+
+    cc.bot.rest.delete_messages.assert_awaited_once()
+    cc.bot.rest.delete_message.assert_awaited_once_with(
+        channel=cc.channel_id, message=hikari.Snowflake(10)
+    )
+
+
+async def test_delete_my_messages_stops_below_oldest_marker():
+    cc = _history_cc(_posted(30, age_days=1), _posted(20, age_days=1), _posted(10, 1))
+
+    assert await cc.delete_my_messages(oldest_id=20) == 2
+
+    assert cc.bot.rest.delete_messages.await_args.args[1] == [
+        hikari.Snowflake(30),
+        hikari.Snowflake(20),
+    ]
+
+
+async def test_delete_my_messages_falls_back_to_singles_without_manage_messages():
+    cc = _history_cc(*(_posted(100 - i, age_days=1) for i in range(3)))
+    cc.bot.rest.delete_messages.side_effect = hikari.ForbiddenError(
+        url="", headers={}, raw_body=b""
+    )
+    cc._log_missing_manage_messages = AsyncMock()
+
+    assert await cc.delete_my_messages() == 3
+
+    cc.bot.rest.delete_messages.assert_awaited_once()
+    assert [
+        c.kwargs["message"] for c in cc.bot.rest.delete_message.await_args_list
+    ] == [hikari.Snowflake(100), hikari.Snowflake(99), hikari.Snowflake(98)]
+    # Its own messages don't need the permission, so don't ask for it.
+    cc._log_missing_manage_messages.assert_not_awaited()
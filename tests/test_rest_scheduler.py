@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from dragonpaw_bot.rest_scheduler import Priority, RestScheduler
+
+
+@pytest.fixture
+def sched():
+    return RestScheduler(route_tokens=2, max_in_flight=3)
+
+
+async def test_slot_opens_immediately_when_idle(sched):
+    async with sched.slot("delete_message:1"):
+        pass
+
+
+async def test_cron_waits_for_interactive_work(sched):
+    entered = asyncio.Event()
+
+    async def background():
+        async with sched.slot("delete_message:1"):
+            entered.set()
+
+    with sched.busy(Priority.INTERACTIVE):
+        task = asyncio.create_task(background())
+        await asyncio.sleep(0.05)
+        assert not entered.is_set()
+
+    await asyncio.wait_for(task, 1)
+    assert entered.is_set()
+
+
+async def test_event_slot_not_held_back_by_event_work(sched):
+    with sched.busy(Priority.EVENT):
+        async with sched.slot("delete_message:1", Priority.EVENT):
+            pass
+
+
+async def test_cron_yields_to_event_work(sched):
+    entered = asyncio.Event()
+
+    async def background():
+        async with sched.slot("member_roles:1", Priority.CRON):
+            entered.set()
+
+    with sched.busy(Priority.EVENT):
+        task = asyncio.create_task(background())
+        await asyncio.sleep(0.05)
+        assert not entered.is_set()
+
+    await asyncio.wait_for(task, 1)
+
+
+async def test_cron_yields_while_event_slot_is_queued():
+    sched = RestScheduler(route_tokens=1, max_in_flight=8)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def hold_channel():
+        async with sched.slot("delete_message:1"):
+            await release.wait()
+
+    async def call(route: str, priority: Priority, name: str):
+        async with sched.slot(route, priority):
+            order.append(name)
+
+    holder = asyncio.create_task(hold_channel())
+    await asyncio.sleep(0)
+    # The event call is queued for the channel's one token...
+    event = asyncio.create_task(call("delete_message:1", Priority.EVENT, "event"))
+    await asyncio.sleep(0)
+    # ...so a cron call on a free route waits its turn behind it.
+    cron = asyncio.create_task(call("member_roles:1", Priority.CRON, "cron"))
+    await asyncio.sleep(0.05)
+    assert order == []
+
+    release.set()
+    await asyncio.wait_for(asyncio.gather(holder, event, cron), 1)
+    assert order == ["event", "cron"]
+
+
+async def test_route_tokens_cap_concurrency(sched):
+    peak = 0
+    active = 0
+
+    async def call():
+        nonlocal peak, active
+        async with sched.slot("delete_message:1"):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+    assert peak == 2
+
+
+async def test_global_in_flight_cap_spans_routes(sched):
+    peak = 0
+    active = 0
+
+    async def call(route: str):
+        nonlocal peak, active
+        async with sched.slot(route):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(call(f"delete_message:{i}") for i in range(6)))
+    assert peak == 3
+
+
+async def test_background_stops_yielding_after_max_wait():
+    sched = RestScheduler(max_yield_seconds=0.0)
+    with sched.busy(Priority.INTERACTIVE):
+        await asyncio.wait_for(_enter(sched), 1)
+
+
+async def _enter(sched: RestScheduler) -> None:
+    async with sched.slot("dm"):
+        pass
+
+
+async def test_slot_released_on_error(sched):
+    with pytest.raises(RuntimeError):
+        async with sched.slot("dm"):
+            raise RuntimeError("boom")
+    assert sched._in_flight == 0
+    assert not sched._route_in_flight
@@ -510,6 +510,9 @@ def _menu_interaction(
     )
     bot = interaction.app
     bot.cache.get_guild.return_value = None
+    bot.cache.get_member.return_value = None
+    # Roles aren't cached unless a test says so, which keeps changes per-role.
+    bot.cache.get_role.return_value = None
     bot.state.return_value = SimpleNamespace(log_channel_id=LOG_CHANNEL_ID)
     bot.rest.add_role_to_member = AsyncMock(
         side_effect=lambda *a, **k: calls.append("add_role")
@@ -676,6 +679,131 @@ async def test_apply_role_changes_forbidden_does_not_stop_other_roles():
     assert failed == ["Red Role"]
 
 
+@pytest.fixture
+def manageable_roles(monkeypatch):
+    """Every role is cached and within the bot's reach."""
+    monkeypatch.setattr(
+        "dragonpaw_bot.plugins.role_menus.commands.check_role_manageable",
+        AsyncMock(return_value=None),
+    )
+
+
+async def test_apply_role_changes_batches_into_one_edit(manageable_roles):
+    calls: list[str] = []
+    interaction = _menu_interaction(calls)
+    interaction.app.cache.get_role.side_effect = lambda role_id: MagicMock(id=role_id)
+    interaction.app.rest.edit_member = AsyncMock()
+    gs = _interaction_state()
+    held = {hikari.Snowflake(30), hikari.Snowflake(99)}
+
+    added, removed, failed = await _apply_role_changes(
+        interaction, gs, _menu(gs, "pronouns"), {"She"}, held
+    )
+
+    assert (added, removed, failed) == (["She"], ["They"], [])
+    interaction.app.rest.edit_member.assert_awaited_once()
+    # Roles outside the menu are kept.
+    assert interaction.app.rest.edit_member.await_args.kwargs["roles"] == [
+        hikari.Snowflake(40),
+        hikari.Snowflake(99),
+    ]
+    assert calls == []
+
+
+async def test_apply_role_changes_refused_batch_falls_back_per_role(
+    manageable_roles,
+):
+    calls: list[str] = []
+    interaction = _menu_interaction(calls)
+    interaction.app.cache.get_role.side_effect = lambda role_id: MagicMock(id=role_id)
+    interaction.app.rest.edit_member = AsyncMock(
+        side_effect=hikari.ForbiddenError(url="", headers={}, raw_body=b"")
+    )
+    gs = _interaction_state()
+
+    added, _removed, failed = await _apply_role_changes(
+        interaction, gs, _menu(gs, "colors"), {"Red", "Blue"}, set()
+    )
+
+    assert sorted(added) == ["Blue", "Red"]
+    assert failed == []
+    assert calls == ["add_role", "add_role"]
+
+
+async def test_apply_role_changes_batch_leaves_out_everyone(
+    manageable_roles, role_menus_state_dir
+):
+    role_menus_state.save(_interaction_state())
+    calls: list[str] = []
+    # hikari puts the guild id (@everyone) in an interaction member's roles.
+    interaction = _menu_interaction(
+        calls,
+        custom_id="role_menu:pronouns",
+        values=["She"],
+        member_role_ids=[100, 30],
+    )
+    interaction.app.cache.get_role.side_effect = lambda role_id: MagicMock(id=role_id)
+    interaction.app.rest.edit_member = AsyncMock()
+
+    await handle_role_menu_interaction(interaction)
+
+    assert interaction.app.rest.edit_member.await_args.kwargs["roles"] == [
+        hikari.Snowflake(40)
+    ]
+
+
+async def test_apply_role_changes_batch_starts_from_cached_member(manageable_roles):
+    calls: list[str] = []
+    interaction = _menu_interaction(calls)
+    interaction.app.cache.get_role.side_effect = lambda role_id: MagicMock(id=role_id)
+    # A mod gave role 77 after the interaction was created.
+    interaction.app.cache.get_member.return_value = MagicMock(
+        role_ids=[hikari.Snowflake(r) for r in (100, 30, 77)]
+    )
+    interaction.app.rest.edit_member = AsyncMock()
+    gs = _interaction_state()
+
+    await _apply_role_changes(
+        interaction, gs, _menu(gs, "pronouns"), {"She"}, {hikari.Snowflake(30)}
+    )
+
+    assert interaction.app.rest.edit_member.await_args.kwargs["roles"] == [
+        hikari.Snowflake(40),
+        hikari.Snowflake(77),
+    ]
+
+
+async def test_apply_role_changes_bad_request_falls_back_per_role(manageable_roles):
+    calls: list[str] = []
+    interaction = _menu_interaction(calls)
+    interaction.app.cache.get_role.side_effect = lambda role_id: MagicMock(id=role_id)
+    interaction.app.rest.edit_member = AsyncMock(
+        side_effect=hikari.BadRequestError(url="", headers={}, raw_body=b"")
+    )
+    gs = _interaction_state()
+
+    added, _removed, failed = await _apply_role_changes(
+        interaction, gs, _menu(gs, "colors"), {"Red", "Blue"}, set()
+    )
+
+    assert sorted(added) == ["Blue", "Red"]
+    assert failed == []
+    assert calls == ["add_role", "add_role"]
+
+
+async def test_apply_role_changes_single_change_skips_batch(manageable_roles):
+    calls: list[str] = []
+    interaction = _menu_interaction(calls)
+    interaction.app.cache.get_role.side_effect = lambda role_id: MagicMock(id=role_id)
+    interaction.app.rest.edit_member = AsyncMock()
+    gs = _interaction_state()
+
+    await _apply_role_changes(interaction, gs, _menu(gs, "colors"), {"Red"}, set())
+
+    interaction.app.rest.edit_member.assert_not_awaited()
+    assert calls == ["add_role"]
+
+
 # --- handle_role_menu_interaction ---
 
 
@@ -821,7 +949,6 @@ async def test_configure_warns_on_missing_channel_perms(
     channel = MagicMock()
     channel.id = hikari.Snowflake(77)
     channel.name = "role-select"
-    channel.send = AsyncMock(return_value=MagicMock(id=hikari.Snowflake(900)))
     monkeypatch.setattr(
         "dragonpaw_bot.utils.guild_channel_by_name", AsyncMock(return_value=channel)
     )
@@ -842,6 +969,9 @@ async def test_configure_warns_on_missing_channel_perms(
     gc.guild_id = hikari.Snowflake(1)
     gc.name = "G"
     gc.logger = MagicMock()
+    gc.bot.rest.create_message = AsyncMock(
+        return_value=MagicMock(id=hikari.Snowflake(900))
+    )
 
     role = MagicMock()
     role.id = hikari.Snowflake(5)
@@ -859,14 +989,13 @@ async def test_configure_warns_on_missing_channel_perms(
     errors = await configure_role_menus(gc, config, {"Red": role})
 
     assert any("Manage Messages" in e for e in errors)
-    channel.send.assert_awaited()  # still posted despite the warning
+    gc.bot.rest.create_message.assert_awaited()  # still posted despite the warning
 
 
 async def test_configure_warns_on_unmanageable_role(monkeypatch, role_menus_state_dir):
     channel = MagicMock()
     channel.id = hikari.Snowflake(77)
     channel.name = "role-select"
-    channel.send = AsyncMock(return_value=MagicMock(id=hikari.Snowflake(900)))
     monkeypatch.setattr(
         "dragonpaw_bot.utils.guild_channel_by_name", AsyncMock(return_value=channel)
     )
@@ -887,6 +1016,9 @@ async def test_configure_warns_on_unmanageable_role(monkeypatch, role_menus_stat
     gc.guild_id = hikari.Snowflake(1)
     gc.name = "G"
     gc.logger = MagicMock()
+    gc.bot.rest.create_message = AsyncMock(
+        return_value=MagicMock(id=hikari.Snowflake(900))
+    )
 
     role = MagicMock()
     role.id = hikari.Snowflake(5)
@@ -914,7 +1046,6 @@ async def test_configure_checks_only_referenced_roles(
     channel = MagicMock()
     channel.id = hikari.Snowflake(77)
     channel.name = "role-select"
-    channel.send = AsyncMock(return_value=MagicMock(id=hikari.Snowflake(900)))
     monkeypatch.setattr(
         "dragonpaw_bot.utils.guild_channel_by_name", AsyncMock(return_value=channel)
     )
@@ -935,6 +1066,9 @@ async def test_configure_checks_only_referenced_roles(
     gc.guild_id = hikari.Snowflake(1)
     gc.name = "G"
     gc.logger = MagicMock()
+    gc.bot.rest.create_message = AsyncMock(
+        return_value=MagicMock(id=hikari.Snowflake(900))
+    )
 
     red = MagicMock()
     red.id = hikari.Snowflake(5)
@@ -956,3 +1090,60 @@ async def test_configure_checks_only_referenced_roles(
 
     assert any("Red" in e for e in errors)
     assert not any("Admin" in e for e in errors)
+
+
+async def test_configure_again_unchanged_leaves_channel_alone(
+    monkeypatch, role_menus_state_dir
+):
+    channel = MagicMock()
+    channel.id = hikari.Snowflake(77)
+    channel.name = "role-select"
+    monkeypatch.setattr(
+        "dragonpaw_bot.utils.guild_channel_by_name", AsyncMock(return_value=channel)
+    )
+    monkeypatch.setattr("dragonpaw_bot.utils.guild_emojis", AsyncMock(return_value={}))
+    monkeypatch.setattr(
+        "dragonpaw_bot.plugins.role_menus.commands.check_channel_perms",
+        AsyncMock(return_value=[]),
+    )
+    monkeypatch.setattr(
+        "dragonpaw_bot.plugins.role_menus.commands.check_role_manageable",
+        AsyncMock(return_value=None),
+    )
+    wipe = AsyncMock()
+    monkeypatch.setattr("dragonpaw_bot.context.ChannelContext.delete_my_messages", wipe)
+
+    gc = MagicMock()
+    gc.guild_id = hikari.Snowflake(1)
+    gc.name = "G"
+    gc.logger = MagicMock()
+    gc.bot.rest.create_message = AsyncMock(
+        return_value=MagicMock(id=hikari.Snowflake(900))
+    )
+    gc.bot.rest.edit_message = AsyncMock()
+
+    async def _history(_limit):
+        yield MagicMock(id=hikari.Snowflake(900), author=MagicMock(id=gc.bot.user_id))
+
+    gc.bot.rest.fetch_messages.return_value.limit.side_effect = _history
+
+    role = MagicMock()
+    role.id = hikari.Snowflake(5)
+    role.name = "Red"
+    config = parse_role_config(
+        'channel = "role-select"\n'
+        "[[menu]]\n"
+        'name = "Colors"\n'
+        'description = "Pick"\n'
+        "options = [\n"
+        '  { role = "Red", description = "Red role" },\n'
+        "]\n"
+    )
+
+    await configure_role_menus(gc, config, {"Red": role})
+    await configure_role_menus(gc, config, {"Red": role})
+
+    wipe.assert_awaited_once()  # only the first setup
+    gc.bot.rest.create_message.assert_awaited_once()
+    gc.bot.rest.edit_message.assert_not_awaited()
+    assert role_menus_state.load(1).menus[0].message_id == 900
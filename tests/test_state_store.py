@@ -1,6 +1,7 @@
 import pydantic
 import pytest
 
+from dragonpaw_bot import metrics
 from dragonpaw_bot.state_store import GuildStateBase, GuildStateStore
 
 
@@ -35,6 +36,20 @@ def test_load_uses_cache(store):
     assert store.load(300) is store.load(300)
 
 
+def test_load_counts_cache_hits_and_misses(store):
+    store.save(_DemoState(guild_id=300))
+    store.cache.clear()
+
+    store.load(300)
+    store.load(300)
+    store.load(300)
+
+    assert metrics.state_cache.value(store="demo", result="miss") == 1
+    assert metrics.state_cache.value(store="demo", result="hit") == 2
+    assert metrics.state_load_seconds.count(store="demo") == 1
+    assert metrics.state_save_seconds.count(store="demo") == 1
+
+
 def test_path_is_prefixed_per_store(store):
     assert store.path(5).name == "demo_5.yaml"
 
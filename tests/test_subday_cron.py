@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock
 import hikari
 import pytest
 
+from dragonpaw_bot import dm
 from dragonpaw_bot.plugins.subday import commands, cron, state
 from dragonpaw_bot.plugins.subday.constants import (
     SUBDAY_OWNER_REQUEST_PREFIX,
@@ -22,12 +23,6 @@ def _isolated_state(tmp_path, monkeypatch):
     state.store.cache.clear()
 
 
-@pytest.fixture(autouse=True)
-def _no_sleep(monkeypatch):
-    """The cron paces itself with asyncio.sleep(1) between DMs."""
-    monkeypatch.setattr(cron.asyncio, "sleep", AsyncMock())
-
-
 def _participant(**kwargs) -> SubDayParticipant:
     defaults = {
         "user_id": 12345,
@@ -44,12 +39,11 @@ def _guild() -> MagicMock:
     return guild
 
 
-def _member_with_dm() -> tuple[MagicMock, AsyncMock]:
-    dm = MagicMock()
-    dm.send = AsyncMock()
-    member = MagicMock()
-    member.user.fetch_dm_channel = AsyncMock(return_value=dm)
-    return member, dm.send
+def _bot_with_dm() -> tuple[MagicMock, AsyncMock]:
+    bot = MagicMock()
+    bot.rest.create_dm_channel = AsyncMock(return_value=MagicMock(id=777))
+    bot.rest.create_message = AsyncMock()
+    return bot, bot.rest.create_message
 
 
 # ---------------------------------------------------------------------------- #
@@ -58,13 +52,14 @@ def _member_with_dm() -> tuple[MagicMock, AsyncMock]:
 
 
 async def test_advance_skips_incomplete_week(monkeypatch):
-    member, send = _member_with_dm()
-    monkeypatch.setattr(cron, "guild_member", AsyncMock(return_value=member))
+    bot, send = _bot_with_dm()
+    monkeypatch.setattr(cron, "guild_member", AsyncMock(return_value=MagicMock()))
     participant = _participant(current_week=5, week_completed=False)
 
-    result = await cron._advance_participant(
-        MagicMock(), _guild(), 12345, participant, {}
-    )
+    async with dm.DMBatch(bot, "test") as batch:
+        result = await cron._advance_participant(
+            bot, _guild(), 12345, participant, {}, batch=batch
+        )
 
     assert result is False
     assert participant.current_week == 5
@@ -72,13 +67,14 @@ async def test_advance_skips_incomplete_week(monkeypatch):
 
 
 async def test_advance_skips_graduated_participant(monkeypatch):
-    member, send = _member_with_dm()
-    monkeypatch.setattr(cron, "guild_member", AsyncMock(return_value=member))
+    bot, send = _bot_with_dm()
+    monkeypatch.setattr(cron, "guild_member", AsyncMock(return_value=MagicMock()))
     participant = _participant(current_week=TOTAL_WEEKS, week_completed=True)
 
-    result = await cron._advance_participant(
-        MagicMock(), _guild(), 12345, participant, {}
-    )
+    async with dm.DMBatch(bot, "test") as batch:
+        result = await cron._advance_participant(
+            bot, _guild(), 12345, participant, {}, batch=batch
+        )
 
     assert result is False
     assert participant.current_week == TOTAL_WEEKS
@@ -87,13 +83,14 @@ async def test_advance_skips_graduated_participant(monkeypatch):
 
 
 async def test_advance_completed_participant_dms_next_prompt(monkeypatch):
-    member, send = _member_with_dm()
-    monkeypatch.setattr(cron, "guild_member", AsyncMock(return_value=member))
+    bot, send = _bot_with_dm()
+    monkeypatch.setattr(cron, "guild_member", AsyncMock(return_value=MagicMock()))
     participant = _participant(current_week=5, week_completed=True, reminder_sent=True)
 
-    result = await cron._advance_participant(
-        MagicMock(), _guild(), 12345, participant, {}
-    )
+    async with dm.DMBatch(bot, "test") as batch:
+        result = await cron._advance_participant(
+            bot, _guild(), 12345, participant, {}, batch=batch
+        )
 
     assert result is True
     assert participant.current_week == 6
@@ -106,14 +103,15 @@ async def test_advance_completed_participant_dms_next_prompt(monkeypatch):
 
 
 async def test_advance_queues_owner_prompt_copy(monkeypatch):
-    member, _ = _member_with_dm()
-    monkeypatch.setattr(cron, "guild_member", AsyncMock(return_value=member))
+    bot, _ = _bot_with_dm()
+    monkeypatch.setattr(cron, "guild_member", AsyncMock(return_value=MagicMock()))
     participant = _participant(current_week=5, week_completed=True, owner_id=999)
     owner_prompts: dict[int, list[tuple[int, object]]] = {}
 
-    await cron._advance_participant(
-        MagicMock(), _guild(), 12345, participant, owner_prompts
-    )
+    async with dm.DMBatch(bot, "test") as batch:
+        await cron._advance_participant(
+            bot, _guild(), 12345, participant, owner_prompts, batch=batch
+        )
 
     assert list(owner_prompts) == [999]
     sub_uid, prompt = owner_prompts[999][0]
@@ -122,12 +120,14 @@ async def test_advance_queues_owner_prompt_copy(monkeypatch):
 
 
 async def test_advance_departed_member_returns_remove_sentinel(monkeypatch):
+    bot, _ = _bot_with_dm()
     monkeypatch.setattr(cron, "guild_member", AsyncMock(return_value=None))
     participant = _participant(current_week=5, week_completed=True)
 
-    result = await cron._advance_participant(
-        MagicMock(), _guild(), 12345, participant, {}
-    )
+    async with dm.DMBatch(bot, "test") as batch:
+        result = await cron._advance_participant(
+            bot, _guild(), 12345, participant, {}, batch=batch
+        )
 
     assert result is None
     assert participant.current_week == 5
@@ -135,17 +135,22 @@ async def test_advance_departed_member_returns_remove_sentinel(monkeypatch):
 
 
 async def test_advance_survives_dm_forbidden(monkeypatch):
-    member, send = _member_with_dm()
+    bot, send = _bot_with_dm()
     send.side_effect = hikari.ForbiddenError(url="", headers={}, raw_body=b"")
-    monkeypatch.setattr(cron, "guild_member", AsyncMock(return_value=member))
-    participant = _participant(current_week=5, week_completed=True)
+    monkeypatch.setattr(cron, "guild_member", AsyncMock(return_value=MagicMock()))
+    participant = _participant(current_week=5, week_completed=True, owner_id=999)
+    owner_prompts: dict[int, list[tuple[int, object]]] = {}
 
-    result = await cron._advance_participant(
-        MagicMock(), _guild(), 12345, participant, {}
-    )
+    async with dm.DMBatch(bot, "test") as batch:
+        result = await cron._advance_participant(
+            bot, _guild(), 12345, participant, owner_prompts, batch=batch
+        )
 
     assert result is True
     assert participant.current_week == 6
+    assert batch.report.forbidden == 1
+    # No copy for the owner of a prompt the sub never got.
+    assert owner_prompts == {}
 
 
 # ---------------------------------------------------------------------------- #
@@ -211,11 +216,8 @@ def _owner_interaction(owner_id: int, action: str, sub_id: int) -> MagicMock:
 
     bot = interaction.app
     bot.rest.fetch_member = AsyncMock()
-    dm = MagicMock()
-    dm.send = AsyncMock()
-    sub_user = MagicMock()
-    sub_user.fetch_dm_channel = AsyncMock(return_value=dm)
-    bot.rest.fetch_user = AsyncMock(return_value=sub_user)
+    bot.rest.create_dm_channel = AsyncMock(return_value=MagicMock(id=777))
+    bot.rest.create_message = AsyncMock()
     bot.cache.get_guild = MagicMock(return_value=None)
     bot.state = MagicMock(return_value=None)
     return interaction
@@ -248,12 +250,9 @@ async def test_owner_accept_notifies_the_sub():
 
     await commands.handle_owner_interaction(interaction)
 
-    interaction.app.rest.fetch_user.assert_awaited_once()
-    dm_send = (
-        await interaction.app.rest.fetch_user.return_value.fetch_dm_channel()
-    ).send
+    dm_send = interaction.app.rest.create_message
     dm_send.assert_awaited_once()
-    assert "accepted" in dm_send.await_args.args[0]
+    assert "accepted" in dm_send.await_args.kwargs["content"]
 
 
 async def test_owner_accept_stale_button_rejected():
@@ -277,7 +276,7 @@ async def test_owner_accept_twice_is_idempotent():
     saved = _reload_participant(12345)
     assert saved.owner_id == 999
     assert "already their owner" in _response_content(interaction)
-    interaction.app.rest.fetch_user.assert_not_awaited()
+    interaction.app.rest.create_message.assert_not_awaited()
 
 
 async def test_owner_deny_clears_pending():
@@ -205,9 +205,10 @@ def _signup_fixtures(tmp_path, monkeypatch, achievements_channel):
     user.display_name = "Newbie"
     user.username = "newbie"
     user.mention = "<@42>"
-    user.fetch_dm_channel = AsyncMock()
 
     bot = MagicMock()
+    bot.rest.create_dm_channel = AsyncMock()
+    bot.rest.create_message = AsyncMock()
     guild = MagicMock()
     guild.id = hikari.Snowflake(1)
     guild.name = "G"
@@ -60,6 +60,34 @@ def test_ticket_guild_state_round_trip():
     assert loaded.open_tickets[0].topic == "help me"
 
 
+def test_ticket_indexes_rebuilt_on_load():
+    data = TicketGuildState(
+        guild_id=100,
+        open_tickets=[
+            OpenTicket(user_id=10, channel_id=20, topic="a"),
+            OpenTicket(user_id=11, channel_id=21, topic="b"),
+        ],
+    ).model_dump(mode="json")
+    loaded = TicketGuildState.model_validate(data)
+    assert loaded.ticket_for_user(11).channel_id == 21
+    assert loaded.ticket_in_channel(20).user_id == 10
+    assert loaded.ticket_for_user(12) is None
+
+
+def test_ticket_indexes_follow_open_and_close():
+    st = TicketGuildState(guild_id=100)
+    st.open_ticket(OpenTicket(user_id=10, channel_id=20, topic="a"))
+    assert st.ticket_in_channel(20).user_id == 10
+
+    closed = st.close_ticket(20)
+
+    assert closed.user_id == 10
+    assert st.open_tickets == []
+    assert st.ticket_for_user(10) is None
+    assert st.ticket_in_channel(20) is None
+    assert st.close_ticket(20) is None
+
+
 def test_state_round_trip(tmp_path, monkeypatch):
     monkeypatch.setattr(tickets_state.store, "state_dir", tmp_path)
     tickets_state.store.cache.clear()
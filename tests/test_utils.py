@@ -9,8 +9,14 @@ from dragonpaw_bot.context import (
     check_channel_perms,
     has_any_role_permission,
     has_permission,
+    invalidate_perms,
+)
+from dragonpaw_bot.utils import (
+    DefaultsActionRow,
+    create_background_task,
+    guild_emojis,
+    update_guild_emojis,
 )
-from dragonpaw_bot.utils import DefaultsActionRow, create_background_task
 
 # ---------------------------------------------------------------------------- #
 #                              has_permission                                   #
@@ -190,6 +196,50 @@ async def test_check_channel_perms_all_present():
     assert result == []
 
 
+async def test_check_channel_perms_cached_until_invalidated():
+    bot = _mock_bot(role_perms=hikari.Permissions.SEND_MESSAGES)
+    await check_channel_perms(bot, GUILD_ID, CHANNEL_ID)
+    await check_channel_perms(bot, GUILD_ID, CHANNEL_ID)
+    bot.rest.fetch_channel.assert_awaited_once()
+    assert bot.cache.get_roles_view_for_guild.call_count == 1
+
+    invalidate_perms(GUILD_ID, CHANNEL_ID)
+    await check_channel_perms(bot, GUILD_ID, CHANNEL_ID)
+    assert bot.rest.fetch_channel.await_count == 2
+    assert bot.cache.get_roles_view_for_guild.call_count == 1  # Guild part kept
+
+    invalidate_perms(GUILD_ID)
+    await check_channel_perms(bot, GUILD_ID, CHANNEL_ID)
+    assert bot.cache.get_roles_view_for_guild.call_count == 2
+
+
+async def test_check_channel_perms_uses_cached_channel():
+    bot = _mock_bot()
+    channel = Mock(spec=hikari.GuildTextChannel)
+    channel.permission_overwrites = {
+        GUILD_ID: hikari.PermissionOverwrite(
+            id=GUILD_ID,
+            type=hikari.PermissionOverwriteType.ROLE,
+            allow=hikari.Permissions.SEND_MESSAGES,
+        )
+    }
+    bot.cache.get_guild_channel = Mock(return_value=channel)
+    result = await check_channel_perms(bot, GUILD_ID, CHANNEL_ID)
+    assert "Send Messages" not in result
+    bot.rest.fetch_channel.assert_not_called()
+
+
+async def test_check_channel_perms_failure_not_cached():
+    bot = _mock_bot(
+        fetch_channel_side_effect=hikari.NotFoundError(
+            url="test", headers={}, raw_body=b""
+        ),
+    )
+    await check_channel_perms(bot, GUILD_ID, CHANNEL_ID)
+    await check_channel_perms(bot, GUILD_ID, CHANNEL_ID)
+    assert bot.rest.fetch_channel.await_count == 2
+
+
 # ---------------------------------------------------------------------------- #
 #                            create_background_task                            #
 # ---------------------------------------------------------------------------- #
@@ -256,3 +306,45 @@ def test_defaults_action_row_tolerates_missing_components():
         _Empty(), [{"id": "1", "type": "role"}]
     ).build()
     assert payload == {}
+
+
+# ---------------------------------------------------------------------------- #
+#                                 guild_emojis                                 #
+# ---------------------------------------------------------------------------- #
+
+
+def _custom_emoji(name: str) -> Mock:
+    emoji = Mock(spec=hikari.KnownCustomEmoji)
+    emoji.name = name
+    return emoji
+
+
+def _emoji_gc(emojis: list[Mock]) -> Mock:
+    gc = Mock()
+    gc.guild_id = hikari.Snowflake(1)
+    gc.bot.cache.get_emojis_view_for_guild = Mock(
+        return_value={i: e for i, e in enumerate(emojis)}
+    )
+    return gc
+
+
+async def test_guild_emojis_merges_custom_and_unicode():
+    party = _custom_emoji("partyparrot")
+    emoji_map = await guild_emojis(_emoji_gc([party]))
+
+    assert emoji_map["partyparrot"] is party
+    assert emoji_map["dragon"] == hikari.UnicodeEmoji.parse("🐉")
+    assert "no_such_emoji" not in emoji_map
+
+
+async def test_guild_emojis_reads_cache_once_until_updated():
+    gc = _emoji_gc([_custom_emoji("old")])
+    await guild_emojis(gc)
+    await guild_emojis(gc)
+    gc.bot.cache.get_emojis_view_for_guild.assert_called_once()
+
+    update_guild_emojis(gc.guild_id, [_custom_emoji("new")])
+    emoji_map = await guild_emojis(gc)
+
+    assert "new" in emoji_map
+    assert "old" not in emoji_map
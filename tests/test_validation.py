@@ -10,7 +10,9 @@ import hikari
 import pytest
 
 from dragonpaw_bot.plugins.intros import state as intros_state
+from dragonpaw_bot.plugins.validation import commands as validation_commands
 from dragonpaw_bot.plugins.validation import state as validation_state
+from dragonpaw_bot.plugins.validation import timers
 from dragonpaw_bot.plugins.validation.commands import (
     APPROVE_BUTTON_PREFIX,
     APPROVE_MODAL_PREFIX,
@@ -25,14 +27,24 @@ from dragonpaw_bot.plugins.validation.commands import (
     handle_rules_agreed,
     on_member_join,
     on_message_create,
+    on_startup_reconcile,
 )
-from dragonpaw_bot.plugins.validation.cron import validation_reminder_cron
+from dragonpaw_bot.plugins.validation.cron import fire_timers, validation_reminder_cron
 from dragonpaw_bot.plugins.validation.models import (
     ValidationGuildState,
     ValidationMember,
     ValidationStage,
 )
 
+
+@pytest.fixture(autouse=True)
+def _clear_timers():
+    """The timer wheel is module-level; handlers under test schedule onto it."""
+    timers.wheel.clear()
+    yield
+    timers.wheel.clear()
+
+
 # ---------------------------------------------------------------------------- #
 #                          _sanitize_channel_name                               #
 # ---------------------------------------------------------------------------- #
@@ -169,7 +181,7 @@ def test_validation_guild_state_defaults():
     assert st.lobby_channel_id is None
     assert st.member_role_id is None
     assert st.staff_role_id is None
-    assert st.members == []
+    assert st.members == {}
 
 
 def test_validation_guild_state_round_trip():
@@ -196,10 +208,38 @@ def test_validation_guild_state_round_trip():
     assert loaded.member_role_id == 300
     assert loaded.staff_role_id == 400
     assert len(loaded.members) == 1
-    assert loaded.members[0].user_id == 10
-    assert loaded.members[0].stage == ValidationStage.AWAITING_PHOTOS
-    assert loaded.members[0].channel_id == 500
-    assert loaded.members[0].photo_count == 1
+    assert loaded.members[10].user_id == 10
+    assert loaded.members[10].stage == ValidationStage.AWAITING_PHOTOS
+    assert loaded.members[10].channel_id == 500
+    assert loaded.members[10].photo_count == 1
+
+
+def test_validation_guild_state_reads_legacy_member_list():
+    """Older state files stored members as a list; they load keyed by user_id."""
+    now = datetime.now(UTC).isoformat()
+    st = ValidationGuildState.model_validate(
+        {
+            "guild_id": 100,
+            "members": [
+                {"user_id": 10, "joined_at": now},
+                {"user_id": 11, "joined_at": now},
+            ],
+        }
+    )
+    assert list(st.members) == [10, 11]
+    assert st.members[11].user_id == 11
+
+
+def test_validation_guild_state_tracks_changes():
+    st = ValidationGuildState(guild_id=100)
+    assert not st.dirty
+    st.add_member(ValidationMember(user_id=10, joined_at=datetime.now(UTC)))
+    assert st.dirty
+    st.mark_saved()
+    assert st.remove_member(99) is None
+    assert not st.dirty
+    assert st.remove_member(10) is not None
+    assert st.dirty
 
 
 # ---------------------------------------------------------------------------- #
@@ -230,7 +270,7 @@ async def test_member_join_bot_logged_without_lobby_config(tmp_path, monkeypatch
     await on_member_join(event)
 
     assert logged and "Bot joined" in logged[0]
-    assert validation_state.load(1).members == []
+    assert validation_state.load(1).members == {}
 
 
 # ---------------------------------------------------------------------------- #
@@ -263,8 +303,8 @@ def test_state_round_trip(tmp_path, monkeypatch):
     assert loaded.guild_id == 200
     assert loaded.staff_role_id == 999
     assert len(loaded.members) == 1
-    assert loaded.members[0].stage == ValidationStage.AWAITING_PHOTOS
-    assert loaded.members[0].channel_id == 77
+    assert loaded.members[1].stage == ValidationStage.AWAITING_PHOTOS
+    assert loaded.members[1].channel_id == 77
 
 
 def test_state_load_missing_file(tmp_path, monkeypatch):
@@ -273,7 +313,7 @@ def test_state_load_missing_file(tmp_path, monkeypatch):
 
     loaded = validation_state.load(999)
     assert loaded.guild_id == 999
-    assert loaded.members == []
+    assert loaded.members == {}
 
 
 def test_state_uses_cache(tmp_path, monkeypatch):
@@ -408,15 +448,20 @@ def test_all_guild_ids_finds_state_files(tmp_path, monkeypatch):
 # ---------------------------------------------------------------------------- #
 
 
-def _make_reconcile_bot(*, fetch_member_raises=None, fetch_channel_raises=None):
+def _make_reconcile_bot(
+    *, fetch_member_raises=None, fetch_channel_raises=None, cached=False
+):
     """Minimal bot mock for _reconcile_guild tests.
 
     bot.state() returns None so GuildContext sets log_channel_id=None,
     making gc.log() a silent no-op — no REST create_message calls needed.
+    Members and channels are cache misses unless `cached` is set.
     """
     bot = Mock()
     bot.cache = Mock()
     bot.cache.get_guild = Mock(return_value=None)
+    bot.cache.get_member = Mock(return_value=Mock() if cached else None)
+    bot.cache.get_guild_channel = Mock(return_value=Mock() if cached else None)
     bot.state = Mock(return_value=None)
 
     guild = Mock()
@@ -496,7 +541,7 @@ async def test_reconcile_guild_member_left(tmp_path, monkeypatch):
 
     validation_state.store.cache.clear()
     loaded = validation_state.load(1)
-    assert loaded.members == []
+    assert loaded.members == {}
     assert close_calls == [99]
 
 
@@ -519,7 +564,7 @@ async def test_reconcile_guild_channel_deleted(tmp_path, monkeypatch):
 
     validation_state.store.cache.clear()
     loaded = validation_state.load(1)
-    assert loaded.members == []
+    assert loaded.members == {}
 
 
 async def test_reconcile_guild_no_channel_id_skips_channel_check(tmp_path, monkeypatch):
@@ -545,6 +590,62 @@ async def test_reconcile_guild_no_channel_id_skips_channel_check(tmp_path, monke
     assert len(loaded.members) == 1
 
 
+async def test_reconcile_guild_trusts_cache_hits(tmp_path, monkeypatch):
+    """Cached member and channel need no REST confirmation."""
+    monkeypatch.setattr(validation_state.store, "state_dir", tmp_path)
+    validation_state.store.cache.clear()
+
+    now = datetime.now(UTC)
+    st = ValidationGuildState(
+        guild_id=1,
+        guild_name="Test",
+        members=[ValidationMember(user_id=10, joined_at=now, channel_id=99)],
+    )
+    validation_state.save(st)
+
+    bot = _make_reconcile_bot(cached=True)
+
+    await _reconcile_guild(bot, 1)
+
+    bot.rest.fetch_member.assert_not_called()
+    bot.rest.fetch_channel.assert_not_called()
+    validation_state.store.cache.clear()
+    assert len(validation_state.load(1).members) == 1
+
+
+async def test_startup_reconcile_checks_every_guild(tmp_path, monkeypatch):
+    """Guilds are reconciled together, and the REST calls are counted."""
+    monkeypatch.setattr(validation_state.store, "state_dir", tmp_path)
+    validation_state.store.cache.clear()
+    monkeypatch.setattr(validation_commands, "CHUNK_WAIT_SECONDS", 0.0)
+
+    now = datetime.now(UTC)
+    for guild_id in (1, 2):
+        validation_state.save(
+            ValidationGuildState(
+                guild_id=guild_id,
+                guild_name="Test",
+                members=[ValidationMember(user_id=10, joined_at=now, channel_id=99)],
+            )
+        )
+    validation_state.save(ValidationGuildState(guild_id=3, guild_name="Empty"))
+
+    bot = _make_reconcile_bot(fetch_channel_raises=hikari.NotFoundError("", {}, b""))
+    log = Mock()
+    monkeypatch.setattr(validation_commands, "logger", log)
+
+    await on_startup_reconcile(Mock(app=bot))
+
+    validation_state.store.cache.clear()
+    assert validation_state.load(1).members == {}
+    assert validation_state.load(2).members == {}
+    summary = log.info.call_args_list[-1]
+    assert summary.args == ("Startup validation reconcile complete",)
+    # Per guild: fetch_guild, fetch_member and fetch_channel.
+    assert summary.kwargs["rest_calls"] == 6
+    assert summary.kwargs["removed"] == 2
+
+
 # ---------------------------------------------------------------------------- #
 #                         validation_reminder_cron                              #
 # ---------------------------------------------------------------------------- #
@@ -609,7 +710,7 @@ async def test_cron_reminder_timing(tmp_path, monkeypatch, case):
 
     bot.rest.kick_user.assert_not_called()
     validation_state.store.cache.clear()
-    reminder_count = validation_state.load(1).members[0].reminder_count
+    reminder_count = validation_state.load(1).members[42].reminder_count
 
     if expected_channel is None:
         bot.rest.create_message.assert_not_called()
@@ -620,6 +721,25 @@ async def test_cron_reminder_timing(tmp_path, monkeypatch, case):
         assert reminder_count == 1
 
 
+async def test_cron_quiet_hour_writes_nothing(tmp_path, monkeypatch):
+    """No reminder due and nobody kicked — the guild's state file isn't rewritten."""
+    monkeypatch.setattr(validation_state.store, "state_dir", tmp_path)
+    validation_state.store.cache.clear()
+    st = ValidationGuildState(
+        guild_id=1,
+        guild_name="TestGuild",
+        lobby_channel_id=10,
+        members=[ValidationMember(user_id=42, joined_at=datetime.now(UTC))],
+    )
+    validation_state.save(st)
+    saves = Mock(wraps=validation_state.store.save)
+    monkeypatch.setattr(validation_state.store, "save", saves)
+
+    await validation_reminder_cron(_make_cron_bot())
+
+    saves.assert_not_called()
+
+
 # (stage, channel_id, expect_kick, expected_close_calls)
 @pytest.mark.parametrize(
     "case",
@@ -677,7 +797,7 @@ async def test_cron_deadline(tmp_path, monkeypatch, case):
 
     if expect_kick:
         bot.rest.kick_user.assert_called_once()
-        assert remaining == []
+        assert remaining == {}
     else:
         bot.rest.kick_user.assert_not_called()
         bot.rest.create_message.assert_not_called()
@@ -710,7 +830,7 @@ async def test_cron_deadline_removes_state_before_kick(tmp_path, monkeypatch):
     members_at_kick: list[list[int]] = []
 
     async def _capture(*_args, **_kwargs):
-        members_at_kick.append([m.user_id for m in validation_state.load(1).members])
+        members_at_kick.append(list(validation_state.load(1).members))
 
     bot.rest.kick_user.side_effect = _capture
 
@@ -764,7 +884,7 @@ async def test_cron_deadline_close_failure_does_not_stop_other_members(
 
     assert bot.rest.kick_user.call_count == 2
     validation_state.store.cache.clear()
-    assert validation_state.load(1).members == []
+    assert validation_state.load(1).members == {}
 
 
 async def test_cron_deadline_does_not_block_on_channel_close(tmp_path, monkeypatch):
@@ -810,6 +930,166 @@ async def test_cron_deadline_does_not_block_on_channel_close(tmp_path, monkeypat
     bot.rest.kick_user.assert_called_once()
 
 
+# ---------------------------------------------------------------------------- #
+#                               Deadline timers                                 #
+# ---------------------------------------------------------------------------- #
+
+
+def _pending(user_id: int = 42, hours_ago: float = 0, **kwargs) -> ValidationMember:
+    return ValidationMember(
+        user_id=user_id,
+        joined_at=datetime.now(UTC) - timedelta(hours=hours_ago),
+        **kwargs,
+    )
+
+
+def test_next_deadline_is_next_reminder_then_kick():
+    member = _pending()
+    at, kind = timers.next_deadline(member)
+    assert kind is timers.TimerKind.REMIND
+    assert at == member.joined_at + timedelta(hours=timers.REMINDER_INTERVAL_HOURS)
+
+    member.reminder_count = 6  # 7th reminder would fall after the 4-day window
+    at, kind = timers.next_deadline(member)
+    assert kind is timers.TimerKind.KICK
+    assert at == member.joined_at + timedelta(days=timers.MAX_VALIDATION_DAYS)
+
+
+def test_next_deadline_none_while_awaiting_staff():
+    assert timers.next_deadline(_pending(stage=ValidationStage.AWAITING_STAFF)) is None
+
+
+def test_wheel_skips_cancelled_and_superseded_timers():
+    wheel = timers.TimerWheel()
+    wheel.schedule(1, _pending(user_id=1, hours_ago=20))
+    wheel.schedule(1, _pending(user_id=2, hours_ago=20))
+    wheel.cancel(1, 1)
+    wheel.schedule(1, _pending(user_id=2, hours_ago=20, reminder_count=1))
+
+    assert wheel.pop_due(datetime.now(UTC)) == []
+    assert wheel.next_at() is not None
+
+
+def test_wheel_holds_back_overdue_retry():
+    wheel = timers.TimerWheel()
+    later = datetime.now(UTC) + timedelta(hours=1)
+    wheel.schedule(1, _pending(hours_ago=20), not_before=later)
+    assert wheel.pop_due(datetime.now(UTC)) == []
+    assert wheel.next_at() == later
+
+
+async def test_wheel_runner_fires_due_timers():
+    fired = asyncio.Event()
+    seen: list[timers.Timer] = []
+
+    async def fire(due: list[timers.Timer]) -> None:
+        seen.extend(due)
+        fired.set()
+
+    wheel = timers.TimerWheel()
+    wheel.start(fire)
+    await asyncio.sleep(0)  # runner now asleep on an empty wheel
+    wheel.schedule(1, _pending(hours_ago=20))
+    await asyncio.wait_for(fired.wait(), timeout=1)
+    wheel.stop()
+
+    assert [(t.user_id, t.kind) for t in seen] == [(42, timers.TimerKind.REMIND)]
+    # fire() didn't requeue them, so they're left for the daily sweep.
+    assert not wheel.is_pending(1, 42)
+
+
+async def test_fire_timers_reminds_and_requeues(tmp_path, monkeypatch):
+    monkeypatch.setattr(validation_state.store, "state_dir", tmp_path)
+    validation_state.store.cache.clear()
+    member = _pending(hours_ago=20)
+    st = ValidationGuildState(guild_id=1, lobby_channel_id=10, members=[member])
+    validation_state.save(st)
+    timers.member_changed(1, member)
+    bot = _make_cron_bot()
+    bot.cache.get_guild = Mock(return_value=bot.cache.get_guilds_view()[1])
+
+    await fire_timers(bot, timers.wheel.pop_due(datetime.now(UTC)))
+
+    bot.rest.create_message.assert_called_once()
+    assert validation_state.load(1).members[42].reminder_count == 1
+    assert timers.wheel.next_at() == member.joined_at + timedelta(
+        hours=2 * timers.REMINDER_INTERVAL_HOURS
+    )
+
+
+async def test_fire_timers_retries_failed_reminder_later(tmp_path, monkeypatch):
+    monkeypatch.setattr(validation_state.store, "state_dir", tmp_path)
+    validation_state.store.cache.clear()
+    member = _pending(hours_ago=20)
+    validation_state.save(
+        ValidationGuildState(guild_id=1, lobby_channel_id=10, members=[member])
+    )
+    timers.member_changed(1, member)
+    bot = _make_cron_bot()
+    bot.cache.get_guild = Mock(return_value=bot.cache.get_guilds_view()[1])
+    bot.rest.create_message.side_effect = hikari.InternalServerError("", 500, {}, b"")
+
+    await fire_timers(bot, timers.wheel.pop_due(datetime.now(UTC)))
+
+    assert timers.wheel.pop_due(datetime.now(UTC)) == []
+    assert timers.wheel.next_at() > datetime.now(UTC) + timedelta(minutes=50)
+
+
+async def test_fire_timers_waits_for_uncached_guild(tmp_path, monkeypatch):
+    monkeypatch.setattr(validation_state.store, "state_dir", tmp_path)
+    validation_state.store.cache.clear()
+    member = _pending(hours_ago=20)
+    validation_state.save(
+        ValidationGuildState(guild_id=1, lobby_channel_id=10, members=[member])
+    )
+    timers.member_changed(1, member)
+    bot = _make_cron_bot()
+    bot.cache.get_guild = Mock(return_value=None)  # GUILD_CREATE not in yet
+
+    await fire_timers(bot, timers.wheel.pop_due(datetime.now(UTC)))
+
+    bot.rest.create_message.assert_not_called()
+    assert timers.wheel.is_pending(1, 42)
+    assert timers.wheel.next_at() > datetime.now(UTC)
+
+
+async def test_wheel_runner_retries_timers_after_fire_raises():
+    calls = 0
+    failed = asyncio.Event()
+
+    async def fire(due: list[timers.Timer]) -> None:
+        nonlocal calls
+        calls += 1
+        failed.set()
+        raise RuntimeError("boom")
+
+    wheel = timers.TimerWheel()
+    wheel.schedule(1, _pending(hours_ago=20))
+    wheel.start(fire)
+    await asyncio.wait_for(failed.wait(), timeout=1)
+    await asyncio.sleep(0)
+    wheel.stop()
+
+    assert calls == 1
+    assert wheel.is_pending(1, 42)
+    assert wheel.next_at() > datetime.now(UTC) + timedelta(minutes=50)
+
+
+async def test_daily_sweep_leaves_timed_members_to_the_wheel(tmp_path, monkeypatch):
+    monkeypatch.setattr(validation_state.store, "state_dir", tmp_path)
+    validation_state.store.cache.clear()
+    member = _pending(hours_ago=20)
+    validation_state.save(
+        ValidationGuildState(guild_id=1, lobby_channel_id=10, members=[member])
+    )
+    timers.member_changed(1, member)
+    bot = _make_cron_bot()
+
+    await validation_reminder_cron(bot)
+
+    bot.rest.create_message.assert_not_called()
+
+
 def test_channel_ref_configured():
     assert _channel_ref(555, "#fallback") == "<#555>"
 
@@ -981,9 +1261,8 @@ async def test_rules_agreed_wrong_clicker_rejected(tmp_path, monkeypatch):
 
     members = _saved_members()
     assert len(members) == 1
-    assert members[0].user_id == 42
-    assert members[0].stage == ValidationStage.AWAITING_RULES
-    assert members[0].channel_id is None
+    assert members[42].stage == ValidationStage.AWAITING_RULES
+    assert members[42].channel_id is None
 
 
 async def test_rules_agreed_tagged_member_gets_channel(tmp_path, monkeypatch):
@@ -1025,8 +1304,8 @@ async def test_rules_agreed_tagged_member_gets_channel(tmp_path, monkeypatch):
 
     members = _saved_members()
     assert len(members) == 1
-    assert members[0].stage == ValidationStage.AWAITING_PHOTOS
-    assert members[0].channel_id == 77
+    assert members[42].stage == ValidationStage.AWAITING_PHOTOS
+    assert members[42].channel_id == 77
 
     assert "<#77>" in _response_text(interaction.edit_initial_response.call_args)
 
@@ -1089,7 +1368,7 @@ async def test_rules_agreed_second_click_reuses_channel(tmp_path, monkeypatch):
 
     bot.rest.create_guild_text_channel.assert_not_called()
     assert "<#55>" in _response_text(interaction.edit_initial_response.call_args)
-    assert _saved_members()[0].channel_id == 55
+    assert _saved_members()[42].channel_id == 55
 
 
 # ---------------------------------------------------------------------------- #
@@ -1226,7 +1505,7 @@ async def test_approve_modal_self_approval_rejected(tmp_path, monkeypatch):
     )
     bot.rest.edit_member.assert_not_called()
     bot.rest.add_role_to_member.assert_not_called()
-    assert [m.user_id for m in _saved_members()] == [42]
+    assert list(_saved_members()) == [42]
 
 
 async def test_approve_modal_non_staff_rejected(tmp_path, monkeypatch):
@@ -1246,7 +1525,7 @@ async def test_approve_modal_non_staff_rejected(tmp_path, monkeypatch):
 
     assert "Only staff" in _response_text(interaction.edit_initial_response.call_args)
     bot.rest.edit_member.assert_not_called()
-    assert [m.user_id for m in _saved_members()] == [42]
+    assert list(_saved_members()) == [42]
 
 
 @pytest.mark.parametrize("name", ["   ", "\t\n ", ""])
@@ -1271,7 +1550,7 @@ async def test_approve_modal_blank_name_rejected(tmp_path, monkeypatch, name):
     )
     bot.rest.edit_member.assert_not_called()
     bot.rest.add_role_to_member.assert_not_called()
-    assert [m.user_id for m in _saved_members()] == [42]
+    assert list(_saved_members()) == [42]
 
 
 async def test_approve_modal_happy_path_saves_before_rest_work(tmp_path, monkeypatch):
@@ -1288,7 +1567,7 @@ async def test_approve_modal_happy_path_saves_before_rest_work(tmp_path, monkeyp
     seen_at_rest: list[list[int]] = []
 
     async def _capture_members(*_args, **_kwargs):
-        seen_at_rest.append([m.user_id for m in _saved_members()])
+        seen_at_rest.append(list(_saved_members()))
 
     bot.rest.edit_member.side_effect = _capture_members
     bot.rest.add_role_to_member.side_effect = _capture_members
@@ -1314,7 +1593,7 @@ async def test_approve_modal_happy_path_saves_before_rest_work(tmp_path, monkeyp
     await asyncio.sleep(0)  # let the scheduled channel close run
 
     assert seen_at_rest == [[], []]  # state already empty at both REST calls
-    assert _saved_members() == []
+    assert _saved_members() == {}
 
     bot.rest.edit_member.assert_called_once()
     assert bot.rest.edit_member.call_args.kwargs["nickname"] == "Sparky"
@@ -1346,7 +1625,7 @@ async def test_approve_modal_unknown_channel_does_nothing(tmp_path, monkeypatch)
         interaction.edit_initial_response.call_args
     )
     bot.rest.edit_member.assert_not_called()
-    assert [m.user_id for m in _saved_members()] == [42]
+    assert list(_saved_members()) == [42]
 
 
 # ---------------------------------------------------------------------------- #
@@ -1459,7 +1738,7 @@ async def test_photo_counting_ignores_unrelated_messages(tmp_path, monkeypatch,
     await on_message_create(event)
 
     bot.rest.create_message.assert_not_called()
-    member = _saved_members()[0]
+    member = _saved_members()[42]
     assert member.photo_count == 0
     assert member.stage == stage
 
@@ -1480,7 +1759,7 @@ async def test_photo_counting_single_photo_does_not_advance(tmp_path, monkeypatc
     await on_message_create(event)
 
     bot.rest.create_message.assert_not_called()
-    member = _saved_members()[0]
+    member = _saved_members()[42]
     assert member.photo_count == 1
     assert member.stage == ValidationStage.AWAITING_PHOTOS
 
@@ -1502,7 +1781,7 @@ async def test_photo_counting_two_photos_pings_staff(tmp_path, monkeypatch):
 
     await on_message_create(event)
 
-    member = _saved_members()[0]
+    member = _saved_members()[42]
     assert member.photo_count == 2
     assert member.stage == ValidationStage.AWAITING_STAFF
 
@@ -1529,12 +1808,12 @@ async def test_photo_counting_accumulates_across_messages(tmp_path, monkeypatch)
     bot = _make_handler_bot()
 
     await on_message_create(_make_message_event(bot, channel_id=55, author_id=42))
-    assert _saved_members()[0].photo_count == 1
+    assert _saved_members()[42].photo_count == 1
     bot.rest.create_message.assert_not_called()
 
     await on_message_create(_make_message_event(bot, channel_id=55, author_id=42))
 
-    member = _saved_members()[0]
+    member = _saved_members()[42]
     assert member.photo_count == 2
     assert member.stage == ValidationStage.AWAITING_STAFF
     bot.rest.create_message.assert_called_once()